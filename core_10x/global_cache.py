@@ -1,3 +1,4 @@
+import functools
 import inspect
 
 from core_10x.xnone import XNone
@@ -101,6 +102,31 @@ def _cache_with_args(f, keep_value=True):
     return getter
 
 
+def lru_cache(maxsize=128):
+    """functools.lru_cache keeping at most maxsize results, cleared along with the @cache memos (see _clear_all_caches).
+
+    getter.resize(maxsize) starts it over with a new maxsize, still registered for clearing.
+    """
+
+    def _lru_cache(f):
+        the_cache = [functools.lru_cache(maxsize=maxsize)(f)]
+
+        def getter(*args, **kwargs):
+            return the_cache[0](*args, **kwargs)
+
+        def resize(maxsize):
+            the_cache[0] = functools.lru_cache(maxsize=maxsize)(f)
+
+        getter.__name__ = f.__name__
+        getter.clear = lambda: the_cache[0].cache_clear()
+        getter.cache_info = lambda: the_cache[0].cache_info()
+        getter.resize = resize
+        _CLEARABLES.append(getter)
+        return getter
+
+    return _lru_cache
+
+
 def standard_key(args: tuple, kwargs: dict) -> tuple:
     sorted_kwargs = tuple((k, kwargs[k]) for k in sorted(kwargs))
     return *args, *sorted_kwargs
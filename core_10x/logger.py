@@ -1,8 +1,12 @@
+import itertools
 import multiprocessing as mp
 import os
+import re
 import socket
 import time
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from queue import Empty, Full
 from typing import Any
 
 import psutil
@@ -10,7 +14,8 @@ from py10x_kernel import OsUser
 
 from core_10x.environment_variables import EnvVars
 from core_10x.resource import NULL_RESOURCE
-from core_10x.traitable import RT, T, Traitable
+from core_10x.trait_filter import BETWEEN, GE, LE, LT, f
+from core_10x.traitable import RT, Index, T, Traitable
 from core_10x.ts_store import TsStore
 from core_10x.xdate_time import XDateTime
 
@@ -31,40 +36,72 @@ class LogMessage(Traitable, custom_collection = True, keep_history = False):
     num_threads: int    = T()
     payload: Any        = T()
 
+    s_indices = [Index('ns_idx', 'ns')]     #-- time-range scans (see LogReader)
+
+def next_batch(queue, batch_size: int, flush_interval: float) -> tuple[list[dict], bool]:
+    """
+    Wait for the next message, then take whatever else arrives within flush_interval seconds, up to batch_size.
+    Returns (messages, done) - done once the shutdown sentinel (None) is seen.
+    """
+    data = queue.get()
+    if data is None:
+        return [], True
+
+    batch = [data]
+    deadline = time.monotonic() + flush_interval
+    while len(batch) < batch_size:
+        timeout = deadline - time.monotonic()
+        try:
+            data = queue.get(timeout = timeout) if timeout > 0 else queue.get_nowait()     #-- past the deadline: only what is already queued
+        except Empty:
+            break
+        if data is None:
+            return batch, True
+        batch.append(data)
+
+    return batch, False
+
 def logger_process(
         queue: mp.Queue,
         coll_name: str,
-        do_print: bool
+        do_print: bool,
+        batch_size: int = 1000,
+        flush_interval: float = 0.25
 ):
     uri = EnvVars.log_ts_store_uri
     log_store = TsStore.instance_from_uri(uri) if uri else NULL_RESOURCE
 
-    data = queue.get()
-    if data is None:
-        return
-
-    with log_store:
-        first_msg = LogMessage(_replace = True, _collection_name = coll_name, **data)
-        #start: datetime = first_msg.payload
-        t1 = first_msg.ns
-        first_msg.save()
-
-    while True:
-        data = queue.get()
-        if data is None:
-            break
+    t1 = None
+    done = False
+    while not done:
+        batch, done = next_batch(queue, batch_size, flush_interval)
+        if not batch:
+            continue
 
         with log_store:
-            msg = LogMessage(_replace = True, _collection_name = coll_name, **data)
-            msg.save()
+            msgs = [LogMessage(_replace = True, _collection_name = coll_name, **data) for data in batch]
+            Traitable.save_many(msgs)      #-- one bulk insert per batch
 
         if do_print:
-            t2 = msg.ns
-            dt = t2 - t1
-            t1 = t2
-            print(f'{(dt) / 1.e9}: {msg.payload}')
+            for msg in msgs:
+                t2 = msg.ns
+                if t1 is not None:
+                    print(f'{(t2 - t1) / 1.e9}: {msg.payload}')
+                t1 = t2
 
 class Logger:
+    """
+    Persists log messages from a child process, which writes them in batches of up to s_batch_size
+    messages, or whatever arrived within s_flush_interval seconds.
+    At most s_max_queued messages wait in the queue: when it is full, messages of level s_drop_level
+    and above are dropped (and counted), more important ones block the caller until there is room.
+    """
+
+    s_batch_size        = 1000
+    s_flush_interval    = 0.25      #-- seconds
+    s_max_queued        = 100_000
+    s_drop_level        = 2         #-- DETAILED and VERBOSE
+
     def __init__(
         self,
         app_name: str,
@@ -81,15 +118,32 @@ class Logger:
         full_name = f'{app_name}/{OsUser.me.name()}/{socket.gethostname()}/{XDateTime.datetime_to_str(started_at, False)}/{pid}'
         self.ps = psutil.Process(pid)
 
-        self.queue = mp.Queue()
-        self.proc = mp.Process(target = logger_process, args = (self.queue, full_name, do_print))
+        self.dropped = 0
+        self.queue = mp.Queue(maxsize = self.s_max_queued)
+        self.proc = mp.Process(target = logger_process, args = (self.queue, full_name, do_print, self.s_batch_size, self.s_flush_interval))
         self.proc.daemon = True
         self.proc.start()
 
     def log(self, data: dict):
-        self.queue.put(data)
+        if data is None or data['level'] < self.s_drop_level:
+            self.queue.put(data)     #-- blocks while the queue is full
+            return
+
+        try:
+            self.queue.put_nowait(data)
+        except Full:
+            self.dropped += 1
 
     def shutdown(self):
+        #-- the child process writes whatever is still queued before it exits
+        if self.dropped:
+            self.queue.put({
+                'ns':           time.perf_counter_ns(),
+                'level':        0,
+                'mem_pc':       self.ps.memory_percent(),
+                'num_threads':  self.ps.num_threads(),
+                'payload':      f'{self.dropped} log message(s) dropped: the queue was full'
+            })
         self.queue.put(None)
         self.proc.join()
 
@@ -141,6 +195,90 @@ class LOG:
     VERBOSE.value = 3
 
 class LogReader:
-    # TODO: not yet implemented — will provide query/replay access to persisted LogMessage records
-    ...
+    """
+    Reads back the messages one Logger run persisted - one collection per run, named app/user/host/start/pid.
+    Message times are perf_counter_ns() readings: the run's first message (LOG.begin logs the start datetime)
+    anchors them to wall-clock time for at() and for datetime bounds in messages().
+    """
+
+    def __init__(self, coll_name: str, store: TsStore = None):
+        self.coll_name = coll_name
+        self.store = store or TsStore.instance_from_uri(EnvVars.log_ts_store_uri)
+        self._origin = None
+
+    @classmethod
+    def runs(cls, app_name: str = '', store: TsStore = None) -> list[str]:
+        """Collection names of the persisted runs of app_name (all apps, if not given)"""
+        store = store or TsStore.instance_from_uri(EnvVars.log_ts_store_uri)
+        return sorted(store.collection_names(f'^{re.escape(app_name)}/' if app_name else None))
+
+    def origin(self) -> tuple[int, datetime | None]:
+        """(ns, wall-clock time) of the run's first message; the time is None if it did not log a datetime"""
+        if self._origin is None:
+            first = next(self.messages(_at_most = 1), None)
+            if first is None:
+                raise LookupError(f'{self.coll_name}: no log messages')
+            self._origin = first.ns, self._utc(self._as_datetime(first.payload))
+        return self._origin
+
+    @staticmethod
+    def _as_datetime(payload: Any) -> datetime | None:
+        #-- an Any trait stores a datetime as its ISO string
+        if isinstance(payload, datetime):
+            return payload
+        if isinstance(payload, str):
+            try:
+                return datetime.fromisoformat(payload)
+            except ValueError:
+                pass
+        return None
+
+    @staticmethod
+    def _utc(t: datetime | None) -> datetime | None:
+        return t.replace(tzinfo = timezone.utc) if t is not None and t.tzinfo is None else t
+
+    def at(self, msg: LogMessage) -> datetime:
+        ns0, t0 = self.origin()
+        if t0 is None:
+            raise ValueError(f'{self.coll_name}: the first message carries no start time')
+        return t0 + timedelta(microseconds = (msg.ns - ns0) // 1000)
+
+    def _ns(self, t: datetime | int) -> int:
+        if isinstance(t, int):
+            return t
+        ns0, t0 = self.origin()
+        if t0 is None:
+            raise ValueError(f'{self.coll_name}: the first message carries no start time - use ns bounds')
+        return ns0 + (self._utc(t) - t0) // timedelta(microseconds = 1) * 1000
+
+    def messages(
+        self,
+        start: datetime | int = None,
+        end: datetime | int = None,
+        max_level: int = None,
+        _at_most: int = 0,
+        _prefetch: int = 0
+    ) -> Iterator[LogMessage]:
+        """
+        Messages logged in [start, end) - datetimes or perf_counter_ns values, either side open if None -
+        at max_level or more important, in logging order.
+        The range is one ordered query on the ns index, streamed (see Traitable.iter_many), not a scan of the run.
+        """
+        conds = {}
+        if start is not None and end is not None:
+            conds['ns'] = BETWEEN(self._ns(start), self._ns(end), bounds = (True, False))
+        elif start is not None:
+            conds['ns'] = GE(self._ns(start))
+        elif end is not None:
+            conds['ns'] = LT(self._ns(end))
+        if max_level is not None:
+            conds['level'] = LE(max_level)
+
+        with self.store:
+            cursor = LogMessage.iter_many(f(**conds), _coll_name = self.coll_name, _at_most = _at_most, _order = {'ns': 1}, _prefetch = _prefetch)
+            first = next(cursor, None)     #-- opens the cursor while the store is current
+        if first is None:
+            return iter(())
+
+        return itertools.chain((first,), cursor)
 
@@ -314,6 +314,22 @@ class TestTraitableHistory:
         assert loaded.get_revision() == 2
         assert loaded.is_trait_valid(loaded.trait('saved_at'))
 
+    def test_save_many_writes_history_and_hydrates(self, test_store, clock_freezer):
+        names = [f'bulk-{uuid6.uuid7().hex}' for _ in range(3)]
+        objs = [MutableWithTsTime(name=name, value=i, _replace=True) for i, name in enumerate(names)]
+        Traitable.save_many(objs).throw()
+        assert [obj.get_revision() for obj in objs] == [1, 1, 1]
+        assert all(obj.is_trait_valid(obj.trait('saved_at')) for obj in objs)
+
+        objs[0].value = 10
+        Traitable.save_many(objs).throw()
+        # -- unchanged objects keep their revision unless the flowing clock moved their saved_at stamp, as with save()
+        assert [obj.get_revision() for obj in objs] == ([2, 1, 1] if clock_freezer else [2, 2, 2])
+
+        for obj in objs:
+            history = MutableWithTsTime.history(_traitable_id=obj.id().value)
+            assert [h['_traitable_rev'] for h in history] == list(range(obj.get_revision(), 0, -1))
+
     def test_traitable_class_history_methods(self, test_store, test_collection, clock_freezer):
         """Test Traitable class history methods."""
         # Create a test traitable and save it with history
@@ -12,6 +12,7 @@ from core_10x.concrete_traits import datetime_trait
 from core_10x.package_refactoring import PackageRefactoring
 from core_10x.rc import RC_TRUE
 from core_10x.trait_definition import T
+from core_10x.trait_filter import GE, LE, f
 from core_10x.ts_store import TsDuplicateKeyError
 
 
@@ -308,6 +309,107 @@ class TestTSStore:
         assert loaded['_at'] > at
         assert loaded['_at'] == result['_at']
 
+    def test_save_new_many(self, ts_setup):
+        ts_store, _p, _p1, c, _c1, Person, _Person1 = ts_setup  # noqa: N806
+        collection = ts_store.collection(c, Person.s_dir)
+        docs = [{'_id': f'bulk_{uuid7().hex}', 'name': f'n{i}', 'value': i} for i in range(5)]
+        docs[2] = ts_store.add_ts('_at', T.TS_TIME, docs[2])
+
+        results = collection.save_new_many([dict(doc) for doc in docs])
+        assert [r['_rev'] for r in results] == [1] * len(docs)
+        assert '_at' in results[2] and all('_at' not in r for i, r in enumerate(results) if i != 2)
+        for doc in docs:
+            loaded = collection.load(doc['_id'])
+            assert loaded['name'] == doc['name'] and loaded['_rev'] == 1
+        assert collection.load(docs[2]['_id'])['_at'] == results[2]['_at']
+
+        assert collection.save_new_many([]) == []
+
+        dup = {'_id': f'bulk_{uuid7().hex}', 'name': 'fresh'}
+        with pytest.raises(TsDuplicateKeyError, match=f'Duplicate key error collection.*dup key.*{docs[1]["_id"]}'):
+            collection.save_new_many([dup, {'_id': docs[1]['_id'], 'name': 'clash'}])
+        assert collection.load(docs[1]['_id'])['name'] == 'n1'
+
+        overwritten = collection.save_new_many([{'_id': doc['_id'], 'name': 'over'} for doc in docs[:2]], overwrite=True)
+        assert [r['_rev'] for r in overwritten] == [1, 1]
+        assert [collection.load(doc['_id'])['name'] for doc in docs[:2]] == ['over', 'over']
+
+    def test_save_many(self, ts_setup):
+        ts_store, _p, _p1, c, _c1, Person, _Person1 = ts_setup  # noqa: N806
+        collection = ts_store.collection(c, Person.s_dir)
+        ids = [f'bulk_{uuid7().hex}' for _ in range(3)]
+        collection.save_new_many([{'_id': id_value, 'name': 'v1'} for id_value in ids[:2]])
+
+        results = collection.save_many(
+            [
+                {'_id': ids[0], '_rev': 1, 'name': 'v2'},  # -- changed: rev bump
+                {'_id': ids[1], '_rev': 1, 'name': 'v1'},  # -- unchanged: same rev
+                ts_store.add_ts('_at', T.TS_TIME, {'_id': ids[2], '_rev': 0, 'name': 'new'}),  # -- routed to save_new
+            ]
+        )
+        assert [r['_rev'] for r in results] == [2, 1, 1]
+        assert '_at' in results[2]
+        assert [collection.load(id_value)['name'] for id_value in ids] == ['v2', 'v1', 'new']
+
+    def test_delete_many(self, ts_setup):
+        ts_store, _p, _p1, c, _c1, Person, _Person1 = ts_setup  # noqa: N806
+        collection = ts_store.collection(c, Person.s_dir)
+        ids = [f'bulk_{uuid7().hex}' for _ in range(3)]
+        collection.save_new_many([{'_id': id_value, 'name': 'gone'} for id_value in ids])
+
+        assert collection.delete_many([*ids[:2], f'missing_{uuid7().hex}']) == 2
+        assert [collection.load(id_value) is None for id_value in ids] == [True, True, False]
+        assert collection.delete_many([]) == 0
+
+    def test_find_fields(self, ts_setup):
+        ts_store, p, _p1, c, _c1, Person, _Person1 = ts_setup  # noqa: N806
+        collection = ts_store.collection(c, Person.s_dir)
+        id_value = p.id().value
+        collection.save(collection.load(id_value) | {'note': {'big': 'payload'}, 'tag': 't1'})
+
+        assert list(collection.find(_fields=['weight_lbs', 'tag'])) == [{'_id': id_value, 'weight_lbs': 100, 'tag': 't1'}]
+        assert list(collection.find(_fields=[])) == [{'_id': id_value}]
+        assert list(collection.find(f(weight_lbs=100), _fields=['note'])) == [{'_id': id_value, 'note': {'big': 'payload'}}]
+        assert list(collection.find(f(weight_lbs=101), _fields=['weight_lbs'])) == []
+
+    async def test_aio(self, ts_setup):
+        ts_store, p, _p1, c, _c1, Person, _Person1 = ts_setup  # noqa: N806
+        acoll = ts_store.collection(c, Person.s_dir).aio()
+        id_value = p.id().value
+        assert await acoll.load(id_value) == p.serialize_object()
+        assert [doc async for doc in acoll.find(_fields=['weight_lbs'])] == [{'_id': id_value, 'weight_lbs': 100}]
+        assert await acoll.count() == 1
+        assert await acoll.id_exists(id_value)
+
+        doc_id = f'aio_{uuid7().hex}'
+        assert (await acoll.save_new({'_id': doc_id, 'name': 'v1'}))['_rev'] == 1
+        with pytest.raises(TsDuplicateKeyError):
+            await acoll.save_new({'_id': doc_id, 'name': 'dup'})
+        assert (await acoll.save({'_id': doc_id, '_rev': 1, 'name': 'v2'}))['_rev'] == 2
+        assert (await acoll.save({'_id': doc_id, '_rev': 2, 'name': 'v2'}))['_rev'] == 2
+        assert (await acoll.load(doc_id))['name'] == 'v2'
+        assert await acoll.delete(doc_id)
+        assert await acoll.load(doc_id) is None
+
+        with ts_store:
+            p.set_values(weight_lbs=101)
+            (await p.asave()).throw()
+            assert p._rev == 2
+            assert (await Person.aload(p.id())).weight_lbs == 101
+
+    def test_find_latest(self, ts_setup):
+        ts_store, _p, _p1, c, _c1, Person, _Person1 = ts_setup  # noqa: N806
+        collection = ts_store.collection(c, Person.s_dir)
+        tag = uuid7().hex
+        rows = [('a', 1, 'a1'), ('b', 1, 'b1'), ('a', 3, 'a3'), ('b', 2, 'b2'), ('a', 2, 'a2'), ('c', 5, 'c5')]
+        collection.save_new_many([{'_id': f'{tag}_{name}', 'group': f'{tag}_{g}', 'value': v, 'name': name} for g, v, name in rows])
+
+        query = f(group=GE(tag))
+        latest = collection.find_latest(query, _group_by='group', _latest={'value': -1})
+        assert [d['name'] for d in latest] == ['a3', 'b2', 'c5']
+        assert [d['name'] for d in collection.find_latest(f(query, value=LE(2)), _group_by='group', _latest={'value': -1})] == ['a2', 'b2']
+        assert [d['name'] for d in collection.find_latest(query, _group_by='group', _latest={'value': 1}, _at_most=2)] == ['a1', 'b1']
+
     def test_ts_class_association_ts_uri_resolution(self, ts_instance):
         """Test that TsClassAssociation.ts_uri correctly resolves store URIs for classes and their subclasses."""
         from core_10x.py_class import PyClass
@@ -21,7 +21,7 @@ from typing_extensions import Self, deprecated
 from core_10x import concrete_traits
 from core_10x.concrete_resource import CONCRETE_RESOURCE
 from core_10x.environment_variables import EnvVars
-from core_10x.exec_control import UPWARD_DEPS_OFF
+from core_10x.exec_control import CACHE_ONLY, UPWARD_DEPS_OFF
 from core_10x.global_cache import cache
 from core_10x.nucleus import Nucleus
 from core_10x.package_refactoring import PackageRefactoring
@@ -37,13 +37,13 @@ from core_10x.trait_definition import (
     TraitModification,
     Ui,
 )
-from core_10x.trait_filter import LE, f
+from core_10x.trait_filter import IN, LE, f
 from core_10x.traitable_id import ID
-from core_10x.ts_store import TS_FIELDS_TAG, TS_STORE, TsStore
+from core_10x.ts_store import TS_FIELDS_TAG, TS_STORE, TsStore, read_ahead
 from core_10x.xnone import XNone, XNoneType
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable, Iterator, Sequence
 
     from core_10x.ts_store import TsCollection
 
@@ -526,6 +526,77 @@ class Traitable(BTraitable, Nucleus, metaclass=TraitableMetaclass):
 
         return obj
 
+    @classmethod
+    def existing_instances(cls, id_trait_values: Iterable[dict], _collection_name: str = None, _throw: bool = True) -> list[Self | None]:
+        """Batch :meth:`existing_instance`: one entry per dict in ``id_trait_values``, in order.
+
+        Dicts holding exactly the ID traits of an endogenous class are looked up in memory by the id they imply; only other
+        dicts are matched against every instance of the class in memory. The rest are resolved with one store query per set
+        of trait names (``EQ`` on traits common to all dicts, ``IN`` on the others) instead of one round trip each.
+        """
+        id_trait_values = list(id_trait_values)
+        if not cls.is_storable() and cls.is_id_endogenous():  # runtime endogenous instances are created on the fly
+            return [cls(_collection_name=_collection_name, **trait_values) for trait_values in id_trait_values]
+
+        res: list[Self | None] = [None] * len(id_trait_values)
+        by_id = set()
+        if cls.is_id_endogenous():
+            id_names = {trait.name for trait in cls.traits(flags_on=T.ID)}
+            by_id = {i for i, trait_values in enumerate(id_trait_values) if trait_values.keys() == id_names}
+            with CACHE_ONLY():  # -- the ids follow from the values: instances in memory are looked up by id, the store is not asked
+                for i in by_id:
+                    if (obj := cls(_collection_name=_collection_name, _skip_init=True)).accept_existing(id_trait_values[i]):
+                        res[i] = obj
+
+        missing = [i for i, obj in enumerate(res) if obj is None]
+        by_id_missing = [i for i in missing if i in by_id]
+        by_values = [i for i in missing if i not in by_id]
+        for indices, scan_memory in ((by_id_missing, False), (by_values, True)):
+            if indices:
+                found = cls._existing_by_values([id_trait_values[i] for i in indices], _collection_name, scan_memory)
+                for i, obj in zip(indices, found, strict=True):
+                    res[i] = obj
+
+        if _throw and (absent := [trait_values for trait_values, obj in zip(id_trait_values, res, strict=True) if obj is None]):
+            raise ValueError(f'Instances do not exist: {cls}{absent}')
+        return res
+
+    @classmethod
+    def _values_key(cls, values: dict) -> tuple:
+        return tuple(sorted((name, repr(cls.trait(name, throw=True).serialize_value(value, replace_xnone=True))) for name, value in values.items()))
+
+    @classmethod
+    def _existing_by_values(cls, id_trait_values: list[dict], _collection_name: str, scan_memory: bool) -> list[Self | None]:
+        """Instances matching ``id_trait_values`` - among those in memory if ``scan_memory``, then in the store."""
+        key = cls._values_key
+
+        def match(objs, names_sets, found: dict):
+            for obj in objs:
+                for names in names_sets:
+                    if (k := key({name: obj.get_value(name) for name in names})) in sought:
+                        found[k] = obj
+
+        sought = {key(trait_values): trait_values for trait_values in id_trait_values}
+        found = {}
+        names_sets = {tuple(sorted(trait_values)) for trait_values in sought.values()}
+        if scan_memory:
+            ids_in_memory = BTraitableProcessor.current().cache().object_ids_by_class(cls.s_bclass)
+            match((cls(_id=id) for id in ids_in_memory if id.collection_name == _collection_name), names_sets, found)
+
+        missing_by_names = defaultdict(list)
+        for k, trait_values in sought.items():
+            if k not in found:
+                missing_by_names[tuple(sorted(trait_values))].append(trait_values)
+
+        for names, missing in missing_by_names.items():  # -- usually a single query: callers pass uniform dicts
+            query = {}
+            for name in names:
+                values = list({repr(cls.trait(name).serialize_value(tv[name], replace_xnone=True)): tv[name] for tv in missing}.values())
+                query[name] = values[0] if len(values) == 1 else IN(values)
+            match(cls.load_many(f(**query), _coll_name=_collection_name), (names,), found)
+
+        return [found.get(key(trait_values)) for trait_values in id_trait_values]
+
     @classmethod
     def existing_instance_by_id(cls, _id: ID = None, _id_value: str = None, _collection_name: str = None, _throw: bool = True) -> Self | None:
         if _id is None:
@@ -762,8 +833,35 @@ class Traitable(BTraitable, Nucleus, metaclass=TraitableMetaclass):
         return cls.s_storage_helper.load(id, reload=reload)
 
     @classmethod
-    def load_many(cls, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize=True, reload: bool = True) -> list[Self]:
-        return cls.s_storage_helper.load_many(query, _coll_name, _at_most, _order, _deserialize, reload=reload)
+    async def aload(cls, id: ID, reload: bool = True) -> Traitable | None:
+        """Awaitable :meth:`load`: the store read goes through :meth:`TsCollection.aio`, deserialization stays on the caller's thread."""
+        return await cls.s_storage_helper.aload(id, reload=reload)
+
+    @classmethod
+    def load_many(
+        cls, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize=True, reload: bool = True, _fields: Sequence[str] = None
+    ) -> list[Self]:
+        """``_fields`` (with ``_deserialize=False`` only) reads just those fields, plus the id, of each document."""
+        return cls.s_storage_helper.load_many(query, _coll_name, _at_most, _order, _deserialize, reload=reload, _fields=_fields)
+
+    @classmethod
+    def iter_many(
+        cls,
+        query: f = None,
+        _coll_name: str = None,
+        _at_most: int = 0,
+        _order: dict = None,
+        _deserialize=True,
+        reload: bool = True,
+        _prefetch: int = 0,
+        _fields: Sequence[str] = None,
+    ) -> Iterator[Self]:
+        """Lazy :meth:`load_many`: yields each object as the cursor advances.
+
+        ``_prefetch > 0`` reads up to that many documents ahead on a background thread while the caller works
+        (ignored inside a transaction, which belongs to the caller's thread).
+        """
+        return cls.s_storage_helper.iter_many(query, _coll_name, _at_most, _order, _deserialize, reload=reload, _prefetch=_prefetch, _fields=_fields)
 
     @classmethod
     def load_ids(cls, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None) -> list[ID]:
@@ -776,6 +874,22 @@ class Traitable(BTraitable, Nucleus, metaclass=TraitableMetaclass):
     def save(self, save_references: bool | BFlags | int = BSaveRefs.NEW_ONLY) -> RC:
         return self.__class__.s_storage_helper.save(self, save_references=int(save_references))
 
+    async def asave(self, save_references: bool | BFlags | int = BSaveRefs.NEW_ONLY) -> RC:
+        """Awaitable :meth:`save`: the store write goes through :meth:`TsCollection.aio`, serialization stays on the caller's thread."""
+        return await self.__class__.s_storage_helper.asave(self, save_references=int(save_references))
+
+    @staticmethod
+    def save_many(traitables: Iterable[Traitable], save_references: bool | BFlags | int = BSaveRefs.NEW_ONLY) -> RC:
+        """Save ``traitables`` with one bulk write per class and collection instead of one round trip each."""
+        by_class: dict[type[Traitable], list[Traitable]] = defaultdict(list)
+        for traitable in traitables:
+            by_class[traitable.__class__].append(traitable)
+
+        rc = RC(True)
+        for cls, objs in by_class.items():
+            rc <<= cls.s_storage_helper.save_many(objs, save_references=int(save_references))
+        return rc
+
     def serialize_object(self, save_references: int = BSaveRefs.NONE):
         return super().serialize_object(int(save_references))
 
@@ -883,7 +997,22 @@ class AbstractStorableHelper(ABC):
     def load(self, id: ID, reload: bool = True) -> Traitable | None: ...
 
     @abstractmethod
-    def load_many(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize=True, reload: bool = True) -> list[Traitable]: ...
+    def load_many(
+        self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize=True, reload: bool = True, _fields: Sequence[str] = None
+    ) -> list[Traitable]: ...
+
+    @abstractmethod
+    def iter_many(
+        self,
+        query: f = None,
+        _coll_name: str = None,
+        _at_most: int = 0,
+        _order: dict = None,
+        _deserialize=True,
+        reload: bool = True,
+        _prefetch: int = 0,
+        _fields: Sequence[str] = None,
+    ) -> Iterator[Traitable]: ...
 
     @abstractmethod
     def load_ids(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None) -> list[ID]: ...
@@ -894,9 +1023,22 @@ class AbstractStorableHelper(ABC):
     @abstractmethod
     def save(self, traitable: Traitable, save_references: int) -> RC: ...
 
+    # -- helpers without an async store path run the synchronous one in place
+    async def aload(self, id: ID, reload: bool = True) -> Traitable | None:
+        return self.load(id, reload=reload)
+
+    async def asave(self, traitable: Traitable, save_references: int) -> RC:
+        return self.save(traitable, save_references)
+
+    @abstractmethod
+    def save_many(self, traitables: Iterable[Traitable], save_references: int) -> RC: ...
+
     @abstractmethod
     def _save_serialized(self, coll, serialized_data, old_rev): ...
 
+    @abstractmethod
+    def _save_serialized_many(self, coll, serialized_data: list[dict], old_revs: list[int]) -> list[dict]: ...
+
     @abstractmethod
     def delete(self, traitable: Traitable) -> RC: ...
 
@@ -929,9 +1071,24 @@ class NotStorableHelper(AbstractStorableHelper):
     def load(self, id: ID, reload: bool = True) -> Traitable | None:
         return None
 
-    def load_many(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize=True, reload: bool = True) -> list[Traitable]:
+    def load_many(
+        self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize=True, reload: bool = True, _fields: Sequence[str] = None
+    ) -> list[Traitable]:
         return []
 
+    def iter_many(
+        self,
+        query: f = None,
+        _coll_name: str = None,
+        _at_most: int = 0,
+        _order: dict = None,
+        _deserialize=True,
+        reload: bool = True,
+        _prefetch: int = 0,
+        _fields: Sequence[str] = None,
+    ) -> Iterator[Traitable]:
+        return iter(())
+
     def load_ids(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None) -> list[ID]:
         return []
 
@@ -941,9 +1098,15 @@ class NotStorableHelper(AbstractStorableHelper):
     def save(self, traitable: Traitable, save_references: int) -> RC:
         return RC(False, f'{self.traitable_class} is not storable')
 
+    def save_many(self, traitables: Iterable[Traitable], save_references: int) -> RC:
+        return RC(False, f'{self.traitable_class} is not storable')
+
     def _save_serialized(self, coll, serialized_data, old_rev):
         return {_REV: old_rev}
 
+    def _save_serialized_many(self, coll, serialized_data: list[dict], old_revs: list[int]) -> list[dict]:
+        return [{_REV: old_rev} for old_rev in old_revs]
+
     def delete(self, traitable: Traitable) -> RC:
         return RC(False, f'{self.traitable_class} is not storable')
 
@@ -984,30 +1147,63 @@ class StorableHelper(AbstractStorableHelper):
     def load(self, id: ID, reload: bool = True) -> Traitable | None:
         return self.traitable_class.s_bclass.load(id, reload)
 
-    def _find(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None):
+    def _class_query(self, query: f = None) -> f | None:
         cls = self.traitable_class
         if issubclass(cls, Bundle) and not cls.is_bundle_base():
             query = f(query, **{cls.CLASS_TAG(): cls.serialize_class_id()})
-        return self._find_(query, _coll_name, _at_most, _order)
+        return query
 
-    def _find_(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None):
+    def _find(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None):
+        return self._find_(self._class_query(query), _coll_name, _at_most, _order, _fields)
+
+    def _find_latest(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _group_by: str = None, _latest: dict = None):
+        """Raw documents, one per ``_group_by`` value - see :meth:`TsCollection.find_latest`."""
+        cls = self.traitable_class
+        coll = cls.collection(_coll_name=_coll_name)
+        return coll.find_latest(f(self._class_query(query), cls.s_dir), _group_by=_group_by, _latest=_latest, _at_most=_at_most)
+
+    def _find_(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None):
         # TODO FUTURE - current state as history query?
         cls = self.traitable_class
         coll = cls.collection(_coll_name=_coll_name)
-        return coll.find(f(query, cls.s_dir), _at_most=_at_most, _order=_order)
+        return coll.find(f(query, cls.s_dir), _at_most=_at_most, _order=_order, _fields=_fields)
+
+    def load_many(
+        self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize: bool = True, reload: bool = True, _fields: Sequence[str] = None
+    ) -> list[Traitable] | list[dict]:
+        return list(self.iter_many(query, _coll_name, _at_most, _order, _deserialize, reload=reload, _fields=_fields))
 
-    def load_many(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _deserialize: bool = True, reload: bool = True) -> list[Traitable] | list[dict]:
-        cursor = self._find(query=query, _coll_name=_coll_name, _at_most=_at_most, _order=_order)
+    def iter_many(
+        self,
+        query: f = None,
+        _coll_name: str = None,
+        _at_most: int = 0,
+        _order: dict = None,
+        _deserialize=True,
+        reload: bool = True,
+        _prefetch: int = 0,
+        _fields: Sequence[str] = None,
+    ) -> Iterator[Traitable] | Iterator[dict]:
+        if _fields is not None and _deserialize:
+            raise ValueError(f'{self.traitable_class}: _fields requires _deserialize=False (a partial document is not a traitable)')
+
+        # -- documents are fetched (and read ahead) off-thread; deserialization stays in the caller's thread.
+        # -- A transaction belongs to its thread (and connection/session), so there is no read-ahead inside one.
+        if _prefetch > 0 and self.traitable_class.store().current_transaction() is not None:
+            _prefetch = 0
+        cursor = read_ahead(self._find(query=query, _coll_name=_coll_name, _at_most=_at_most, _order=_order, _fields=_fields), _prefetch)
 
         if not _deserialize:
-            return list(cursor)
+            yield from cursor
+            return
 
         f_deserialize = functools.partial(Traitable.deserialize_object, self.traitable_class.s_bclass, _coll_name, reload=reload)
-        return [f_deserialize(serialized_data) for serialized_data in cursor]
+        for serialized_data in cursor:
+            yield f_deserialize(serialized_data)
 
     def load_ids(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None) -> list[ID]:
         id_tag = self.traitable_class.collection(_coll_name=_coll_name).s_id_tag  # better?
-        cursor = self._find(query=query, _coll_name=_coll_name, _at_most=_at_most, _order=_order)
+        cursor = self._find(query=query, _coll_name=_coll_name, _at_most=_at_most, _order=_order, _fields=[id_tag])
         return [ID(serialized_data.get(id_tag), _coll_name) for serialized_data in cursor]
 
     def delete_collection(self, _coll_name: str = None, drop_history = False) -> bool:
@@ -1018,41 +1214,108 @@ class StorableHelper(AbstractStorableHelper):
         cname = _coll_name or PackageRefactoring.find_class_id(cls)
         return store.delete_collection(collection_name=cname)
 
-    def save(self, traitable: Traitable, save_references: int) -> RC:
+    def _serialize_for_save(self, traitable: Traitable, save_references: int) -> tuple[RC, dict | None]:
+        """Verify, share and serialize ``traitable``; ``None`` data means nothing to write (lazy instance)."""
         rc = traitable.verify()
         if not rc:
-            return rc
+            return rc, None
 
         rc = traitable.share(False)  # -- not accepting existing traitable values, if any
         if not rc:
-            return rc
+            return rc, None
 
         try:
             serialized_data = traitable.serialize_object(save_references)
-
             if not serialized_data:  # -- it's a lazy instance - no reason to load and re-save
-                return RC_TRUE
+                return RC_TRUE, None
 
+            return RC_TRUE, traitable.post_serialize(serialized_data)
+        except Exception as e:
+            return RC(False, f'Error saving traitable: {e}'), None
+
+    @staticmethod
+    def _apply_save_result(traitable: Traitable, save_result: dict) -> RC:
+        traitable.set_revision(save_result[_REV])
+        rc = RC(True)
+        for trait in traitable.traits(flags_on=T.TS):
+            if trait.name not in save_result:
+                continue
+            rc <<= traitable.set_trait_value(trait, trait.f_deserialize(trait, save_result[trait.name]))
+        return rc
+
+    def save(self, traitable: Traitable, save_references: int) -> RC:
+        rc, serialized_data = self._serialize_for_save(traitable, save_references)
+        if serialized_data is None:
+            return rc
+
+        try:
             coll = self.traitable_class.collection(traitable.id().collection_name, _ensure_indices=True)
             if not coll:
                 return RC(False, f'{self.__class__} - no store available')
 
             with self._transaction_ctx():
-                save_result = self._save_serialized(
-                    coll,
-                    traitable.post_serialize(serialized_data),
-                    traitable.get_revision(),
-                )
+                save_result = self._save_serialized(coll, serialized_data, traitable.get_revision())
         except Exception as e:
             return RC(False, f'Error saving traitable: {e}')
 
-        rev_tag = _REV
-        traitable.set_revision(save_result[rev_tag])
+        return self._apply_save_result(traitable, save_result)
+
+    async def aload(self, id: ID, reload: bool = True) -> Traitable | None:
+        cls = self.traitable_class
+        data = await cls.collection(_coll_name=id.collection_name).aio().load(id.value)
+        if data is None:
+            return None
+        return Traitable.deserialize_object(cls.s_bclass, id.collection_name, data, reload=reload)
+
+    async def asave(self, traitable: Traitable, save_references: int) -> RC:
+        rc, serialized_data = self._serialize_for_save(traitable, save_references)
+        if serialized_data is None:
+            return rc
+
+        try:
+            coll = self.traitable_class.collection(traitable.id().collection_name, _ensure_indices=True)
+            if not coll:
+                return RC(False, f'{self.__class__} - no store available')
+
+            save_result = await self._asave_serialized(coll.aio(), serialized_data, traitable.get_revision())
+        except Exception as e:
+            return RC(False, f'Error saving traitable: {e}')
+
+        return self._apply_save_result(traitable, save_result)
+
+    def save_many(self, traitables: Iterable[Traitable], save_references: int) -> RC:
+        """Verify and serialize all ``traitables``, then write each collection's batch with one bulk call.
+
+        Traitables failing verification are reported in the returned RC and skipped; the rest are saved.
+        """
         rc = RC(True)
-        for trait in traitable.traits(flags_on=T.TS):
-            if trait.name not in save_result:
+        by_collection: dict[str | None, list[tuple[Traitable, dict]]] = defaultdict(list)
+        for traitable in traitables:
+            rc_t, serialized_data = self._serialize_for_save(traitable, save_references)
+            rc <<= rc_t
+            if serialized_data is not None:
+                by_collection[traitable.id().collection_name].append((traitable, serialized_data))
+
+        for coll_name, batch in by_collection.items():
+            try:
+                coll = self.traitable_class.collection(coll_name, _ensure_indices=True)
+                if not coll:
+                    rc <<= RC(False, f'{self.__class__} - no store available')
+                    continue
+
+                with self._transaction_ctx():
+                    save_results = self._save_serialized_many(
+                        coll,
+                        [serialized_data for _, serialized_data in batch],
+                        [traitable.get_revision() for traitable, _ in batch],
+                    )
+            except Exception as e:
+                rc <<= RC(False, f'Error saving traitables: {e}')
                 continue
-            rc <<= traitable.set_trait_value(trait, trait.f_deserialize(trait, save_result[trait.name]))
+
+            for (traitable, _), save_result in zip(batch, save_results, strict=True):
+                rc <<= self._apply_save_result(traitable, save_result)
+
         return rc
 
     def _transaction_ctx(self):
@@ -1063,6 +1326,16 @@ class StorableHelper(AbstractStorableHelper):
             return coll.save_new(serialized_data)
         return coll.save(serialized_data)
 
+    def _save_serialized_many(self, coll, serialized_data: list[dict], old_revs: list[int]) -> list[dict]:
+        if self.traitable_class.s_immutable:
+            return coll.save_new_many(serialized_data)
+        return coll.save_many(serialized_data)
+
+    async def _asave_serialized(self, acoll, serialized_data, old_rev) -> dict:
+        if self.traitable_class.s_immutable:
+            return await acoll.save_new(serialized_data)
+        return await acoll.save(serialized_data)
+
     def delete(self, traitable: Traitable) -> RC:
         rc = self.delete_in_store(traitable.id())
         if rc:
@@ -1090,17 +1363,42 @@ class StorableHelperWithHistory(StorableHelper):
         if self.traitable_class.s_custom_collection and _collection_name:
             return self.traitable_class.s_history_class.history_collection_name(_collection_name)
 
+    def _history_entry(self, coll, serialized_data: dict, save_result: dict) -> TraitableHistory:
+        return self.traitable_class.s_history_class(
+            serialized_traitable={k: v for k, v in (serialized_data | save_result).items() if k not in (_REV, TS_FIELDS_TAG)},
+            _traitable_rev=save_result[_REV],
+            _collection_name=self._history_collection_name(coll.collection_name()) if self.traitable_class.s_custom_collection else XNone,
+        )
+
     def _save_serialized(self, coll, serialized_data, old_rev) -> dict:
         save_result = super()._save_serialized(coll, serialized_data, old_rev)
-        rev = save_result[_REV]
-        if rev > old_rev:
-            self.traitable_class.s_history_class(
-                serialized_traitable={k: v for k, v in (serialized_data | save_result).items() if k not in (_REV, TS_FIELDS_TAG)},
-                _traitable_rev=rev,
-                _collection_name=self._history_collection_name(coll.collection_name()) if self.traitable_class.s_custom_collection else XNone,
-            ).save(save_references=BSaveRefs.NONE).throw()
+        if save_result[_REV] > old_rev:
+            self._history_entry(coll, serialized_data, save_result).save(save_references=BSaveRefs.NONE).throw()
         return save_result
 
+    async def asave(self, traitable: Traitable, save_references: int) -> RC:
+        if EnvVars.use_ts_store_transactions:
+            return self.save(traitable, save_references)  # -- a store transaction belongs to its thread: no async path through it
+        return await super().asave(traitable, save_references)
+
+    async def _asave_serialized(self, acoll, serialized_data, old_rev) -> dict:
+        save_result = await super()._asave_serialized(acoll, serialized_data, old_rev)
+        if save_result[_REV] > old_rev:
+            (await self._history_entry(acoll, serialized_data, save_result).asave(save_references=BSaveRefs.NONE)).throw()
+        return save_result
+
+    def _save_serialized_many(self, coll, serialized_data: list[dict], old_revs: list[int]) -> list[dict]:
+        save_results = super()._save_serialized_many(coll, serialized_data, old_revs)
+        Traitable.save_many(
+            (
+                self._history_entry(coll, data, save_result)
+                for data, save_result, old_rev in zip(serialized_data, save_results, old_revs, strict=True)
+                if save_result[_REV] > old_rev
+            ),
+            save_references=BSaveRefs.NONE,
+        ).throw()
+        return save_results
+
     def as_of(self, traitable_id: ID, as_of_time: datetime) -> Self | None:
         history_entry = self.traitable_class.latest_revision(traitable_id, as_of_time, deserialize=True)
         return history_entry.traitable if history_entry else None
@@ -1110,9 +1408,7 @@ class StorableHelperWithHistory(StorableHelper):
             return self.traitable_class.s_history_class.s_storage_helper.delete_collection(self._history_collection_name(_coll_name))
         return rc
 
-    def history(
-        self, _at_most: int = 0, _filter: f = None, _deserialize=False, _collection_name: str = None, _before: datetime = None, **named_filters
-    ) -> list:
+    def _check_collection_name(self, _collection_name: str | None) -> None:
         cls = self.traitable_class
 
         if cls.s_custom_collection and not _collection_name:
@@ -1121,6 +1417,12 @@ class StorableHelperWithHistory(StorableHelper):
         if not cls.s_custom_collection and _collection_name:
             raise RuntimeError(f'{cls} does not support custom _collection_name')
 
+    def history(
+        self, _at_most: int = 0, _filter: f = None, _deserialize=False, _collection_name: str = None, _before: datetime = None, **named_filters
+    ) -> list:
+        cls = self.traitable_class
+        self._check_collection_name(_collection_name)
+
         as_of = {'_at': LE(_before)} if _before else {}
         cursor = cls.s_history_class.load_many(
             f(_filter, **named_filters, **as_of),
@@ -1164,27 +1466,43 @@ class StorableHelperWithHistory(StorableHelper):
 class StorableHelperAsOf(StorableHelperWithHistory):
     as_of_time: datetime
 
-    def _find(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None):
-        last_id = None
-        for item in self.traitable_class.history(
-            _filter=query,
-            _before=self.as_of_time,
-            _collection_name=_coll_name,
-            _deserialize=True,
-        ):
-            # TODO: optimize by returning one entry per id using a pipeline query
-            if last_id != item._traitable_id:
-                last_id = item._traitable_id
-                yield item.serialized_traitable
+    def _find(self, query: f = None, _coll_name: str = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None):
+        # -- the store picks the latest revision per id; only those survivors are deserialized
+        # -- (in full: the traitable is rebuilt from the whole history entry, so _fields is applied after that)
+        self._check_collection_name(_coll_name)
+
+        history_class = self.traitable_class.s_history_class
+        history_coll_name = self._history_collection_name(_coll_name)
+        cursor = history_class.s_storage_helper._find_latest(
+            f(query, _at=LE(self.as_of_time)),
+            _coll_name=history_coll_name,
+            _at_most=_at_most,
+            _group_by='_traitable_id',
+            _latest={'_at': -1, '_traitable_rev': -1},
+        )
+        f_deserialize = functools.partial(Traitable.deserialize_object, history_class.s_bclass, history_coll_name, reload=True)
+        keep = None if _fields is None else {Nucleus.ID_TAG(), *_fields}
+        for serialized_data in cursor:
+            serialized_traitable = f_deserialize(serialized_data).serialized_traitable
+            yield serialized_traitable if keep is None else {k: v for k, v in serialized_traitable.items() if k in keep}
 
     def exists_in_store(self, id: ID) -> bool:
-        history_entry = self.traitable_class.latest_revision(id, self.as_of_time, deserialize=True)
-        return bool(history_entry)  # TODO: optimize by not downloading the latest revision
+        self._check_collection_name(id.collection_name)
+        cursor = self.traitable_class.s_history_class.s_storage_helper._find(
+            f(_traitable_id=id.value, _at=LE(self.as_of_time)),
+            _coll_name=self._history_collection_name(id.collection_name),
+            _at_most=1,
+            _fields=(),
+        )
+        return next(iter(cursor), None) is not None
 
     def load_data(self, id: ID) -> dict | None:
         history_entry = self.traitable_class.latest_revision(id, self.as_of_time, deserialize=True)
         return history_entry.serialized_traitable if history_entry else None
 
+    async def aload(self, id: ID, reload: bool = True) -> Traitable | None:
+        return self.load(id, reload=reload)  # -- reads history, not the current collection
+
 
 def __getattr__(name):
     if name == 'THIS_CLASS':  # -- to use for traits with the same Traitable class type
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import itertools
+import queue
+import threading
 from collections import deque
 from contextlib import ExitStack, contextmanager
 from typing import TYPE_CHECKING
@@ -20,7 +24,7 @@ from core_10x.trait_filter import f
 from core_10x.ts_store_type import TS_STORE_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
     from datetime import datetime
 
     from core_10x.traitable import Traitable
@@ -30,6 +34,58 @@ _REV = Nucleus.REVISION_TAG()
 TS_FIELDS_TAG = '_ts_fields'
 
 
+def read_ahead(items: Iterable, depth: int) -> Iterator:
+    """Iterate ``items`` on a background thread, keeping up to ``depth`` of them ready ahead of the consumer.
+
+    ``depth <= 0`` iterates in the caller's thread. The first item is always pulled in the caller's thread,
+    so a lazy query is issued (and its cursor opened) there; only the fetches that follow run on the reader.
+    Exceptions from ``items`` are re-raised to the consumer; closing the returned generator early stops the reader.
+    """
+    if depth <= 0:
+        yield from items
+        return
+
+    items = iter(items)
+    for first in items:
+        yield first
+        break
+    else:
+        return
+
+    buf = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buf.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader():
+        try:
+            for item in items:
+                if not put((True, item)):
+                    return
+            put((False, None))
+        except BaseException as exc:  # noqa: BLE001 -- handed over to the consumer thread
+            put((False, exc))
+
+    threading.Thread(target=reader, daemon=True).start()
+    try:
+        while True:
+            ok, item = buf.get()
+            if not ok:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 class TsDuplicateKeyError(Exception):
     """Raised when attempting to insert a document with a duplicate key."""
 
@@ -49,7 +105,9 @@ class TsCollection(abc.ABC):
     @abc.abstractmethod
     def id_exists(self, id_value: str) -> bool: ...
     @abc.abstractmethod
-    def find(self, query: f = None, _at_most: int = 0, _order: dict = None) -> Iterable: ...
+    def find(self, query: f = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> Iterable:
+        """Matching documents; with ``_fields``, only those fields (plus the id) are read from the store."""
+
     @abc.abstractmethod
     def count(self, query: f = None) -> int: ...
     @abc.abstractmethod
@@ -72,6 +130,42 @@ class TsCollection(abc.ABC):
         for data in self.find(f(**{self.s_id_tag: id_value})):
             return data
 
+    def find_latest(self, query: f = None, _group_by: str = None, _latest: dict = None, _at_most: int = 0) -> Iterable:
+        """One document per distinct ``_group_by`` value among those matching ``query``: the first under ``_latest``.
+
+        Results come in ascending ``_group_by`` order. Default: one ordered :meth:`find`, deduplicated
+        as it streams. Stores override with a server-side query so the losers never leave the server.
+        """
+        last = object()  # -- equals no key
+        taken = 0
+        for doc in self.find(query, _order={_group_by: 1, **(_latest or {})}):
+            if (key := doc.get(_group_by)) == last:
+                continue
+            last = key
+            yield doc
+            taken += 1
+            if taken == _at_most:
+                return
+
+    def save_new_many(self, serialized_traitables: Sequence[dict], overwrite: bool = False) -> list[dict]:
+        """Bulk :meth:`save_new` - one result per document, in input order.
+
+        Default: one :meth:`save_new` per document. Stores override with a single bulk write.
+        """
+        return [self.save_new(serialized_traitable, overwrite=overwrite) for serialized_traitable in serialized_traitables]
+
+    def save_many(self, serialized_traitables: Sequence[dict]) -> list[dict]:
+        """Bulk :meth:`save` - one result (``_rev`` + hydrated TS fields) per document, in input order."""
+        return [self.save(serialized_traitable) for serialized_traitable in serialized_traitables]
+
+    def delete_many(self, id_values: Sequence[str]) -> int:
+        """Bulk :meth:`delete` - returns the number of documents deleted."""
+        return sum(bool(self.delete(id_value)) for id_value in id_values)
+
+    def aio(self) -> AsyncTsCollection:
+        """Awaitable facade over this collection (see :class:`AsyncTsCollection`)."""
+        return AsyncTsCollection(self)
+
     def intrinsic_trait_dir(self) -> dict:
         """trait dir inferred from the collection"""
         return {}  # -- no schema by default
@@ -80,20 +174,82 @@ class TsCollection(abc.ABC):
         """Union additional trait metadata into this collection's schema (no-op by default)."""
         return
 
-    def copy_to(self, to_coll: TsCollection, overwrite: bool = False) -> RC:
-        """Copy all documents to another collection (same store-type rules as :meth:`TsStore.copy_to`)."""
+    def copy_to(self, to_coll: TsCollection, overwrite: bool = False, batch_size: int = 1000) -> RC:
+        """Copy all documents to another collection (same store-type rules as :meth:`TsStore.copy_to`).
+
+        Documents are written ``batch_size`` at a time via :meth:`save_new_many`. Without ``overwrite``,
+        a batch hitting an existing key is retried one document at a time, skipping the duplicates.
+        """
         rc = RC(True)
 
-        for doc in self.find():
+        docs = iter(self.find())
+        while batch := list(itertools.islice(docs, batch_size)):
             try:
-                if not to_coll.save_new(doc, overwrite=overwrite).get(_REV):
-                    rc.add_error(f'Failed to save {doc.get(to_coll.s_id_tag)} to {to_coll.collection_name()}')
+                results = to_coll.save_new_many(batch, overwrite=overwrite)
             except TsDuplicateKeyError:
                 if overwrite:
                     raise  # -- we do not expect an exception in case of overwrite, so raise
+                results = [self._copy_doc(to_coll, doc) for doc in batch]
+
+            for doc, result in zip(batch, results, strict=True):
+                if result is not None and not result.get(_REV):
+                    rc.add_error(f'Failed to save {doc.get(to_coll.s_id_tag)} to {to_coll.collection_name()}')
 
         return rc
 
+    @staticmethod
+    def _copy_doc(to_coll: TsCollection, doc: dict) -> dict | None:
+        """Single-document fallback for :meth:`copy_to`; ``None`` if the document already exists."""
+        try:
+            return to_coll.save_new(doc)
+        except TsDuplicateKeyError:
+            return None
+
+
+class AsyncTsCollection:
+    """Awaitable facade over a :class:`TsCollection`, obtained from :meth:`TsCollection.aio`.
+
+    By default each call runs the synchronous method on a worker thread, and :meth:`find` pulls
+    ``s_batch_size`` documents per thread hop. Stores with a native async driver subclass this and
+    override what they can serve without threads.
+    """
+
+    s_batch_size: int = 1000
+
+    def __init__(self, collection: TsCollection):
+        self.collection = collection
+
+    def collection_name(self) -> str:
+        return self.collection.collection_name()
+
+    async def find(self, query: f = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> AsyncIterator[dict]:
+        cursor = iter(await asyncio.to_thread(self.collection.find, query, _at_most=_at_most, _order=_order, _fields=_fields))
+        batch_size = self.s_batch_size
+        while batch := await asyncio.to_thread(lambda: list(itertools.islice(cursor, batch_size))):
+            for doc in batch:
+                yield doc
+
+    async def load(self, id_value: str) -> dict | None:
+        return await asyncio.to_thread(self.collection.load, id_value)
+
+    async def id_exists(self, id_value: str) -> bool:
+        return await asyncio.to_thread(self.collection.id_exists, id_value)
+
+    async def count(self, query: f = None) -> int:
+        return await asyncio.to_thread(self.collection.count, query)
+
+    async def exists(self, query: f) -> bool:
+        return await self.count(query) > 0
+
+    async def save_new(self, serialized_traitable: dict, overwrite: bool = False) -> dict:
+        return await asyncio.to_thread(self.collection.save_new, serialized_traitable, overwrite=overwrite)
+
+    async def save(self, serialized_traitable: dict) -> dict:
+        return await asyncio.to_thread(self.collection.save, serialized_traitable)
+
+    async def delete(self, id_value: str) -> bool:
+        return await asyncio.to_thread(self.collection.delete, id_value)
+
 
 class TsStore(Resource, resource_type=TS_STORE):
     s_requires_schema: bool = False
@@ -222,7 +378,7 @@ class TsStore(Resource, resource_type=TS_STORE):
     def supports_transactions(self) -> bool:
         return True
 
-    def copy_to(self, to_store: TsStore, overwrite: bool = False) -> RC:
+    def copy_to(self, to_store: TsStore, overwrite: bool = False, batch_size: int = 1000) -> RC:
         """Copy all collections.
 
         Allowed directions: schemaless→schemaless (e.g. Mongo→Mongo), schema→schema
@@ -238,7 +394,7 @@ class TsStore(Resource, resource_type=TS_STORE):
         for collection_name in self.collection_names():
             from_coll = self.collection(collection_name, {})
             to_coll = to_store.collection(collection_name, from_coll.intrinsic_trait_dir())
-            rc += from_coll.copy_to(to_coll, overwrite=overwrite)
+            rc += from_coll.copy_to(to_coll, overwrite=overwrite, batch_size=batch_size)
         return rc
 
     @contextmanager
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+import functools
 import heapq
 import itertools
 import operator
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
 from typing import TYPE_CHECKING
 
 from core_10x.nucleus import Nucleus
-from core_10x.trait_filter import EQ, f
-from core_10x.ts_store import TsCollection, TsStore
+from core_10x.trait_filter import EQ, IN, f
+from core_10x.ts_store import TsCollection, TsStore, read_ahead
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from datetime import datetime
 
 
+_NOTHING = object()
+
+
 class _OrderKey:
     __slots__ = ('reverse', 'value')
 
@@ -61,10 +66,60 @@ class _OrderKey:
     def key(cls, item, order):
         return tuple(cls(value=item.get(k), reverse=v < 0) for k, v in order)
 
+    @classmethod
+    def merge_key(cls, order: tuple) -> Callable[[dict], object]:
+        """Key for :func:`heapq.merge` of items sorted by ``order``: :meth:`key`, or a bare order key for a single field."""
+        if len(order) == 1:
+            ((name, direction),) = order
+            reverse = direction < 0
+            return lambda item: cls(item.get(name), reverse)
+        return functools.partial(cls.key, order=order)
+
 
 class TsUnionCollection(TsCollection):
-    def __init__(self, *collections: TsCollection):
+    """Reads merge all member collections; writes go to the head, ``collections[0]``.
+
+    With ``concurrent=True`` member queries are issued in parallel, each member's ``find`` reading up to
+    :attr:`s_read_ahead` documents ahead of the merge, so a union costs about as much as its slowest member.
+    """
+
+    s_read_ahead = 256
+
+    def __init__(self, *collections: TsCollection, concurrent: bool = False, head_ids: set | None = None, store: TsUnion | None = None):
         self.collections = collections
+        self.concurrent = concurrent
+        self.store = store
+        # -- ids written to the head through the union (and committed): saving them again needs no existence probe
+        self.head_ids = set() if head_ids is None else head_ids
+
+    def _in_transaction(self) -> bool:
+        return self.store is not None and self.store.current_transaction() is not None
+
+    def _written(self, id_values: Iterable[str]) -> None:
+        """Remember ``id_values`` as in the head - unless written in a transaction, which may still be rolled back."""
+        if not self._in_transaction():
+            self.head_ids.update(id_values)
+
+    def _concurrent(self) -> bool:
+        # -- a transaction pins its (e.g. leased Postgres) connection to this thread: members are then queried here, in turn
+        return self.concurrent and len(self.collections) > 1 and not self._in_transaction()
+
+    def _map(self, fn: Callable[[TsCollection], object]) -> list:
+        """``fn`` applied to each member, in member order - in parallel if the union is concurrent and not in a transaction."""
+        if not self._concurrent():
+            return [fn(collection) for collection in self.collections]
+        # -- a pool per call: nested unions cannot starve each other of workers
+        with ThreadPoolExecutor(max_workers=len(self.collections), thread_name_prefix='ts_union') as pool:
+            return list(pool.map(fn, self.collections))
+
+    def _member_find(self, collection: TsCollection, query: f, _at_most: int, _order: dict, _fields: Sequence[str]) -> Iterator:
+        iterable = collection.find(query, _at_most=_at_most, _order=_order, _fields=_fields)
+        if iterable is None or not self._concurrent():
+            return iterable
+        # -- pull the first document here (on the pool) so every member's query is in flight at once
+        it = iter(iterable)
+        first = next(it, _NOTHING)
+        return iter(()) if first is _NOTHING else itertools.chain((first,), read_ahead(it, self.s_read_ahead))
 
     def intrinsic_trait_dir(self) -> dict:
         return self.collections[0].intrinsic_trait_dir() if self.collections else {}
@@ -77,27 +132,70 @@ class TsUnionCollection(TsCollection):
     def collection_name(self) -> str:
         return self.collections[0].collection_name() if self.collections else ''
 
-    def find(self, query: f = None, _at_most: int = 0, _order: dict = None) -> Iterable:
+    def find(self, query: f = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> Iterable:
         order = tuple((_order or {'_id': 1}).items())  # FIX: assumes _id is always there!
-        order_key = _OrderKey.key
-        iterables = (collection.find(query, _at_most=_at_most, _order=_order) for collection in self.collections)
-        keyed_iterables = (((order_key(item, order), item) for item in iterable) for iterable in iterables if iterable is not None)
-        results = (item for _, item in heapq.merge(*keyed_iterables, key=operator.itemgetter(0)))
-        return (item for i, item in enumerate(results) if i < _at_most) if _at_most else results
+        key = _OrderKey.merge_key(order)
+        # -- members must also return the sort keys for the merge; those not asked for are dropped after it
+        fields = None if _fields is None else list(dict.fromkeys([*_fields, *(_order or ())]))
+        iterables = self._map(lambda collection: self._member_find(collection, query, _at_most, _order, fields))
+        results = heapq.merge(*(iterable for iterable in iterables if iterable is not None), key=key)
+        if _at_most:
+            results = itertools.islice(results, _at_most)  # -- stops pulling from the members once the limit is reached
+        if fields is not None and (extra := set(fields).difference(_fields, ('_id',))):
+            results = ({k: v for k, v in item.items() if k not in extra} for item in results)
+        return results
+
+    def _in_head(self, id_values: Sequence[str]) -> set:
+        """Those of ``id_values`` present in the head: known ones from :attr:`head_ids`, the rest in one projected query."""
+        known = self.head_ids.intersection(id_values)
+        if unknown := [id_value for id_value in dict.fromkeys(id_values) if id_value not in known]:
+            id_tag = Nucleus.ID_TAG()
+            known |= {doc[id_tag] for doc in self.collections[0].find(f(**{id_tag: IN(unknown)}), _fields=())}
+        return known
 
     def save_new(self, serialized_traitable: dict, overwrite: bool = False):
-        return self.collections[0].save_new(serialized_traitable, overwrite=overwrite)
+        result = self.collections[0].save_new(serialized_traitable, overwrite=overwrite)
+        self._written((serialized_traitable[Nucleus.ID_TAG()],))
+        return result
 
     def save(self, serialized_traitable):
         # if serialized_traitable was not loaded from the union head, we need to call save_new
         id_tag = Nucleus.ID_TAG()
-        if not self.collections[0].exists(f(**{id_tag: EQ(serialized_traitable[id_tag])})):
-            # TODO: optimize by introducing save with overwrite flag to bypass the "inappropriate restore from deleted" check
-            return self.collections[0].save_new(serialized_traitable)
-        return self.collections[0].save(serialized_traitable)
+        id_value = serialized_traitable[id_tag]
+        head = self.collections[0]
+        if serialized_traitable.get(Nucleus.REVISION_TAG()) == 0 or not (id_value in self.head_ids or head.exists(f(**{id_tag: EQ(id_value)}))):
+            result = head.save_new(serialized_traitable)
+        else:
+            result = head.save(serialized_traitable)
+        self._written((id_value,))
+        return result
+
+    def save_new_many(self, serialized_traitables: Sequence[dict], overwrite: bool = False) -> list[dict]:
+        results = self.collections[0].save_new_many(serialized_traitables, overwrite=overwrite)
+        id_tag = Nucleus.ID_TAG()
+        self._written(serialized_traitable[id_tag] for serialized_traitable in serialized_traitables)
+        return results
+
+    def save_many(self, serialized_traitables: Sequence[dict]) -> list[dict]:
+        """Bulk :meth:`save`: one existence query for the ids not yet known to be in the head, then a bulk write per kind."""
+        id_tag = Nucleus.ID_TAG()
+        rev_tag = Nucleus.REVISION_TAG()
+        in_head = self._in_head([st[id_tag] for st in serialized_traitables if st.get(rev_tag) != 0])
+        updates = [i for i, st in enumerate(serialized_traitables) if st.get(rev_tag) != 0 and st[id_tag] in in_head]
+        updated = set(updates)
+        new = [i for i in range(len(serialized_traitables)) if i not in updated]
+
+        results: list[dict | None] = [None] * len(serialized_traitables)
+        for indices, save in ((new, self.save_new_many), (updates, self.collections[0].save_many)):
+            if indices:
+                for i, result in zip(indices, save([serialized_traitables[i] for i in indices]), strict=True):
+                    results[i] = result
+        self._written(serialized_traitables[i][id_tag] for i in updates)
+        return results
 
     def delete(self, id_value):
         # if id_value exists in the union tail, return False as the object wasn't fully deleted
+        self.head_ids.discard(id_value)
         return self.collections[0].delete(id_value) and not self.exists(f(**{Nucleus.ID_TAG(): EQ(id_value)}))
 
     def create_index(self, name: str, trait_name: str | list[tuple[str, int]], **index_args) -> str:
@@ -105,25 +203,30 @@ class TsUnionCollection(TsCollection):
         return self.collections[0].create_index(name, trait_name, **index_args)
 
     def max(self, trait_name: str, filter: f = None) -> dict | None:
-        results = (result for result in (collection.max(trait_name, filter) for collection in self.collections) if result is not None)
+        results = (result for result in self._map(lambda collection: collection.max(trait_name, filter)) if result is not None)
         return max(results, key=operator.itemgetter(trait_name), default=None)
 
     def min(self, trait_name: str, filter: f = None) -> dict | None:
-        results = (result for result in (collection.min(trait_name, filter) for collection in self.collections) if result is not None)
+        results = (result for result in self._map(lambda collection: collection.min(trait_name, filter)) if result is not None)
         return min(results, key=operator.itemgetter(trait_name), default=None)
 
     def id_exists(self, id_value: str) -> bool:
-        return any(collection.id_exists(id_value) for collection in self.collections)
+        if not self.concurrent:
+            return any(collection.id_exists(id_value) for collection in self.collections)
+        return any(self._map(lambda collection: collection.id_exists(id_value)))
 
     def count(self, query: f = None) -> int:
-        return sum(collection.count(query) for collection in self.collections)
+        return sum(self._map(lambda collection: collection.count(query)))
 
     def load(self, id_value: str) -> dict | None:
-        for collection in self.collections:
-            data = collection.load(id_value)
-            if data is not None:
-                return data
-        return None
+        if not self._concurrent():
+            for collection in self.collections:
+                data = collection.load(id_value)
+                if data is not None:
+                    return data
+            return None
+        # -- all members are asked at once; the first member that has it still wins
+        return next((data for data in self._map(lambda collection: collection.load(id_value)) if data is not None), None)
 
 
 class TsUnion(TsStore, resource_name='TS_UNION'):
@@ -144,17 +247,25 @@ class TsUnion(TsStore, resource_name='TS_UNION'):
         stores = [cls.s_resource_type.resource_driver(kw.pop('driver_name')).instance(**kw) for kw in args]
         return TsUnion(*stores)
 
-    def __init__(self, *stores: TsStore):
+    def __init__(self, *stores: TsStore, concurrent: bool = False):
         super().__init__()
         self.stores = stores
+        self.concurrent = concurrent
+        self._head_ids: dict[str, set] = {}  # -- collection name -> ids known to be in the head store
 
     def collection_names(self, regexp: str = None) -> list:
         return list(set(itertools.chain(*(store.collection_names(regexp) for store in self.stores))))
 
     def collection(self, collection_name: str, trait_dir: dict | None = None) -> TsUnionCollection:
-        return TsUnionCollection(*(store.collection(collection_name, trait_dir) for store in self.stores))
+        return TsUnionCollection(
+            *(store.collection(collection_name, trait_dir) for store in self.stores),
+            concurrent=self.concurrent,
+            head_ids=self._head_ids.setdefault(collection_name, set()),
+            store=self,
+        )
 
     def delete_collection(self, collection_name: str) -> bool:
+        self._head_ids.pop(collection_name, None)
         return self.stores[0].delete_collection(collection_name) if self.stores else False
 
     def auth_user(self) -> str | None:
@@ -171,6 +282,10 @@ class TsUnion(TsStore, resource_name='TS_UNION'):
     def server_time(self) -> datetime:
         return self.stores[0].server_time() if self.stores else None
 
+    def current_transaction(self) -> TsStore.Transaction | None:
+        """The head store's transaction - see :meth:`transaction`."""
+        return self.stores[0].current_transaction() if self.stores else super().current_transaction()
+
     def transaction(self):
         """Context manager for transactional operations. Delegates to base (no stores) or first store."""
         return next(iter(self.stores), super()).transaction()
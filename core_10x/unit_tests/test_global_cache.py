@@ -1,4 +1,4 @@
-from core_10x.global_cache import cache
+from core_10x.global_cache import _clear_all_caches, cache, lru_cache
 
 # ----------------------------------------------------------------------------
 #   keep_value=True (normal caching behavior)
@@ -140,3 +140,44 @@ def test_cache_keep_value_false_clear():
     f.clear()
     assert f(7) == 70
     assert calls == [7, 7]
+
+
+# ----------------------------------------------------------------------------
+#   lru_cache (bounded, cleared with the other caches)
+# ----------------------------------------------------------------------------
+
+
+def test_lru_cache_evicts_and_clears_with_all_caches():
+    calls = []
+
+    @lru_cache(maxsize=2)
+    def f(x):
+        calls.append(x)
+        return x * 2
+
+    assert [f(1), f(2), f(1), f(3)] == [2, 4, 2, 6]
+    assert calls == [1, 2, 3]
+    assert f(2) == 4  # -- least recently used: evicted by 3
+    assert calls == [1, 2, 3, 2]
+
+    _clear_all_caches()
+    assert f(1) == 2
+    assert calls == [1, 2, 3, 2, 1]
+
+
+def test_lru_cache_resize_stays_registered():
+    calls = []
+
+    @lru_cache(maxsize=2)
+    def f(x):
+        calls.append(x)
+        return x * 2
+
+    f(1)
+    f.resize(1)
+    assert f.cache_info().maxsize == 1
+    assert [f(1), f(2), f(1)] == [2, 4, 2]
+    assert calls == [1, 1, 2, 1]
+
+    _clear_all_caches()
+    assert f.cache_info().currsize == 0
@@ -9,15 +9,21 @@ TestLoggerEndToEnd  - subprocess lifecycle using Logger directly;
                       full message-processing requires a TsStore (infra_10x tests)
 TestLOGStub         - functional tests of the LOG interface using a stub Logger
                       (``stub_log_logger`` fixture — avoids subprocess / TsStore)
+TestBatching        - write-behind batching and queue overload handling
+TestLogReader       - time-range reads of persisted messages (``ts_instance`` store)
 """
 
 import multiprocessing as mp
+import queue
 import time
+from datetime import datetime, timedelta, timezone
 
 import core_10x.logger as log_module
 import pytest
-from core_10x.logger import LOG, Logger, PerfTimer
+from core_10x.logger import LOG, Logger, LogMessage, LogReader, PerfTimer, next_batch
 from core_10x.testlib.stub_logger import stub_log_module_logger
+from core_10x.traitable import Traitable
+from uuid6 import uuid7
 
 # ---------------------------------------------------------------------------
 # PerfTimer
@@ -245,3 +251,76 @@ class TestLOGStub:
             LOG.BRIEF('after restart')
             assert len(stub2.received) == 1
             assert stub2.received[0]['payload'] == 'after restart'
+
+
+# ---------------------------------------------------------------------------
+# Write-behind batching
+# ---------------------------------------------------------------------------
+
+
+class TestBatching:
+    def test_batch_stops_at_sentinel(self):
+        q = queue.Queue()
+        for item in ({'ns': 1}, {'ns': 2}, None, {'ns': 3}):
+            q.put(item)
+        assert next_batch(q, 10, 1.0) == ([{'ns': 1}, {'ns': 2}], True)
+
+    def test_batch_is_capped_at_batch_size(self):
+        q = queue.Queue()
+        for ns in range(5):
+            q.put({'ns': ns})
+        assert next_batch(q, 2, 1.0) == ([{'ns': 0}, {'ns': 1}], False)
+        assert next_batch(q, 2, 1.0) == ([{'ns': 2}, {'ns': 3}], False)
+
+    def test_batch_is_flushed_after_interval(self):
+        q = queue.Queue()
+        q.put({'ns': 0})
+        with PerfTimer() as t:
+            batch, done = next_batch(q, 10, 0.05)
+        assert (batch, done) == ([{'ns': 0}], False)
+        assert t.elapsed >= 50_000_000
+
+    def test_full_queue_drops_low_priority_only(self):
+        logger = object.__new__(Logger)
+        logger.queue = queue.Queue(maxsize=1)
+        logger.dropped = 0
+
+        logger.log({'level': LOG.BRIEF.value})
+        logger.log({'level': LOG.VERBOSE.value})
+        logger.log({'level': LOG.DETAILED.value})
+        assert logger.dropped == 2
+
+        with pytest.raises(queue.Full):
+            logger.queue.put({'level': LOG.MEDIUM.value}, timeout=0.01)  # -- what Logger.log would block on
+
+
+# ---------------------------------------------------------------------------
+# LogReader
+# ---------------------------------------------------------------------------
+
+
+class TestLogReader:
+    def test_time_range_and_level(self, ts_instance):
+        coll_name = f'app/user/host/{uuid7().hex}/1'
+        started_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        ns0 = 1_000_000_000
+        second = 1_000_000_000
+        rows = [(ns0, 0, started_at), (ns0 + second, 1, 'a'), (ns0 + 2 * second, 3, 'b'), (ns0 + 3 * second, 0, 'c')]
+        with ts_instance:
+            Traitable.save_many(
+                [
+                    LogMessage(_replace=True, _collection_name=coll_name, ns=ns, level=level, mem_pc=0.0, num_threads=1, payload=payload)
+                    for ns, level, payload in rows
+                ]
+            ).throw()
+
+        try:
+            reader = LogReader(coll_name, store=ts_instance)
+            assert reader.origin()[0] == ns0
+            assert [m.payload for m in reader.messages(started_at + timedelta(seconds=1), started_at + timedelta(seconds=3))] == ['a', 'b']
+            assert [m.payload for m in reader.messages(ns0 + second, max_level=LOG.MEDIUM.value)] == ['a', 'c']
+            assert [m.ns for m in reader.messages(end=ns0 + second)] == [ns0]
+            assert reader.at(next(reader.messages(ns0 + 3 * second))) == started_at + timedelta(seconds=3)
+            assert coll_name in LogReader.runs('app', store=ts_instance)
+        finally:
+            ts_instance.delete_collection(coll_name)
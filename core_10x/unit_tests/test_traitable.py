@@ -211,6 +211,125 @@ def test_subclass_does_not_inherit_parent_storage_helper(ts_instance, monkeypatc
         store.end_using()
 
 
+def test_save_many(ts_instance, monkeypatch):
+    monkeypatch.setattr('core_10x.package_refactoring.PackageRefactoring.default_class_id', lambda cls, *args, **kwargs: PyClass.name(cls))
+
+    class _BulkT(Traitable, keep_history=False, immutable=False):
+        key: str = T(T.ID)
+        qty: int = T()
+
+        def qty_verify(self, trait, value) -> RC:
+            return RC_TRUE if value >= 0 else RC(False, f'negative qty {value}')
+
+    prefix = uuid6.uuid7().hex
+    store = ts_instance
+    store.username = 'test_user'
+    with store:
+        try:
+            objs = [_BulkT(key=f'{prefix}-{i}', qty=i, _replace=True) for i in range(4)]
+            bad = _BulkT(key=f'{prefix}-bad', qty=-1, _replace=True)
+            rc = Traitable.save_many([*objs, bad])
+            assert not rc
+            assert 'negative qty -1' in rc.error()
+            assert [obj.get_revision() for obj in objs] == [1] * 4
+            assert bad.get_revision() == 0
+            assert {d['_id'] for d in _BulkT.collection().find()} == {obj.id().value for obj in objs}
+
+            objs[1].qty = 10
+            Traitable.save_many(objs).throw()
+            assert [obj.get_revision() for obj in objs] == [1, 2, 1, 1]
+            assert _BulkT.collection().load(objs[1].id().value)['qty'] == 10
+        finally:
+            _BulkT.delete_collection()
+
+
+def test_iter_many(ts_instance, monkeypatch):
+    monkeypatch.setattr('core_10x.package_refactoring.PackageRefactoring.default_class_id', lambda cls, *args, **kwargs: PyClass.name(cls))
+
+    class _IterT(Traitable, keep_history=False):
+        key: str = T(T.ID)
+        qty: int = T()
+
+    prefix = uuid6.uuid7().hex
+    store = ts_instance
+    store.username = 'test_user'
+    with store:
+        try:
+            Traitable.save_many([_IterT(key=f'{prefix}-{i}', qty=i, _replace=True) for i in range(5)]).throw()
+
+            it = _IterT.iter_many(_order={'qty': 1})
+            assert not isinstance(it, list)
+            assert [obj.qty for obj in it] == [0, 1, 2, 3, 4]
+            assert [obj.qty for obj in _IterT.iter_many(_order={'qty': -1}, _prefetch=2)] == [4, 3, 2, 1, 0]
+            assert [d['qty'] for d in _IterT.iter_many(_order={'qty': 1}, _deserialize=False, _prefetch=1)] == [0, 1, 2, 3, 4]
+            assert [set(d) for d in _IterT.load_many(_at_most=2, _deserialize=False, _fields=['qty'])] == [{'_id', 'qty'}] * 2
+            with pytest.raises(ValueError, match='_fields requires _deserialize=False'):
+                _IterT.load_many(_fields=['qty'])
+
+            it = _IterT.iter_many(_order={'qty': 1}, _prefetch=1)
+            assert next(it).qty == 0
+            it.close()  # -- stops the background reader
+
+            depths = []
+            monkeypatch.setattr('core_10x.traitable.read_ahead', lambda items, depth: depths.append(depth) or iter(items))
+            with store.transaction():
+                assert [obj.qty for obj in _IterT.iter_many(_order={'qty': 1}, _prefetch=2)] == [0, 1, 2, 3, 4]
+            assert depths == [0]  # -- no read-ahead inside a transaction
+        finally:
+            _IterT.delete_collection()
+
+
+def test_existing_instances(ts_instance, monkeypatch):
+    monkeypatch.setattr('core_10x.package_refactoring.PackageRefactoring.default_class_id', lambda cls, *args, **kwargs: PyClass.name(cls))
+
+    class _ExistingT(Traitable, keep_history=False):
+        name: str = T(T.ID)
+        d: date = T(T.ID)
+        qty: int = T()
+
+    prefix = uuid6.uuid7().hex
+    today = date(2024, 1, 2)
+    store = ts_instance
+    store.username = 'test_user'
+    with store:
+        try:
+            with BTP.create(-1, -1, -1, use_parent_cache=False, use_default_cache=False):  # -- saved elsewhere: not in memory here
+                Traitable.save_many([_ExistingT(name=f'{prefix}-{i}', d=today, qty=i, _replace=True) for i in range(4)]).throw()
+            sought = [{'name': f'{prefix}-{i}', 'd': today} for i in (2, 0, 9, 2)]
+
+            queries = []
+            load_many = _ExistingT.load_many.__func__
+            monkeypatch.setattr(
+                _ExistingT, 'load_many', classmethod(lambda cls, query=None, **kwargs: queries.append(query) or load_many(cls, query, **kwargs))
+            )
+
+            found = _ExistingT.existing_instances(sought, _throw=False)
+            assert [obj.qty if obj else None for obj in found] == [2, 0, None, 2]
+            assert found[0] is found[3]
+            assert len(queries) == 1  # -- one query for all of them
+
+            with pytest.raises(ValueError, match=f'{prefix}-9'):
+                _ExistingT.existing_instances(sought)
+
+            queries.clear()
+            found = _ExistingT.existing_instances([*sought[:2], {'name': f'{prefix}-3', 'd': today}])
+            assert [obj.qty for obj in found] == [2, 0, 3]
+            assert len(queries) == 1  # -- the loaded ones are in memory now; the query is for the rest
+            assert queries[0].prefix_notation()['name'] == {'$eq': f'{prefix}-3'}
+
+            queries.clear()
+            unsaved = _ExistingT(name=f'{prefix}-new', d=today, qty=7, _replace=True)
+            assert _ExistingT.existing_instances([{'name': f'{prefix}-new', 'd': today}]) == [unsaved]  # -- by id, in memory
+            assert _ExistingT.existing_instances([{'name': f'{prefix}-new'}]) == [unsaved]  # -- no id from a partial dict: scanned
+            assert not queries
+
+            found = _ExistingT.existing_instances([{'name': f'{prefix}-1'}])
+            assert [obj.qty for obj in found] == [1]
+            assert queries[0].prefix_notation() == {'name': {'$eq': f'{prefix}-1'}}
+        finally:
+            _ExistingT.delete_collection()
+
+
 def test_collection_name_rt():
     class X(Traitable):
         x: int
@@ -1058,7 +1177,7 @@ def test_load_reload_flag(monkeypatch):
                         def create_index(self, name, trait_name):
                             return name
 
-                        def find(self, query, _at_most=0, _order=None):
+                        def find(self, query, _at_most=0, _order=None, _fields=None):
                             return list(store.values())
 
                         def save(self, serialized_data):
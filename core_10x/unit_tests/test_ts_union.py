@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -35,8 +36,8 @@ def test_find(union_collection, args=None):
     collection2.find.return_value = [{Nucleus.ID_TAG(): 1}]
     results = list(union.find(*args))
     assert results == [{Nucleus.ID_TAG(): 1}, {Nucleus.ID_TAG(): 2}]
-    collection1.find.assert_called_once_with((args and args[0]) or None, _order=None, _at_most=0)
-    collection2.find.assert_called_once_with((args and args[0]) or None, _order=None, _at_most=0)
+    collection1.find.assert_called_once_with((args and args[0]) or None, _order=None, _at_most=0, _fields=None)
+    collection2.find.assert_called_once_with((args and args[0]) or None, _order=None, _at_most=0, _fields=None)
 
 
 def test_no_args(union_collection):
@@ -376,3 +377,148 @@ def test_counterexample_early_value_diff():
     d = {'a': 1, 'c': 4}
     od = {'a': 2, 'b': 3}
     assert -1 == _OrderKey._dict_cmp(d, od)  # 1 < 2, later ignored
+
+
+def test_concurrent():
+    collection1 = MagicMock()
+    collection2 = MagicMock()
+    union = TsUnionCollection(collection1, collection2, concurrent=True)
+    collection1.find.return_value = [{'_id': '1'}, {'_id': '3'}]
+    collection2.find.return_value = iter([{'_id': '2'}, {'_id': '4'}])
+    assert [r['_id'] for r in union.find()] == ['1', '2', '3', '4']
+    assert [r['_id'] for r in union.find(_at_most=1)] == ['1']
+
+    collection1.find.return_value = []
+    collection2.find.return_value = None
+    assert list(union.find()) == []
+
+    collection1.count.return_value = 2
+    collection2.count.return_value = 3
+    assert union.count() == 5
+
+    collection1.id_exists.return_value = False
+    collection2.id_exists.return_value = True
+    assert union.id_exists('1')
+
+    collection1.load.return_value = None
+    collection2.load.return_value = {'_id': '1', 'x': 2}
+    assert union.load('1') == {'_id': '1', 'x': 2}
+    collection1.load.return_value = {'_id': '1', 'x': 1}
+    assert union.load('1') == {'_id': '1', 'x': 1}  # -- the head still wins
+
+    collection1.max.return_value = {'x': 1}
+    collection2.max.return_value = {'x': 2}
+    assert union.max('x') == {'x': 2}
+
+
+def test_concurrent_in_transaction():
+    collection1 = MagicMock()
+    collection2 = MagicMock()
+    store = MagicMock()
+    store.current_transaction.return_value = object()
+    union = TsUnionCollection(collection1, collection2, concurrent=True, store=store)
+    threads = []
+
+    def find(docs):
+        def _find(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return iter(docs)
+
+        return _find
+
+    collection1.find.side_effect = find([{'_id': '1'}, {'_id': '3'}])
+    collection2.find.side_effect = find([{'_id': '2'}])
+    collection1.load.side_effect = lambda id_value: threads.append(threading.current_thread())
+    collection2.load.side_effect = lambda id_value: threads.append(threading.current_thread()) or {'_id': id_value}
+    assert [r['_id'] for r in union.find()] == ['1', '2', '3']
+    assert union.load('1') == {'_id': '1'}
+    assert threads == [threading.current_thread()] * 4  # -- the transaction's connection stays on its thread
+
+
+def test_concurrent_store(union_store):
+    _, mock_store1, mock_store2 = union_store
+    union_store = TsUnion(mock_store1, mock_store2, concurrent=True)
+    assert union_store.collection('collection_name').concurrent
+
+
+def test_at_most_stops_pulling(union_collection):
+    union, collection1, collection2 = union_collection
+    pulled = []
+
+    def members(start):
+        for i in range(start, 100, 2):
+            pulled.append(i)
+            yield {'_id': i}
+
+    collection1.find.return_value = members(0)
+    collection2.find.return_value = members(1)
+    assert [r['_id'] for r in union.find(_at_most=3)] == [0, 1, 2]
+    assert len(pulled) <= 5
+
+
+def test_save_known_head_id(union_collection):
+    union, collection1, collection2 = union_collection
+    collection1.find.return_value = [{Nucleus.ID_TAG(): '1', Nucleus.REVISION_TAG(): 3}]
+    collection2.find.return_value = [{Nucleus.ID_TAG(): '2', Nucleus.REVISION_TAG(): 5}]
+    list(union.find())
+    union.load('1')
+    assert union.head_ids == set()  # -- reads are not remembered
+
+    collection1.exists.return_value = True
+    union.save({Nucleus.ID_TAG(): '1', Nucleus.REVISION_TAG(): 3})
+    collection1.exists.assert_called_once()
+    collection1.save.assert_called_once()
+    assert union.head_ids == {'1'}
+
+    collection1.reset_mock()
+    union.save({Nucleus.ID_TAG(): '1', Nucleus.REVISION_TAG(): 4})
+    collection1.exists.assert_not_called()
+    collection1.save.assert_called_once()
+
+    collection1.reset_mock()
+    union.save({Nucleus.ID_TAG(): '3', Nucleus.REVISION_TAG(): 0})
+    collection1.exists.assert_not_called()
+    collection1.save_new.assert_called_once()
+    assert union.head_ids == {'1', '3'}
+
+    collection1.count.return_value = 0
+    collection2.count.return_value = 0
+    union.delete('3')
+    assert union.head_ids == {'1'}
+
+
+def test_head_ids_not_remembered_in_transaction(union_collection):
+    union, collection1, _collection2 = union_collection
+    union.store = MagicMock()
+    union.store.current_transaction.return_value = object()
+    collection1.exists.return_value = True
+    union.save({Nucleus.ID_TAG(): '1', Nucleus.REVISION_TAG(): 3})
+    union.save_new({Nucleus.ID_TAG(): '2', Nucleus.REVISION_TAG(): 0})
+    assert union.head_ids == set()
+
+    union.store.current_transaction.return_value = None
+    union.save({Nucleus.ID_TAG(): '1', Nucleus.REVISION_TAG(): 3})
+    assert union.head_ids == {'1'}
+
+
+def test_save_many(union_collection):
+    union, collection1, collection2 = union_collection
+    union.head_ids.add('1')
+    collection1.find.return_value = [{Nucleus.ID_TAG(): '2'}]
+    collection1.save_many.side_effect = lambda docs: [{'updated': doc[Nucleus.ID_TAG()]} for doc in docs]
+    collection1.save_new_many.side_effect = lambda docs, overwrite: [{'new': doc[Nucleus.ID_TAG()]} for doc in docs]
+    docs = [{Nucleus.ID_TAG(): id_value, Nucleus.REVISION_TAG(): rev} for id_value, rev in (('1', 2), ('2', 1), ('3', 1), ('4', 0))]
+    assert union.save_many(docs) == [{'updated': '1'}, {'updated': '2'}, {'new': '3'}, {'new': '4'}]
+    collection1.find.assert_called_once()  # -- one probe, for the unknown ids only
+    collection1.exists.assert_not_called()
+    collection2.save_many.assert_not_called()
+    assert union.head_ids == {'1', '2', '3', '4'}
+
+
+def test_head_ids_shared_per_collection_name(union_store):
+    union_store, _mock_store1, _mock_store2 = union_store
+    union_store.collection('c').head_ids.add('1')
+    assert union_store.collection('c').head_ids == {'1'}
+    assert not union_store.collection('d').head_ids
+    union_store.delete_collection('c')
+    assert not union_store.collection('c').head_ids
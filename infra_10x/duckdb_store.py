@@ -37,10 +37,29 @@ class DuckDbStore(IbisStore, resource_name='DUCK_DB'):
     def _execute(self, sql: str, params: list = ()) -> list[tuple]:
         return self._con.execute(sql, params).fetchall()
 
+    def _scan(self, table, batch_size: int) -> Iterable[tuple[list[str], Iterable[tuple]]]:
+        # A DuckDB result stream is tied to the connection and invalidated by the next statement
+        # on it, so a caller writing while iterating find() would lose the rest of the scan.
+        # Outside a transaction the scan streams record batches from a cursor of its own.
+        # A cursor is a separate connection and can't see uncommitted writes, so inside a
+        # transaction the result is materialized first and then handed out in batches.
+        if self.current_transaction() is not None:
+            arrow = table.to_pyarrow()
+            for batch in arrow.to_batches(max_chunksize=batch_size):
+                yield arrow.column_names, self._arrow_rows(batch)
+            return
+
+        cur = self._con.cursor()
+        try:
+            for batch in cur.execute(str(self._ibis_con.compile(table))).to_arrow_reader(batch_size):
+                yield batch.schema.names, self._arrow_rows(batch)
+        finally:
+            cur.close()
+
     def _create_table_if_not_exists(self, collection_name: str) -> None:
         # _data is always present and NOT NULL; empty blob is stored as '{}'.
         self._con.execute(
-            f'CREATE TABLE IF NOT EXISTS {self._qname(collection_name)} ({_ID} VARCHAR PRIMARY KEY, {_REV} INTEGER NOT NULL, {_DATA} VARCHAR NOT NULL)'
+            f'CREATE TABLE IF NOT EXISTS {self._qname(collection_name)} ({_ID} VARCHAR PRIMARY KEY, {_REV} INTEGER NOT NULL, {_DATA} {self.s_data_ddl_type} NOT NULL)'
         )
 
     def _drop_table(self, collection_name: str) -> None:
@@ -54,6 +73,7 @@ class DuckDbStore(IbisStore, resource_name='DUCK_DB'):
         column_names: Iterable[str],
         column_value_sqls: list[str],
         data_sql: str = '?',
+        rows: int = 1,
     ) -> str:
         verb = 'INSERT OR REPLACE' if overwrite else 'INSERT'
         # Materialize once: may be a dict (keys) or other one-shot iterable.
@@ -65,10 +85,10 @@ class DuckDbStore(IbisStore, resource_name='DUCK_DB'):
         value_exprs = ['?', '?', *column_value_sqls, data_sql]
         # Column names are Python identifiers; quote non-system cols for SQL keywords (e.g. by).
         col_sql = ', '.join(c if c in (_ID, _REV, _DATA) else f'"{c}"' for c in cols)
-        values_sql = ', '.join(value_exprs)
-        return f'{verb} INTO {self._qname(collection_name)} ({col_sql}) VALUES ({values_sql}) RETURNING {col_sql}'
+        values_sql = ', '.join([f'({", ".join(value_exprs)})'] * rows)
+        return f'{verb} INTO {self._qname(collection_name)} ({col_sql}) VALUES {values_sql} RETURNING {col_sql}'
 
-    def _handle_insert_error(self, exc: BaseException, collection_name: str, id_val: str) -> None:
+    def _handle_insert_error(self, exc: BaseException, collection_name: str, id_val: str | list[str]) -> None:
         if isinstance(exc, duckdb.ConstraintException):
             raise TsDuplicateKeyError(collection_name, {_ID: id_val}) from exc
         raise exc
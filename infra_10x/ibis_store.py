@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import hashlib
 import json
 import re
 from base64 import b64encode
 from datetime import date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import ibis
 import ibis.expr.datatypes as ibis_dtypes
@@ -16,12 +17,13 @@ from core_10x.nucleus import Nucleus
 from core_10x.resource import Resource
 from core_10x.trait import Trait
 from core_10x.trait_definition import T
-from core_10x.ts_store import TS_FIELDS_TAG, TsCollection, TsStore
+from core_10x.trait_filter import f
+from core_10x.ts_store import TS_FIELDS_TAG, AsyncTsCollection, TsCollection, TsStore
 from ibis.common.exceptions import TableNotFound
 from typing_extensions import Self
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import AsyncIterator, Iterable, Sequence
 
     from core_10x.trait_filter import f as FilterExpr  # noqa: N812
 
@@ -35,16 +37,32 @@ _SCALAR_WIRE_TYPES = frozenset({str, int, float, bool, datetime, date, bytes})
 _MARKER_COLUMNS = frozenset({_ID, _REV, _DATA})  # Every collection table has these; a table without them is not one of ours (see collection_names).
 
 
+class _SaveSql(NamedTuple):
+    """Statements and binds for one optimistic-lock :meth:`IbisCollection.save`."""
+
+    update_sql: str
+    update_params: list
+    select_sql: str
+    select_params: list
+    ret_cols: list
+    ts_fields: dict
+    id_val: str
+    rev: int
+
+
 class IbisCollection(TsCollection):
     """Ibis-backed collection (hybrid columns + JSON blob + add_ts). Dialect hooks live on the store."""
 
     s_id_tag = _ID
+    # Distinct write statements kept per collection (see :meth:`_write_sql`); the cache starts over when full.
+    s_sql_cache_size: int = 256
 
     def __init__(self, store: IbisStore, name: str, trait_dir: dict | None = None):
         self._store = store
         self._name = name
         self.col_trait_dir = {}
         self._writable = False
+        self._sql_cache: dict[tuple, str | tuple] = {}
         self.extend_trait_dir(trait_dir)
 
     def extend_trait_dir(self, trait_dir: dict | None) -> None:
@@ -108,6 +126,14 @@ class IbisCollection(TsCollection):
         return ibis.ifelse(raw_str == 'null', ibis.null(), ibis_ops.UnwrapJSONString(col).to_expr().coalesce(raw_str))
 
     def ibis_compare_pair(self, field_name: str, trait, values: list) -> tuple:
+        if (
+            values
+            and all(type(v) in (int, float) for v in values)
+            and field_name not in self._collection_columns()
+            and (trait or self.col_trait_dir.get(field_name)) is None
+        ):
+            # -- an untyped blob field compared to numbers: unwrap it as a number (its text unwrap is not comparable to one)
+            return self._store.json_caster_map[float](self._ibis_col(field_name, raw=True)), values
         if (
             field_name in self._collection_columns()
             or not any(isinstance(v, (dict, list)) for v in values)
@@ -164,7 +190,7 @@ class IbisCollection(TsCollection):
         return id_val, rev, col_vals, data_json
 
     def _decode_row(self, columns: Sequence[str], row: tuple) -> dict:
-        """Map a physical row (polars / SQL RETURNING) to a traitable document dict."""
+        """Map a physical row (Arrow batch / SQL RETURNING) to a traitable document dict."""
         col_doc = {}
         json_doc = {}
         for col, val in zip(columns, row, strict=True):
@@ -217,70 +243,233 @@ class IbisCollection(TsCollection):
         col_specs.update(ts_col_exprs)
         return id_val, rev_out, ts_fields, col_specs, data_sql, data_params
 
-    def save_new(self, serialized_traitable: dict, overwrite: bool = False) -> dict:
+    def _write_sql(self, key: tuple, build):
+        """Write SQL for ``key`` - (statement kind, column names, value SQLs, data SQL, …) - built once per collection.
+
+        For a fixed layout the text never changes, so it is not re-rendered per write; a stable text also lets
+        the driver reuse its server-side prepared statement (psycopg prepares repeated queries).
+        """
+        cache = self._sql_cache
+        if (sql := cache.get(key)) is None:
+            if len(cache) >= self.s_sql_cache_size:
+                cache.clear()
+            sql = cache[key] = build()
+        return sql
+
+    def _cached_insert_sql(self, column_names: tuple, value_sqls: tuple, data_sql: str, overwrite: bool, rows: int = 1) -> str:
+        return self._write_sql(
+            ('insert', column_names, value_sqls, data_sql, overwrite, rows),
+            lambda: self._store._insert_sql(
+                self._name,
+                overwrite=overwrite,
+                column_names=column_names,
+                column_value_sqls=list(value_sqls),
+                data_sql=data_sql,
+                rows=rows,
+            ),
+        )
+
+    def _save_new_sql(self, serialized_traitable: dict, overwrite: bool) -> tuple[str, list, list, dict, str]:
+        """(INSERT SQL, binds, RETURNING columns, TS fields, ``_id``) for :meth:`save_new`."""
         id_val, rev, ts_fields, col_specs, data_sql, data_params = self._prepare_write(serialized_traitable | {_REV: 1})
-        column_names = list(col_specs)
-        value_sqls = [vs for vs, _ in col_specs.values()]
+        column_names = tuple(col_specs)
+        value_sqls = tuple(vs for vs, _ in col_specs.values())
         col_params = [p for _, ps in col_specs.values() for p in ps]
+        sql = self._cached_insert_sql(column_names, value_sqls, data_sql, overwrite)
+        return sql, [id_val, rev, *col_params, *data_params], [_ID, _REV, *column_names, _DATA], ts_fields, id_val
+
+    def save_new(self, serialized_traitable: dict, overwrite: bool = False) -> dict:
+        sql, params, ret_cols, ts_fields, id_val = self._save_new_sql(serialized_traitable, overwrite)
         try:
-            rows = self._execute(
-                self._store._insert_sql(
-                    self._name,
-                    overwrite=overwrite,
-                    column_names=column_names,
-                    column_value_sqls=value_sqls,
-                    data_sql=data_sql,
-                ),
-                [id_val, rev, *col_params, *data_params],
-            )
+            rows = self._execute(sql, params)
         except Exception as e:
             self._store._handle_insert_error(e, self._name, id_val)
             raise
         assert rows, f'{type(self).__name__}.save_new: INSERT returned no row for {_ID}={id_val!r}'
-        return self._hydrate([_ID, _REV, *column_names, _DATA], rows[0], ts_fields)
+        return self._hydrate(ret_cols, rows[0], ts_fields)
 
-    def save(self, serialized_traitable: dict) -> dict:
-        rev = serialized_traitable[_REV]
-        if rev == 0:
-            return self.save_new(serialized_traitable)
+    def save_new_many(self, serialized_traitables: Sequence[dict], overwrite: bool = False) -> list[dict]:
+        """Multi-row ``INSERT ... VALUES (...), (...) RETURNING`` per column layout.
 
-        undef = next((k[1:] for k in serialized_traitable if k.startswith('$')), None)
-        if undef:
+        Documents sharing a column set (and TS stamping SQL) go into one statement, chunked
+        to :attr:`IbisStore.s_max_bind_params`. A chunk is also cut at a repeated ``_id`` so
+        ``overwrite`` never asks one statement to upsert the same row twice.
+        """
+        results: list[dict | None] = [None] * len(serialized_traitables)
+        layouts: dict[tuple, list] = {}
+        for i, serialized_traitable in enumerate(serialized_traitables):
+            id_val, rev, ts_fields, col_specs, data_sql, data_params = self._prepare_write(serialized_traitable | {_REV: 1})
+            layout = (tuple(col_specs), tuple(vs for vs, _ in col_specs.values()), data_sql)
+            col_params = [p for _, ps in col_specs.values() for p in ps]
+            layouts.setdefault(layout, []).append((i, id_val, ts_fields, [id_val, rev, *col_params, *data_params]))
+
+        for (column_names, value_sqls, data_sql), rows in layouts.items():
+            for chunk in self._chunks(rows):
+                self._insert_rows(column_names, value_sqls, data_sql, chunk, overwrite, results)
+        return results
+
+    def _chunks(self, rows: list) -> Iterable[list]:
+        """``(index, _id, …, binds)`` rows cut into statements within :attr:`IbisStore.s_max_bind_params`, and at a repeated ``_id``."""
+        max_params = self._store.s_max_bind_params
+        per_row = len(rows[0][-1])
+        chunk: list = []
+        chunk_ids: set = set()
+        for row in rows:
+            if chunk and (row[1] in chunk_ids or (len(chunk) + 1) * per_row > max_params):
+                yield chunk
+                chunk, chunk_ids = [], set()
+            chunk.append(row)
+            chunk_ids.add(row[1])
+        if chunk:
+            yield chunk
+
+    def _insert_rows(self, column_names: tuple, value_sqls: tuple, data_sql: str, rows: list, overwrite: bool, results: list) -> None:
+        """Run one multi-row INSERT and hydrate ``results`` by ``_id`` (RETURNING row order is not guaranteed)."""
+        try:
+            returned = self._execute(
+                self._cached_insert_sql(column_names, value_sqls, data_sql, overwrite, rows=len(rows)),
+                [p for *_, params in rows for p in params],
+            )
+        except Exception as e:
+            self._store._handle_insert_error(e, self._name, rows[0][1] if len(rows) == 1 else [id_val for _, id_val, *_ in rows])
+            raise
+        ret_cols = [_ID, _REV, *column_names, _DATA]
+        by_id = {row[0]: row for row in returned}
+        for i, id_val, ts_fields, _ in rows:
+            assert id_val in by_id, f'{type(self).__name__}.save_new_many: INSERT returned no row for {_ID}={id_val!r}'
+            results[i] = self._hydrate(ret_cols, by_id[id_val], ts_fields)
+
+    @staticmethod
+    def _require_defined(serialized_traitable: dict) -> None:
+        if undef := next((k[1:] for k in serialized_traitable if k.startswith('$')), None):
             raise RuntimeError(f'Use of undefined variable: {undef}')
 
+    def _save_sql(self, serialized_traitable: dict) -> _SaveSql:
+        self._require_defined(serialized_traitable)
         id_val, rev, ts_fields, col_specs, data_sql, data_params = self._prepare_write(dict(serialized_traitable))
 
         # Apply new values only when something actually changes (chg in WHERE).
         # Binds once for SET and once for the change predicate — not per CASE column.
+        value_sqls = tuple(vs for vs, _ in col_specs.values())
+        update_sql, select_sql = self._write_sql(('update', tuple(col_specs), value_sqls, data_sql), lambda: self._update_sql(col_specs, data_sql))
+        col_params = [p for spec in col_specs.values() for p in spec[1]]
+        new_vals = [*col_params, *data_params]
+        return _SaveSql(update_sql, [*new_vals, id_val, rev, *new_vals], select_sql, [id_val, rev], [_REV, _DATA, *col_specs], ts_fields, id_val, rev)
+
+    def _saved(self, stmt: _SaveSql, rows: list, updated: bool) -> dict:
+        """Result of :meth:`save` from the UPDATE rows (``updated``), else from the no-op/conflict SELECT rows."""
+        return self._saved_row(stmt.ret_cols, rows[0] if rows else None, stmt.id_val, stmt.rev, stmt.ts_fields, updated)
+
+    def _saved_row(self, columns: Sequence[str], row: tuple | None, id_val: str, rev: int, ts_fields: dict, updated: bool) -> dict:
+        if row is None:
+            raise RuntimeError(f'Revision conflict saving {id_val}: rev {rev} no longer current')
+        result = self._hydrate(columns, row, ts_fields)
+        assert result[_REV] == rev + updated
+        return result
+
+    def save(self, serialized_traitable: dict) -> dict:
+        if serialized_traitable[_REV] == 0:
+            return self.save_new(serialized_traitable)
+
+        stmt = self._save_sql(serialized_traitable)
         # UPDATE + no-op/conflict SELECT must be atomic: nest in a store transaction
         # when the caller is not already inside one (e.g. non-history StorableHelper).
+        with self._store.transaction():
+            if rows := self._execute(stmt.update_sql, stmt.update_params):
+                return self._saved(stmt, rows, updated=True)
+
+            # No row updated: either nothing changed (same rev) or optimistic-lock conflict.
+            return self._saved(stmt, self._execute(stmt.select_sql, stmt.select_params), updated=False)
+
+    def _update_sql(self, col_specs: dict, data_sql: str) -> tuple[str, str]:
+        """(optimistic-lock ``UPDATE ... RETURNING``, no-op/conflict ``SELECT``) for :meth:`save`."""
         set_clauses = [f'{_REV} = {_REV} + 1', *(f'"{c}" = {vs}' for c, (vs, _) in col_specs.items()), f'{_DATA} = ({data_sql})']
         chg = ' OR '.join((*(f'"{c}" IS DISTINCT FROM {vs}' for c, (vs, _) in col_specs.items()), f'{_DATA} IS DISTINCT FROM ({data_sql})'))
-        ret_cols = [_REV, _DATA, *col_specs]
         returning = ', '.join([_REV, _DATA, *(f'"{c}"' for c in col_specs)])
-        col_params = [p for spec in col_specs.values() for p in spec[1]]
-        new_vals = [*col_params, *data_params]
+        qname = self._qname()
+        return (
+            f'UPDATE {qname} SET {", ".join(set_clauses)} WHERE {_ID} = ? AND {_REV} = ? AND ({chg}) RETURNING {returning}',
+            f'SELECT {returning} FROM {qname} WHERE {_ID} = ? AND {_REV} = ?',
+        )
 
-        with self._store.transaction():
-            rows = self._execute(
-                f'UPDATE {self._qname()} SET {", ".join(set_clauses)} WHERE {_ID} = ? AND {_REV} = ? AND ({chg}) RETURNING {returning}',
-                [*new_vals, id_val, rev, *new_vals],
-            )
-            if rows:
-                result = self._hydrate(ret_cols, rows[0], ts_fields)
-                assert result[_REV] == rev + 1
-                return result
+    def _update_many_sql(self, column_names: tuple, value_sqls: tuple, data_sql: str, rows: int) -> str:
+        """Optimistic-lock ``UPDATE ... FROM (VALUES ...) RETURNING`` of ``rows`` documents for :meth:`save_many`.
 
-            # No row updated: either nothing changed (same rev) or optimistic-lock conflict.
-            rows = self._execute(
-                f'SELECT {returning} FROM {self._qname()} WHERE {_ID} = ? AND {_REV} = ?',
-                [id_val, rev],
-            )
-            if not rows:
-                raise RuntimeError(f'Revision conflict saving {id_val}: rev {rev} no longer current')
-            result = self._hydrate(ret_cols, rows[0], ts_fields)
-            assert result[_REV] == rev
-            return result
+        Each ``VALUES`` entry is cast to its column's type: unlike an INSERT target, a ``VALUES`` list gives
+        the driver no column to infer bind types from. The ``WHERE`` mirrors :meth:`_update_sql` per row.
+        """
+        store = self._store
+        cols = self._collection_columns()
+
+        def _cast(sql: str, ddl: str | None) -> str:
+            return f'CAST({sql} AS {ddl})' if ddl else sql
+
+        value_exprs = [
+            _cast('?', 'VARCHAR'),
+            _cast('?', 'INTEGER'),
+            *(_cast(vs, store.s_ddl_types.get(cols.get(c))) for c, vs in zip(column_names, value_sqls, strict=True)),
+            _cast(data_sql, store.s_data_ddl_type),
+        ]
+        quoted = [f'"{c}"' for c in column_names]
+        set_clauses = [f'{_REV} = t.{_REV} + 1', *(f'{c} = v.{c}' for c in quoted), f'{_DATA} = v.{_DATA}']
+        chg = ' OR '.join((*(f't.{c} IS DISTINCT FROM v.{c}' for c in quoted), f't.{_DATA} IS DISTINCT FROM v.{_DATA}'))
+        returning = ', '.join(f't.{c}' for c in (_ID, _REV, _DATA, *quoted))
+        values_sql = ', '.join([f'({", ".join(value_exprs)})'] * rows)
+        return (
+            f'UPDATE {self._qname()} AS t SET {", ".join(set_clauses)} FROM (VALUES {values_sql}) AS v({", ".join((_ID, _REV, *quoted, _DATA))})'
+            f' WHERE t.{_ID} = v.{_ID} AND t.{_REV} = v.{_REV} AND ({chg}) RETURNING {returning}'
+        )
+
+    def save_many(self, serialized_traitables: Sequence[dict]) -> list[dict]:
+        """New documents (``_rev == 0``) go through :meth:`save_new_many`; updates are one multi-row
+        ``UPDATE ... FROM (VALUES ...) RETURNING`` per column layout, all in one transaction.
+
+        Updates not returned are told apart by one ``SELECT`` per statement, as in :meth:`save`: a document
+        still at its revision is unchanged, anything else is a revision conflict.
+        """
+        results: list[dict | None] = [None] * len(serialized_traitables)
+        new_idx = []
+        layouts: dict[tuple, list] = {}
+        for i, serialized_traitable in enumerate(serialized_traitables):
+            if serialized_traitable[_REV] == 0:
+                new_idx.append(i)
+                continue
+
+            self._require_defined(serialized_traitable)
+            id_val, rev, ts_fields, col_specs, data_sql, data_params = self._prepare_write(dict(serialized_traitable))
+            layout = (tuple(col_specs), tuple(vs for vs, _ in col_specs.values()), data_sql)
+            col_params = [p for _, ps in col_specs.values() for p in ps]
+            layouts.setdefault(layout, []).append((i, id_val, rev, ts_fields, [id_val, rev, *col_params, *data_params]))
+
+        with self._store.transaction():
+            if new_idx:
+                for i, result in zip(new_idx, self.save_new_many([serialized_traitables[i] for i in new_idx]), strict=True):
+                    results[i] = result
+            for (column_names, value_sqls, data_sql), rows in layouts.items():
+                for chunk in self._chunks(rows):
+                    self._update_rows(column_names, value_sqls, data_sql, chunk, results)
+        return results
+
+    def _update_rows(self, column_names: tuple, value_sqls: tuple, data_sql: str, rows: list, results: list) -> None:
+        """Run one multi-row UPDATE and hydrate ``results`` by ``_id``, reading back the rows it left alone."""
+        sql = self._write_sql(
+            ('update_many', column_names, value_sqls, data_sql, len(rows)),
+            lambda: self._update_many_sql(column_names, value_sqls, data_sql, len(rows)),
+        )
+        ret_cols = [_ID, _REV, _DATA, *column_names]
+        updated = {row[0]: row for row in self._execute(sql, [p for *_, params in rows for p in params])}
+        current = {}
+        if skipped := [id_val for _, id_val, *_ in rows if id_val not in updated]:
+            returning = ', '.join((_ID, _REV, _DATA, *(f'"{c}"' for c in column_names)))
+            binds = ', '.join('?' * len(skipped))
+            current = {row[0]: row for row in self._execute(f'SELECT {returning} FROM {self._qname()} WHERE {_ID} IN ({binds})', skipped)}
+
+        for i, id_val, rev, ts_fields, _ in rows:
+            if (row := updated.get(id_val)) is not None:
+                results[i] = self._saved_row(ret_cols, row, id_val, rev, ts_fields, updated=True)
+            else:
+                row = current.get(id_val)
+                results[i] = self._saved_row(ret_cols, row if row is not None and row[1] == rev else None, id_val, rev, ts_fields, updated=False)
 
     def delete(self, id_value: str) -> bool:
         if not self._collection_columns():
@@ -292,6 +481,23 @@ class IbisCollection(TsCollection):
         rows = self._execute(f'DELETE FROM {self._qname()} WHERE {_ID} = ? RETURNING {_ID}', [id_value])
         return len(rows) > 0
 
+    def delete_many(self, id_values: Sequence[str]) -> int:
+        """``DELETE ... WHERE _id IN (...)``, chunked to :attr:`IbisStore.s_max_bind_params`."""
+        id_values = list(id_values)
+        if not id_values:
+            return 0
+        if not self._collection_columns():
+            self._store._forget_collection_columns(self._name)  # -- see delete()
+            if not self._collection_columns():
+                return 0
+        deleted = 0
+        step = self._store.s_max_bind_params
+        for start in range(0, len(id_values), step):
+            chunk = id_values[start : start + step]
+            binds = ', '.join('?' * len(chunk))
+            deleted += len(self._execute(f'DELETE FROM {self._qname()} WHERE {_ID} IN ({binds}) RETURNING {_ID}', chunk))
+        return deleted
+
     def create_index(self, name: str, trait_name: str | list[tuple[str, int]], **index_args) -> str:
         # Index DDL is dialect-specific; the store owns it so a store can override
         # indexing wholesale (JSON-path indexes, or a no-op on schemaless stores).
@@ -314,31 +520,78 @@ class IbisCollection(TsCollection):
             return False
         return t.filter(t._id == id_value).count().to_polars() > 0
 
-    def find(self, query: FilterExpr = None, _at_most: int = 0, _order: dict = None) -> Iterable:
+    def _filtered_table(self, query: FilterExpr = None):
+        """Ibis table narrowed by ``query``, or None if the collection has no table."""
         if (t := self._ibis_table_or_none()) is None:
-            return
+            return None
         if query is not None:
             pred = query.ibis(ibis_collection=self)
             if pred is not None:
                 t = t.filter(pred)
+        return t
+
+    def _order_by(self, _order: dict) -> list:
+        return [col.asc() if d >= 0 else col.desc() for f, d in _order.items() for col in self._ibis_order_cols(f)]
+
+    def _select_fields(self, t, _fields: Sequence[str]) -> tuple:
+        """Project ``t`` on ``_id`` + ``_fields``: columns as they are, blob keys as JSON text (see :meth:`_stream`)."""
+        cols = self._collection_columns()
+        names = [name for name in dict.fromkeys(_fields) if name != _ID]
+        blob_fields = [name for name in names if name not in cols]
+        json_type = self._store.s_json_type
+        t = t.select(
+            t[_ID], *(t[name] for name in names if name in cols), **{name: t[_DATA].cast(json_type)[name].cast('string') for name in blob_fields}
+        )
+        return t, blob_fields
+
+    def _decode_found(self, columns: Sequence[str], row: tuple, blob_fields: Sequence[str] = ()) -> dict:
+        doc = self._decode_row(columns, row)
+        for name in blob_fields:
+            if name in doc:
+                doc[name] = json.loads(doc[name])
+        return doc
+
+    def _stream(self, t, _batch_size: int = 0, blob_fields: Sequence[str] = ()) -> Iterable:
+        for cols, rows in self._store._scan(t, _batch_size or self._store.s_find_batch_size):
+            for row in rows:
+                yield self._decode_found(cols, row, blob_fields)
+
+    def _find_table(self, query: FilterExpr = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> tuple | None:
+        """(ibis table, blob fields to JSON-decode) for :meth:`find`, or None if the collection has no table."""
+        if (t := self._filtered_table(query)) is None:
+            return None
         if _order:
-            t = t.order_by([col.asc() if d >= 0 else col.desc() for f, d in _order.items() for col in self._ibis_order_cols(f)])
+            t = t.order_by(self._order_by(_order))
         if _at_most > 0:
             t = t.limit(_at_most)
-        df = t.to_polars()
-        if df.is_empty():
+        if _fields is not None:
+            return self._select_fields(t, _fields)
+        return t, ()
+
+    def find(self, query: FilterExpr = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None, _batch_size: int = 0) -> Iterable:
+        """Stream matching documents, ``_batch_size`` rows at a time (default :attr:`IbisStore.s_find_batch_size`).
+
+        ``_fields`` selects the named columns and extracts the rest from the ``_data`` blob server-side.
+        """
+        if (found := self._find_table(query, _at_most, _order, _fields)) is None:
             return
-        cols = df.columns
-        for row in df.iter_rows():
-            yield self._decode_row(cols, row)
+        t, blob_fields = found
+        yield from self._stream(t, _batch_size, blob_fields)
+
+    def find_latest(self, query: FilterExpr = None, _group_by: str = None, _latest: dict = None, _at_most: int = 0) -> Iterable:
+        """``ROW_NUMBER() OVER (PARTITION BY _group_by ORDER BY _latest)`` - only the first row of each partition is read."""
+        if (t := self._filtered_table(query)) is None:
+            return
+        rn = ibis.row_number().over(group_by=self._ibis_col(_group_by), order_by=self._order_by(_latest or {}))
+        t = t.mutate(_latest_rn=rn).filter(ibis._._latest_rn == 0).drop('_latest_rn')
+        t = t.order_by(self._order_by({_group_by: 1}))
+        if _at_most > 0:
+            t = t.limit(_at_most)
+        yield from self._stream(t)
 
     def count(self, query: FilterExpr = None) -> int:
-        if (t := self._ibis_table_or_none()) is None:
+        if (t := self._filtered_table(query)) is None:
             return 0
-        if query is not None:
-            pred = query.ibis(ibis_collection=self)
-            if pred is not None:
-                t = t.filter(pred)
         return t.count().to_polars()
 
     def max(self, trait_name: str, filter: FilterExpr = None) -> dict | None:
@@ -351,6 +604,91 @@ class IbisCollection(TsCollection):
             return doc
         return None
 
+    def aio(self) -> AsyncTsCollection:
+        return AsyncIbisCollection(self) if self._store.s_async_driver else super().aio()
+
+
+class AsyncIbisCollection(AsyncTsCollection):
+    """Native async access to an :class:`IbisCollection` whose store has an async driver (see :attr:`IbisStore.s_async_driver`).
+
+    Statements and row fetches run on the store's async connections. Query plans still need the table
+    schema from the synchronous backend, so they are built on a worker thread. Inside a store transaction
+    every call falls back to the threaded facade.
+    """
+
+    collection: IbisCollection
+
+    def _in_transaction(self) -> bool:
+        return self.collection._store.current_transaction() is not None
+
+    async def find(self, query: FilterExpr = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> AsyncIterator[dict]:
+        if self._in_transaction():
+            async for doc in super().find(query, _at_most=_at_most, _order=_order, _fields=_fields):
+                yield doc
+            return
+
+        coll = self.collection
+        if (found := await asyncio.to_thread(coll._find_table, query, _at_most, _order, _fields)) is None:
+            return
+        t, blob_fields = found
+        async for cols, rows in coll._store._ascan(t, self.s_batch_size):
+            for row in rows:
+                yield coll._decode_found(cols, row, blob_fields)
+
+    async def load(self, id_value: str) -> dict | None:
+        async for doc in self.find(f(**{_ID: id_value}), _at_most=1):
+            return doc
+        return None
+
+    async def count(self, query: FilterExpr = None) -> int:
+        if self._in_transaction():
+            return await super().count(query)
+
+        if (t := await asyncio.to_thread(self.collection._filtered_table, query)) is None:
+            return 0
+        store = self.collection._store
+        rows = await store._aexecute(str(store._ibis_con.compile(t.count())))
+        return rows[0][0]
+
+    async def id_exists(self, id_value: str) -> bool:
+        return await self.count(f(**{_ID: id_value})) > 0
+
+    async def save_new(self, serialized_traitable: dict, overwrite: bool = False) -> dict:
+        if self._in_transaction():
+            return await super().save_new(serialized_traitable, overwrite=overwrite)
+
+        coll = self.collection
+        sql, params, ret_cols, ts_fields, id_val = coll._save_new_sql(serialized_traitable, overwrite)
+        try:
+            rows = await coll._store._aexecute(sql, params)
+        except Exception as e:
+            coll._store._handle_insert_error(e, coll._name, id_val)
+            raise
+        assert rows, f'{type(self).__name__}.save_new: INSERT returned no row for {_ID}={id_val!r}'
+        return coll._hydrate(ret_cols, rows[0], ts_fields)
+
+    async def save(self, serialized_traitable: dict) -> dict:
+        if serialized_traitable[_REV] == 0:
+            return await self.save_new(serialized_traitable)
+
+        if self._in_transaction():
+            return await super().save(serialized_traitable)
+
+        coll = self.collection
+        store = coll._store
+        stmt = coll._save_sql(serialized_traitable)
+        async with store._atransaction() as con:  # -- see IbisCollection.save
+            if rows := await store._aexecute(stmt.update_sql, stmt.update_params, con=con):
+                return coll._saved(stmt, rows, updated=True)
+            return coll._saved(stmt, await store._aexecute(stmt.select_sql, stmt.select_params, con=con), updated=False)
+
+    async def delete(self, id_value: str) -> bool:
+        coll = self.collection
+        if self._in_transaction() or not coll._collection_columns():
+            return await super().delete(id_value)  # -- incl. re-verifying a cached missing table, see IbisCollection.delete
+        rows = await coll._store._aexecute(f'DELETE FROM {coll._qname()} WHERE {_ID} = ? RETURNING {_ID}', [id_value])
+        return len(rows) > 0
+
 
 class IbisStore(TsStore):
     """Abstract base for ibis-backed stores (DuckDB, Postgres, …).
@@ -369,6 +707,8 @@ class IbisStore(TsStore):
         date: 'DATE',
         bytes: 'VARCHAR',
     }
+    # DDL type of the ``_data`` column (Postgres: JSONB).
+    s_data_ddl_type: str = 'VARCHAR'
 
     # JSON field → typed ibis expr (filter LHS on blob path).
     json_caster_map = {
@@ -390,6 +730,17 @@ class IbisStore(TsStore):
     # Postgres overrides with ``binary=True`` so ibis emits JSONB, whose equality is semantic.
     s_json_type = ibis_dtypes.JSON()
 
+    # Max bind parameters per statement (multi-row INSERT chunking). Postgres' wire protocol
+    # counts binds in an Int16, hence 65535; DuckDB has no hard limit but shares the default.
+    s_max_bind_params: int = 65535
+
+    # Rows per Arrow record batch read by :meth:`IbisCollection.find`; bounds peak memory of a scan.
+    s_find_batch_size: int = 10_000
+
+    # True when the dialect implements :meth:`_aexecute` / :meth:`_atransaction` / :meth:`_ascan` on an
+    # asyncio driver; :meth:`IbisCollection.aio` then goes native instead of running on worker threads.
+    s_async_driver: bool = False
+
     # Max UTF-8 bytes for physical table/index identifiers (``None`` = unlimited).
     # Postgres sets 63 (NAMEDATALEN - 1); DuckDB leaves unlimited.
     s_max_ident_bytes: int | None = None
@@ -438,6 +789,19 @@ class IbisStore(TsStore):
     @abc.abstractmethod
     def _execute(self, sql: str, params: list = ()) -> list[tuple]: ...
 
+    async def _aexecute(self, sql: str, params: list = (), con=None) -> list[tuple]:
+        """Async :meth:`_execute`, on ``con`` (from :meth:`_atransaction`) or a connection of its own."""
+        raise NotImplementedError(f'{type(self).__name__} has no async driver')
+
+    def _atransaction(self):
+        """Async context manager: a connection inside a transaction, committed on exit."""
+        raise NotImplementedError(f'{type(self).__name__} has no async driver')
+
+    async def _ascan(self, table, batch_size: int) -> AsyncIterator[tuple[list[str], Iterable[tuple]]]:
+        """Async :meth:`_scan`."""
+        raise NotImplementedError(f'{type(self).__name__} has no async driver')
+        yield
+
     def _fit_ident(self, raw: str, *, prefix: str, tail_from: str | None = None) -> str:
         """Return ``raw`` if within :attr:`s_max_ident_bytes`, else a stable hashed identifier.
 
@@ -468,9 +832,20 @@ class IbisStore(TsStore):
         return self._fit_ident(f'i_{safe_phys}__{safe_name}', prefix='i', tail_from=safe_name)
 
     def _prepare_ibis_table(self, table):
-        """Dialect hook before ibis→polars scans (e.g. cast JSONB ``_data`` to string)."""
+        """Dialect hook before ibis scans (e.g. cast JSONB ``_data`` to string)."""
         return table
 
+    def _scan(self, table, batch_size: int) -> Iterable[tuple[list[str], Iterable[tuple]]]:
+        """``(columns, rows)`` per batch of ``table``, read lazily ``batch_size`` rows at a time."""
+        with table.to_pyarrow_batches(chunk_size=batch_size) as reader:
+            for batch in reader:
+                yield batch.schema.names, self._arrow_rows(batch)
+
+    @staticmethod
+    def _arrow_rows(batch) -> Iterable[tuple]:
+        """Row tuples of an Arrow record batch (column-wise ``to_pylist``, then transposed)."""
+        return zip(*(col.to_pylist() for col in batch.columns), strict=True)
+
     def _ibis_table(self, collection_name: str):
         """Logical collection name → ibis Table (physical name + :meth:`_prepare_ibis_table`)."""
         phys = self._physical_table_name(collection_name)
@@ -496,11 +871,18 @@ class IbisStore(TsStore):
         column_names: Iterable[str],
         column_value_sqls: list[str],
         data_sql: str = '?',
+        rows: int = 1,
     ) -> str:
-        """Dialect-specific INSERT (or INSERT OR REPLACE) with RETURNING (always includes ``_data``)."""
+        """Dialect-specific INSERT (or INSERT OR REPLACE) with RETURNING (always includes ``_data``).
 
-    def _handle_insert_error(self, exc: BaseException, collection_name: str, id_val: str) -> None:
-        """Map dialect constraint errors to :class:`TsDuplicateKeyError`; re-raise otherwise."""
+        ``rows`` repeats the ``VALUES`` tuple for a multi-row insert (binds are row-major).
+        """
+
+    def _handle_insert_error(self, exc: BaseException, collection_name: str, id_val: str | list[str]) -> None:
+        """Map dialect constraint errors to :class:`TsDuplicateKeyError`; re-raise otherwise.
+
+        ``id_val`` is a list for a multi-row insert, where the dialect error does not say which row clashed.
+        """
         raise exc
 
     @abc.abstractmethod
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import weakref
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any
 
 from core_10x.global_cache import cache
@@ -7,19 +10,20 @@ from core_10x.nucleus import Nucleus
 from core_10x.trait_definition import T
 from core_10x.ts_store import (
     TS_FIELDS_TAG,
+    AsyncTsCollection,
     TsCollection,
     TsDuplicateKeyError,
     TsStore,
     standard_key,
 )
 from py10x_infra import MongoCollectionHelper
-from pymongo import MongoClient, ReturnDocument
+from pymongo import AsyncMongoClient, InsertOne, MongoClient, ReturnDocument, UpdateOne
 from pymongo.common import TIMEOUT_OPTIONS
-from pymongo.errors import ConnectionFailure, DuplicateKeyError, OperationFailure, ServerSelectionTimeoutError
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError, OperationFailure, ServerSelectionTimeoutError
 from pymongo.uri_parser import parse_uri as pymongo_parse_uri
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import AsyncIterator, Callable, Iterable, Mapping, Sequence
     from datetime import datetime
 
     from core_10x.ts_store import f
@@ -29,6 +33,7 @@ if TYPE_CHECKING:
 _REV = Nucleus.REVISION_TAG()
 _TS_TIME = T.TS_TIME.value()
 _TS_USER = T.TS_USER.value()
+_DUPLICATE_KEY_CODE = 11000
 
 
 class MongoCollection(TsCollection):
@@ -56,7 +61,7 @@ class MongoCollection(TsCollection):
         if not ts_fields:
             res = self.coll.update_one(filter, update, upsert=upsert, **self._session_kw())
             assert res.acknowledged, f'{self.coll} update_one not acknowledged'
-            return {_REV: rev + int(res.matched_count == 1 and res.modified_count == 1)}, res.matched_count
+            return self._update_result(res, rev)
 
         doc = self.coll.find_one_and_update(
             filter,
@@ -65,6 +70,14 @@ class MongoCollection(TsCollection):
             return_document=ReturnDocument.AFTER,
             **self._session_kw(),
         )
+        return self._updated_doc_result(doc, rev, ts_fields)
+
+    @staticmethod
+    def _update_result(res, rev: int) -> tuple[dict, int]:
+        return {_REV: rev + int(res.matched_count == 1 and res.modified_count == 1)}, res.matched_count
+
+    @staticmethod
+    def _updated_doc_result(doc: dict | None, rev: int, ts_fields: dict) -> tuple[dict, int]:
         if not doc:
             return {_REV: rev}, 0
         new_rev = doc[_REV]
@@ -77,14 +90,30 @@ class MongoCollection(TsCollection):
     def id_exists(self, id_value: str) -> bool:
         return self.coll.count_documents({self.s_id_tag: id_value}, **self._session_kw()) > 0
 
-    def find(self, query: f = None, _at_most: int = 0, _order: dict = None) -> Iterable:
-        cursor = self.coll.find(query.prefix_notation() if query else {}, **self._session_kw())
+    def _find_args(self, query: f, _fields: Sequence[str] | None) -> tuple[dict, dict | None]:
+        projection = None if _fields is None else dict.fromkeys(_fields, 1) or {self.s_id_tag: 1}
+        return query.prefix_notation() if query else {}, projection
+
+    def find(self, query: f = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> Iterable:
+        cursor = self.coll.find(*self._find_args(query, _fields), **self._session_kw())
         if _order:
             cursor = cursor.sort(list(_order.items()))
         if _at_most:
             cursor = cursor.limit(_at_most)
         return cursor
 
+    def find_latest(self, query: f = None, _group_by: str = None, _latest: dict = None, _at_most: int = 0) -> Iterable:
+        pipeline = [
+            {'$match': query.prefix_notation() if query else {}},
+            {'$sort': {_group_by: 1, **(_latest or {})}},
+            {'$group': {'_id': f'${_group_by}', 'doc': {'$first': '$$ROOT'}}},
+            {'$replaceRoot': {'newRoot': '$doc'}},
+            {'$sort': {_group_by: 1}},
+        ]
+        if _at_most:
+            pipeline.append({'$limit': _at_most})
+        return self.coll.aggregate(pipeline, allowDiskUse=True, **self._session_kw())
+
     def count(self, query: f = None) -> int:
         return self.coll.count_documents(query.prefix_notation() if query else {}, **self._session_kw())
 
@@ -94,6 +123,14 @@ class MongoCollection(TsCollection):
         doc |= {field: self.store.auth_user() for field, kind in ts_fields.items() if kind == _TS_USER}
         return doc, ts_fields, doc[self.s_id_tag]
 
+    def _save_new_update(self, doc: dict, ts_fields: dict, id_value, overwrite: bool) -> tuple[dict, list]:
+        """Filter and pipeline for an upserting :meth:`save_new` (overwrite and/or server-stamped TS fields)."""
+        rev_tag = _REV
+        return (
+            {self.s_id_tag: id_value} if overwrite else {self.s_id_tag: id_value, rev_tag: {'$exists': False}},
+            [{'$replaceWith': {'$literal': doc}}, *({'$set': {field: '$$NOW'}} for field, kind in ts_fields.items() if kind == _TS_TIME)],
+        )
+
     def save_new(self, serialized_traitable: dict, overwrite: bool = False) -> dict:
         doc, ts_fields, id_value = self._prepare_to_save(serialized_traitable)
         rev_tag = _REV
@@ -107,19 +144,86 @@ class MongoCollection(TsCollection):
                 assert res.acknowledged, f'{self.coll} insert_one not acknowledged for {self.s_id_tag}={id_value!r}'
                 return {rev_tag: 1}
 
-            result, _matched = self._apply_update(
-                {self.s_id_tag: id_value} if overwrite else {self.s_id_tag: id_value, rev_tag: {'$exists': False}},
-                [{'$replaceWith': {'$literal': doc}}, *({'$set': {field: '$$NOW'}} for field, kind in ts_fields.items() if kind == _TS_TIME)],
-                upsert=True,
-                rev=1,
-                ts_fields=ts_fields,
-            )
+            filter, pipeline = self._save_new_update(doc, ts_fields, id_value, overwrite)
+            result, _matched = self._apply_update(filter, pipeline, upsert=True, rev=1, ts_fields=ts_fields)
         except DuplicateKeyError as e:
             raise TsDuplicateKeyError(self.collection_name(), {self.s_id_tag: id_value}) from e
 
         result[rev_tag] = 1
         return result
 
+    def _bulk_write(self, requests: list, id_values: list):
+        """Ordered ``bulk_write``; a duplicate key is reported for the document that caused it."""
+        try:
+            res = self.coll.bulk_write(requests, ordered=True, **self._session_kw())
+        except BulkWriteError as e:
+            dup = next((err for err in e.details.get('writeErrors', ()) if err.get('code') == _DUPLICATE_KEY_CODE), None)
+            if dup is not None:
+                raise TsDuplicateKeyError(self.collection_name(), {self.s_id_tag: id_values[dup['index']]}) from e
+            raise
+        assert res.acknowledged, f'{self.coll} bulk_write not acknowledged'
+        return res
+
+    def _read_back(self, id_values: list, fields: Iterable[str]) -> dict:
+        """``id → {_rev, fields...}`` for documents just written (one query, projected)."""
+        projection = dict.fromkeys((_REV, *fields), 1)
+        return {doc[self.s_id_tag]: doc for doc in self.coll.find({self.s_id_tag: {'$in': id_values}}, projection, **self._session_kw())}
+
+    def _bulk_write_and_read_back(
+        self, requests: list, id_values: list, read_ids: list, fields: Iterable[str], check: Callable | None = None
+    ) -> tuple:
+        """:meth:`_bulk_write` and :meth:`_read_back` in one transaction, so a concurrent writer can't change what is read back.
+
+        ``check(res, read)`` runs before the commit - an exception it raises aborts the write.
+        Without transaction support the write is committed before the check runs.
+        """
+        with self.store.transaction() if self.store.supports_transactions() else nullcontext():
+            res = self._bulk_write(requests, id_values)
+            read = self._read_back(read_ids, fields) if read_ids else {}
+            if check:
+                check(res, read)
+            return res, read
+
+    def save_new_many(self, serialized_traitables: Sequence[dict], overwrite: bool = False) -> list[dict]:
+        """One ``bulk_write`` for all documents; server-stamped TS fields are read back in one projected query."""
+        if not serialized_traitables:
+            return []
+
+        if not self.store.supports_transactions() and any(serialized_traitable.get(TS_FIELDS_TAG) for serialized_traitable in serialized_traitables):
+            # -- server-stamped fields can only be read back atomically per document
+            return [self.save_new(serialized_traitable, overwrite) for serialized_traitable in serialized_traitables]
+
+        rev_tag = _REV
+        prepared = [self._prepare_to_save(serialized_traitable) for serialized_traitable in serialized_traitables]
+        requests = []
+        for doc, ts_fields, id_value in prepared:
+            doc[rev_tag] = 1
+            if not ts_fields and not overwrite:
+                requests.append(InsertOne(doc))
+            else:
+                requests.append(UpdateOne(*self._save_new_update(doc, ts_fields, id_value, overwrite), upsert=True))
+
+        id_values = [id_value for _, _, id_value in prepared]
+        ts_ids = [id_value for _, ts_fields, id_value in prepared if ts_fields]
+        if ts_ids:
+            _, stamped = self._bulk_write_and_read_back(requests, id_values, ts_ids, {field for _, ts_fields, _ in prepared for field in ts_fields})
+        else:
+            self._bulk_write(requests, id_values)
+            stamped = {}
+        results = []
+        for _, ts_fields, id_value in prepared:
+            doc = stamped.get(id_value, {})
+            results.append({rev_tag: 1, **{f: v for f in ts_fields if (v := doc.get(f, doc)) is not doc}})
+        return results
+
+    def _save_update(self, doc: dict, ts_fields: dict) -> tuple[dict, list]:
+        """Filter and pipeline for an optimistic-lock :meth:`save` of an existing document."""
+        filter = {}
+        pipeline = []
+        MongoCollectionHelper.prepare_filter_and_pipeline(doc, filter, pipeline)
+        pipeline.extend({'$set': {field: '$$NOW'}} for field, kind in ts_fields.items() if kind == _TS_TIME)
+        return filter, pipeline
+
     def save(self, serialized_traitable: dict) -> dict:
         revision = serialized_traitable.get(_REV, -1)
         assert revision >= 0, 'revision must be >= 0'
@@ -128,11 +232,7 @@ class MongoCollection(TsCollection):
             return self.save_new(serialized_traitable)
 
         doc, ts_fields, id_value = self._prepare_to_save(serialized_traitable)
-
-        filter = {}
-        pipeline = []
-        MongoCollectionHelper.prepare_filter_and_pipeline(doc, filter, pipeline)
-        pipeline.extend({'$set': {field: '$$NOW'}} for field, kind in ts_fields.items() if kind == _TS_TIME)
+        filter, pipeline = self._save_update(doc, ts_fields)
         result, matched = self._apply_update(filter, pipeline, upsert=False, rev=revision, ts_fields=ts_fields)
 
         if not matched:  # -- e.g. restore from deleted
@@ -140,10 +240,63 @@ class MongoCollection(TsCollection):
 
         return result
 
+    def save_many(self, serialized_traitables: Sequence[dict]) -> list[dict]:
+        """New documents go through :meth:`save_new_many`; updates are one ordered ``bulk_write`` plus one projected read-back of ``_rev``/TS fields.
+
+        Each updated document must be read back at its old or next revision. The update write and its read-back run in one
+        transaction which a failed check aborts; on a deployment without transactions the check only reports the failure.
+        """
+        results: list[dict | None] = [None] * len(serialized_traitables)
+        new_idx = []
+        updates = []  # -- (index, revision, id_value, ts_fields)
+        requests = []
+        for i, serialized_traitable in enumerate(serialized_traitables):
+            revision = serialized_traitable.get(_REV, -1)
+            assert revision >= 0, 'revision must be >= 0'
+            if revision == 0:
+                new_idx.append(i)
+                continue
+
+            doc, ts_fields, id_value = self._prepare_to_save(serialized_traitable)
+            requests.append(UpdateOne(*self._save_update(doc, ts_fields), upsert=False))
+            updates.append((i, revision, id_value, ts_fields))
+
+        if new_idx:
+            for i, result in zip(new_idx, self.save_new_many([serialized_traitables[i] for i in new_idx]), strict=True):
+                results[i] = result
+
+        if updates:
+            id_values = [id_value for _, _, id_value, _ in updates]
+
+            def check(res, saved: dict):
+                missing = [id_value for id_value in id_values if id_value not in saved]
+                if res.matched_count != len(updates) or missing:
+                    raise AssertionError(f'{self.coll} {missing} has been most probably inappropriately restored from deleted')
+
+                stale = [id_value for _, revision, id_value, _ in updates if saved[id_value][_REV] not in (revision, revision + 1)]
+                if stale:
+                    raise AssertionError(f'{self.coll} {stale} has been saved concurrently')
+
+            _, saved = self._bulk_write_and_read_back(
+                requests, id_values, id_values, {field for *_, ts_fields in updates for field in ts_fields}, check
+            )
+            for i, _, id_value, ts_fields in updates:
+                doc = saved[id_value]
+                results[i] = {_REV: doc[_REV], **{f: v for f in ts_fields if (v := doc.get(f, doc)) is not doc}}
+
+        return results
+
     def delete(self, id_value: str) -> bool:
         q = {self.s_id_tag: id_value}
         return self.coll.delete_one(q, **self._session_kw()).acknowledged
 
+    def delete_many(self, id_values: Sequence[str]) -> int:
+        if not id_values:
+            return 0
+        res = self.coll.delete_many({self.s_id_tag: {'$in': list(id_values)}}, **self._session_kw())
+        assert res.acknowledged, f'{self.coll} delete_many not acknowledged'
+        return res.deleted_count
+
     def create_index(self, name: str, trait_name: str | list[tuple[str, int]], **index_args) -> str | None:
         """Create index. When inside a transaction, defers to run on commit (MongoDB disallows createIndex in txn)."""
         tx = self.store.current_transaction()
@@ -183,6 +336,111 @@ class MongoCollection(TsCollection):
 
         return None
 
+    def aio(self) -> AsyncTsCollection:
+        if self.store.connect_args is None:
+            return super().aio()  # -- store built around a ready client: no way to open an async one
+        return AsyncMongoCollection(self)
+
+
+class AsyncMongoCollection(AsyncTsCollection):
+    """Native :class:`~pymongo.AsyncMongoClient` access to a :class:`MongoCollection`.
+
+    Inside a store transaction (a synchronous session) every call falls back to the threaded facade.
+    """
+
+    collection: MongoCollection
+
+    def __init__(self, collection: MongoCollection):
+        super().__init__(collection)
+        store = collection.store
+        self.acoll = store.async_client()[store.db_name()][collection.collection_name()]
+
+    def _in_transaction(self) -> bool:
+        return self.collection.store.current_transaction() is not None
+
+    async def find(self, query: f = None, _at_most: int = 0, _order: dict = None, _fields: Sequence[str] = None) -> AsyncIterator[dict]:
+        if self._in_transaction():
+            async for doc in super().find(query, _at_most=_at_most, _order=_order, _fields=_fields):
+                yield doc
+            return
+
+        cursor = self.acoll.find(*self.collection._find_args(query, _fields), batch_size=self.s_batch_size)
+        if _order:
+            cursor = cursor.sort(list(_order.items()))
+        if _at_most:
+            cursor = cursor.limit(_at_most)
+        async for doc in cursor:
+            yield doc
+
+    async def load(self, id_value: str) -> dict | None:
+        if self._in_transaction():
+            return await super().load(id_value)
+        return await self.acoll.find_one({MongoCollection.s_id_tag: id_value})
+
+    async def id_exists(self, id_value: str) -> bool:
+        if self._in_transaction():
+            return await super().id_exists(id_value)
+        return await self.acoll.count_documents({MongoCollection.s_id_tag: id_value}) > 0
+
+    async def count(self, query: f = None) -> int:
+        if self._in_transaction():
+            return await super().count(query)
+        return await self.acoll.count_documents(query.prefix_notation() if query else {})
+
+    async def _apply_update(self, filter: dict, update: list, *, upsert: bool, rev: int, ts_fields: dict) -> tuple[dict, int]:
+        if not ts_fields:
+            res = await self.acoll.update_one(filter, update, upsert=upsert)
+            assert res.acknowledged, f'{self.acoll} update_one not acknowledged'
+            return MongoCollection._update_result(res, rev)
+
+        doc = await self.acoll.find_one_and_update(filter, update, upsert=upsert, return_document=ReturnDocument.AFTER)
+        return MongoCollection._updated_doc_result(doc, rev, ts_fields)
+
+    async def save_new(self, serialized_traitable: dict, overwrite: bool = False) -> dict:
+        if self._in_transaction():
+            return await super().save_new(serialized_traitable, overwrite=overwrite)
+
+        coll = self.collection
+        doc, ts_fields, id_value = coll._prepare_to_save(serialized_traitable)
+        doc[_REV] = 1
+        try:
+            if not ts_fields and not overwrite:
+                res = await self.acoll.insert_one(doc)
+                assert res.acknowledged, f'{self.acoll} insert_one not acknowledged for {coll.s_id_tag}={id_value!r}'
+                return {_REV: 1}
+
+            filter, pipeline = coll._save_new_update(doc, ts_fields, id_value, overwrite)
+            result, _matched = await self._apply_update(filter, pipeline, upsert=True, rev=1, ts_fields=ts_fields)
+        except DuplicateKeyError as e:
+            raise TsDuplicateKeyError(coll.collection_name(), {coll.s_id_tag: id_value}) from e
+
+        result[_REV] = 1
+        return result
+
+    async def save(self, serialized_traitable: dict) -> dict:
+        revision = serialized_traitable.get(_REV, -1)
+        assert revision >= 0, 'revision must be >= 0'
+
+        if revision == 0:
+            return await self.save_new(serialized_traitable)
+
+        if self._in_transaction():
+            return await super().save(serialized_traitable)
+
+        doc, ts_fields, id_value = self.collection._prepare_to_save(serialized_traitable)
+        filter, pipeline = self.collection._save_update(doc, ts_fields)
+        result, matched = await self._apply_update(filter, pipeline, upsert=False, rev=revision, ts_fields=ts_fields)
+
+        if not matched:  # -- e.g. restore from deleted
+            raise AssertionError(f'{self.acoll} {id_value} has been most probably inappropriately restored from deleted')
+
+        return result
+
+    async def delete(self, id_value: str) -> bool:
+        if self._in_transaction():
+            return await super().delete(id_value)
+        return (await self.acoll.delete_one({MongoCollection.s_id_tag: id_value})).acknowledged
+
 
 class MongoStore(TsStore, resource_name = 'MONGO_DB'):
     ADMIN           = 'admin'
@@ -196,6 +454,8 @@ class MongoStore(TsStore, resource_name = 'MONGO_DB'):
     )
 
     s_cached_connections: dict[tuple, MongoClient] = {}
+    # -- an AsyncMongoClient is bound to the event loop it first ran on, so async clients are cached per loop
+    s_cached_async_connections: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, AsyncMongoClient]] = weakref.WeakKeyDictionary()
 
     class Transaction(TsStore.Transaction):
         def __init__(self, store: MongoStore):
@@ -250,6 +510,16 @@ class MongoStore(TsStore, resource_name = 'MONGO_DB'):
 
         return client
 
+    @classmethod
+    def async_connect(cls, hostname: str, username: str, password: str, **kwargs) -> AsyncMongoClient:
+        """Async client for the running event loop, cached like :meth:`connect`. Connects lazily, on first use."""
+        clients = cls.s_cached_async_connections.setdefault(asyncio.get_running_loop(), {})
+        connection_key = standard_key((hostname, username), kwargs)
+        client = clients.get(connection_key)
+        if not client:
+            client = clients[connection_key] = AsyncMongoClient(hostname, username=username, password=password, **kwargs)
+        return client
+
     @classmethod
     def uncache_connection(cls, hostname: str, username: str, password: str, **kwargs):
         connection_key = standard_key((hostname, username), kwargs)
@@ -263,7 +533,8 @@ class MongoStore(TsStore, resource_name = 'MONGO_DB'):
         client = cls.connect(hostname, username, password, **kwargs)
         if not dbname:
             dbname = cls.DEFAULT_DB_NAME
-        return cls(client, client[dbname], username)
+        connect_args = dict(hostname=hostname, username=username, password=password, **{k: v for k, v in kwargs.items() if not k.startswith('_')})
+        return cls(client, client[dbname], username, connect_args=connect_args)
 
     @classmethod
     def parse_uri(cls, uri: str) -> dict:
@@ -292,11 +563,16 @@ class MongoStore(TsStore, resource_name = 'MONGO_DB'):
         except Exception as e:
             raise ValueError(f'Invalid URI = {uri}') from e
 
-    def __init__(self, client: MongoClient, db: Database, username: str):
+    def __init__(self, client: MongoClient, db: Database, username: str, connect_args: dict | None = None):
         super().__init__()
         self.client = client
         self.db: Database = db
         self.username = username
+        self.connect_args = connect_args  # -- what :meth:`connect` was given, to open the matching async client
+        self._supports_transactions: bool | None = None
+
+    def async_client(self) -> AsyncMongoClient:
+        return self.async_connect(**self.connect_args)
 
     def collection_names(self, regexp: str = None) -> list:
         filter = dict(name={'$regex': regexp}) if regexp else None
@@ -307,11 +583,13 @@ class MongoStore(TsStore, resource_name = 'MONGO_DB'):
 
     def supports_transactions(self) -> bool:
         """True if this MongoDB deployment supports multi-document transactions (replica set or mongos)."""
-        try:
-            res = self.client.admin.command('ismaster')
-            return 'setName' in res or res.get('msg') == 'isdbgrid'
-        except Exception:
-            return False
+        if self._supports_transactions is None:
+            try:
+                res = self.client.admin.command('ismaster')
+                self._supports_transactions = 'setName' in res or res.get('msg') == 'isdbgrid'
+            except Exception:
+                return False
+        return self._supports_transactions
 
     def delete_collection(self, collection_name: str) -> bool:
         self.db.drop_collection(collection_name)
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import getpass
 import json
 import socket
 import ssl
 import struct
+import threading
+import uuid
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING
 from urllib.parse import parse_qs
 
@@ -31,21 +38,65 @@ _PG_SSL_REQUEST_CODE = 80877103
 _PG_AUTH_OK = 0
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable, Iterator
     from datetime import datetime
 
 
+class _ThreadConnection:
+    """Stands in for the ibis backend's connection: a thread inside a pooled transaction gets its leased one."""
+
+    __slots__ = ('_base', '_local')
+
+    def __init__(self, base: psycopg.Connection, local: threading.local):
+        self._base = base
+        self._local = local
+
+    def __getattr__(self, name: str):
+        return getattr(getattr(self._local, 'con', None) or self._base, name)
+
+
+class _LeasedConnection:
+    """A pooled transaction's connection: it belongs to the thread that began the transaction."""
+
+    __slots__ = ('_con', '_owner')
+
+    def __init__(self, con: psycopg.Connection):
+        self._con = con
+        self._owner = threading.get_ident()
+
+    def check_thread(self) -> None:
+        assert threading.get_ident() == self._owner, "a transaction's connection may only be used by the thread that began the transaction"
+
+    def __getattr__(self, name: str):
+        self.check_thread()
+        return getattr(self._con, name)
+
+
 class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
     """PostgreSQL-backed Ibis traitable store.
 
     ``TS_USER`` is stamped from the **server session user** (``current_user``), not the
     Resource username used only for connecting. ``_data`` is stored as JSONB so blob
     keys can be expression-indexed later.
+
+    ``pool_size`` (URI param, default 0) > 0 runs raw statements and scans on a pool of up to
+    that many connections instead of the single shared one: each statement leases a connection
+    for its duration, a transaction for its whole life, so threads run (and commit) independently.
+    Transactions are then tracked per thread. Ibis-compiled reads (count, max, …) outside a
+    transaction still share the backend's own connection. A transaction's connection has thread
+    affinity: using it from any other thread (e.g. resuming a ``find`` generator started inside the
+    transaction there) fails an assertion.
+
+    :meth:`IbisCollection.aio` runs on psycopg's async driver: a ``psycopg_pool.AsyncConnectionPool``
+    per event loop, sized ``pool_size`` (or :attr:`s_async_pool_size` when unpooled).
     """
 
     SSLMODE_TAG = 'sslmode'
+    POOL_SIZE_TAG = 'pool_size'
 
     s_with_auth = False
+    s_async_driver = True
+    s_async_pool_size = 10
     s_supports_add_column_if_not_exists = True
     # NAMEDATALEN is 64 → 63 usable bytes; long class-id / #history names must not collide.
     s_max_ident_bytes = 63
@@ -56,12 +107,14 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
     # JSONB, not JSON: ibis then emits jsonb casts, whose equality is *semantic* (key order and
     # spacing insensitive). Text comparison could never match — jsonb renormalizes on write.
     s_json_type = ibis_dtypes.JSON(binary=True)
+    s_data_ddl_type = 'JSONB'
     s_instance_kwargs_map = IbisStore.s_instance_kwargs_map | {
         Resource.HOSTNAME_TAG: (Resource.HOSTNAME_TAG, 'localhost'),
         Resource.PORT_TAG: (Resource.PORT_TAG, 5432),
         Resource.DBNAME_TAG: (Resource.DBNAME_TAG, 'postgres'),
         Resource.SSL_TAG: (Resource.SSL_TAG, False),
         SSLMODE_TAG: (SSLMODE_TAG, None),
+        POOL_SIZE_TAG: (POOL_SIZE_TAG, 0),
     }
 
     @classmethod
@@ -72,6 +125,8 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
         if not query:
             return kwargs
         qs = parse_qs(query, keep_blank_values=True)
+        if pool_size := (qs.get(cls.POOL_SIZE_TAG) or [None])[0]:
+            kwargs[cls.POOL_SIZE_TAG] = int(pool_size)
         raw = (qs.get(cls.SSLMODE_TAG) or qs.get(cls.SSL_TAG) or [None])[0]
         if raw is None:
             return kwargs
@@ -93,6 +148,10 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
     def __init__(self, hostname=None, dbname=None, username=None, password=None, **kwargs):
         # libpq-only; must be set before ``IbisStore.__init__`` opens the connection.
         self.sslmode = kwargs.get(self.SSLMODE_TAG)
+        self.pool_size = int(kwargs.get(self.POOL_SIZE_TAG) or 0)
+        self._pool = None  # -- psycopg_pool.ConnectionPool when pool_size > 0 (see _ibis_connect)
+        self._async_pools = weakref.WeakKeyDictionary()  # -- event loop -> psycopg_pool.AsyncConnectionPool (see _async_pool)
+        self._local = threading.local()  # -- per thread: leased connection and transaction stack (pooled only)
         self._auth_user: str | None = None  # -- lazily resolved SQL current_user (see auth_user)
         super().__init__(hostname=hostname, dbname=dbname, username=username, password=password, **kwargs)
 
@@ -110,11 +169,129 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
         mode = self.sslmode or ('require' if self.ssl else None)
         if mode:
             connect_kw[self.SSLMODE_TAG] = mode
+        if self.pool_size > 0:
+            # -- the ibis backend keeps its own connection; inside a transaction it resolves to the leased one
+            from psycopg_pool import ConnectionPool
+
+            self._pool = ConnectionPool(kwargs=self._pool_connect_kwargs(connect_kw), min_size=1, max_size=self.pool_size, open=True)
+            backend = ibis.postgres.connect(**connect_kw)
+            backend.con = _ThreadConnection(backend.con, self._local)
+            return backend
         return ibis.postgres.connect(**connect_kw)
 
     @staticmethod
+    def _pool_connect_kwargs(connect_kw: dict) -> dict:
+        """ibis connect kwargs → psycopg ``connect()`` kwargs for pooled connections."""
+        return {('dbname' if k == 'database' else k): v for k, v in connect_kw.items() if v is not None}
+
+    async def _async_pool(self):
+        """The running event loop's async pool (a pool's connections and workers belong to one loop)."""
+        loop = asyncio.get_running_loop()
+        if (pool := self._async_pools.get(loop)) is None:
+            from psycopg_pool import AsyncConnectionPool
+
+            connect_kw = {
+                'host': self.hostname,
+                'port': self.port,
+                'database': self.dbname,
+                'user': self.username,
+                'password': self.password,
+                'autocommit': True,
+                self.SSLMODE_TAG: self.sslmode or ('require' if self.ssl else None),
+            }
+            max_size = self.pool_size or self.s_async_pool_size
+            pool = self._async_pools[loop] = AsyncConnectionPool(
+                kwargs=self._pool_connect_kwargs(connect_kw), min_size=1, max_size=max_size, open=False
+            )
+        await pool.open()  # -- no-op once open; a concurrent first caller waits here until it is
+        return pool
+
+    async def _aexecute(self, sql: str, params: list = (), con=None) -> list[tuple]:
+        if con is None:
+            async with (await self._async_pool()).connection() as pooled:
+                return await self._aexecute(sql, params, pooled)
+        async with con.cursor() as cur:
+            await cur.execute(self._pg_sql(sql), list(params) if params else None)
+            if cur.description is None:
+                return []
+            return await cur.fetchall()
+
+    @asynccontextmanager
+    async def _atransaction(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        async with (await self._async_pool()).connection() as con, con.transaction():
+            yield con
+
+    async def _ascan(self, table, batch_size: int) -> AsyncIterator[tuple[list[str], Iterable[tuple]]]:
+        # -- see _scan
+        async with (await self._async_pool()).connection() as con, con.cursor(name=f'find_{uuid.uuid4().hex}', withhold=True) as cur:
+            await cur.execute(str(self._ibis_con.compile(table)))
+            cols = [d.name for d in cur.description]
+            while rows := await cur.fetchmany(batch_size):
+                yield cols, rows
+
+    # -- with a pool, each thread has its own transaction stack (TsStore keeps one per store)
+    @property
+    def _active_transactions(self) -> deque:
+        if self._pool is None:
+            return self._shared_transactions
+        local = self._local
+        if (transactions := getattr(local, 'transactions', None)) is None:
+            transactions = local.transactions = deque()
+        return transactions
+
+    @_active_transactions.setter
+    def _active_transactions(self, transactions: deque) -> None:
+        self._shared_transactions = transactions
+
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg.Connection]:
+        """The connection to run a statement on: the shared one, the thread's transaction lease, or a pooled one."""
+        if self._pool is None:
+            yield self._con
+        elif (con := getattr(self._local, 'con', None)) is not None:
+            yield con
+        else:
+            with self._pool.connection() as con:
+                yield con
+
+    class Transaction(IbisStore.Transaction):
+        """Pooled: holds one connection from BEGIN to COMMIT/ROLLBACK for its thread."""
+
+        def __init__(self, store: PostgresStore):
+            self.store = store  # -- before BEGIN, so a failed BEGIN can still release the lease
+            self._leased = store._pool is not None and store.current_transaction() is None
+            if self._leased:
+                store._local.con = _LeasedConnection(store._pool.getconn())
+            try:
+                super().__init__(store)
+            except BaseException:
+                self._release()
+                raise
+
+        def _release(self) -> None:
+            if self._leased:
+                self._leased = False
+                local = self.store._local
+                con = local.con
+                del local.con
+                self.store._pool.putconn(con._con)
+
+        def _do_commit(self) -> None:
+            try:
+                super()._do_commit()
+            finally:
+                self._release()
+
+        def _do_abort(self) -> None:
+            try:
+                super()._do_abort()
+            finally:
+                self._release()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _rewrite_qmark_binds(sql: str) -> str:
-        """Replace bind ``?`` with ``%s``.
+        """Replace bind ``?`` with ``%s`` (memoized: write SQL repeats verbatim, see :meth:`IbisCollection._write_sql`).
 
         Leaves ``?`` inside single-quoted literals alone, and does not touch JSONB
         ``?|`` / ``?&`` operators. Bare JSONB ``?`` (key existence) still collides with
@@ -158,16 +335,30 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
         return self._rewrite_qmark_binds(sql)
 
     def _execute(self, sql: str, params: list = ()) -> list[tuple]:
-        with self._con.cursor() as cur:
+        with self._connection() as con, con.cursor() as cur:
             cur.execute(self._pg_sql(sql), list(params) if params else None)
             if cur.description is None:
                 return []
             return cur.fetchall()
 
+    def _scan(self, table, batch_size: int) -> Iterable[tuple[list[str], Iterable[tuple]]]:
+        # Server-side cursor: rows come over the wire ``batch_size`` at a time. WITH HOLD lets it
+        # outlive the implicit transaction of an autocommit statement, and other statements may
+        # run on the connection between fetches (unlike a DuckDB result stream).
+        # Pooled: the connection stays leased until the scan is exhausted or closed.
+        with self._connection() as con, con.cursor(name=f'find_{uuid.uuid4().hex}', withhold=True) as cur:
+            cur.itersize = batch_size
+            cur.execute(str(self._ibis_con.compile(table)))
+            cols = [d.name for d in cur.description]
+            while rows := cur.fetchmany(batch_size):
+                yield cols, rows
+                if isinstance(con, _LeasedConnection):
+                    con.check_thread()  # -- the cursor is on the transaction's connection, which the next fetch uses
+
     def _create_table_if_not_exists(self, collection_name: str) -> None:
         # JSONB (not TEXT): enables expression indexes on blob keys; empty blob is '{}'::jsonb.
         self._execute(
-            f'CREATE TABLE IF NOT EXISTS {self._qname(collection_name)} ({_ID} VARCHAR PRIMARY KEY, {_REV} INTEGER NOT NULL, {_DATA} JSONB NOT NULL)'
+            f'CREATE TABLE IF NOT EXISTS {self._qname(collection_name)} ({_ID} VARCHAR PRIMARY KEY, {_REV} INTEGER NOT NULL, {_DATA} {self.s_data_ddl_type} NOT NULL)'
         )
         literal = collection_name.replace("'", "''")
         self._execute(f"COMMENT ON TABLE {self._qname(collection_name)} IS '{literal}'")
@@ -200,6 +391,7 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
         column_names: Iterable[str],
         column_value_sqls: list[str],
         data_sql: str = '?',
+        rows: int = 1,
     ) -> str:
         col_names = list(column_names)
         assert len(col_names) == len(column_value_sqls), (
@@ -212,15 +404,15 @@ class PostgresStore(IbisStore, resource_name='POSTGRES_DB'):
             return c if c in (_ID, _REV, _DATA) else f'"{c}"'
 
         col_sql = ', '.join(_col_sql(c) for c in cols)
-        values_sql = ', '.join(value_exprs)
+        values_sql = ', '.join([f'({", ".join(value_exprs)})'] * rows)
         qname = self._qname(collection_name)
-        insert = f'INSERT INTO {qname} ({col_sql}) VALUES ({values_sql})'
+        insert = f'INSERT INTO {qname} ({col_sql}) VALUES {values_sql}'
         if overwrite:
             set_parts = [f'{_col_sql(c)} = EXCLUDED.{_col_sql(c)}' for c in cols if c != _ID]
             insert = f'{insert} ON CONFLICT ({_ID}) DO UPDATE SET {", ".join(set_parts)}'
         return f'{insert} RETURNING {col_sql}'
 
-    def _handle_insert_error(self, exc: BaseException, collection_name: str, id_val: str) -> None:
+    def _handle_insert_error(self, exc: BaseException, collection_name: str, id_val: str | list[str]) -> None:
         if isinstance(exc, UniqueViolation):
             raise TsDuplicateKeyError(collection_name, {_ID: id_val}) from exc
         raise exc
@@ -146,6 +146,21 @@ def test_duplicate_key_raises(collection):
         collection.save_new({'_id': 'x', 'pad': 2})
 
 
+def test_write_sql_is_cached(collection, monkeypatch):
+    """Same layout, same SQL text: built once per collection, whatever the values."""
+    built = []
+    insert_sql = collection._store._insert_sql
+    monkeypatch.setattr(collection._store, '_insert_sql', lambda *a, **kw: built.append(kw) or insert_sql(*a, **kw))
+    for i in range(3):
+        collection.save_new({'_id': f'x{i}', 'pad': i})
+    assert len(built) == 1
+
+    saved = [collection.save({'_id': f'x{i}', '_rev': 1, 'pad': 10 + i}) for i in range(3)]
+    assert [doc['_rev'] for doc in saved] == [2, 2, 2]
+    assert len([key for key in collection._sql_cache if key[0] == 'update']) == 1
+    assert sorted(doc['pad'] for doc in collection.find()) == [10, 11, 12]
+
+
 def test_json_structure_filter_matches_stored_blob(collection):
     """EQ/NE/IN on a JSON object or array, compared as the dialect's native JSON type.
 
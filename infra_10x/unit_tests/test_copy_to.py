@@ -250,3 +250,20 @@ class TestCopyTo:
         assert from_coll.copy_to(to_coll)
         assert to_coll.count() == 2
         assert to_coll.load('a')['age'] == 30
+
+    def test_collection_to_collection_batched(self):
+        """Small batches; a batch clashing with an existing key falls back to per-document, skipping it."""
+        store = DuckDbStore()
+        src_name, dst_name = f'bcopy_src_{uuid6.uuid7().hex}', f'bcopy_dst_{uuid6.uuid7().hex}'
+        from_coll = store.collection(src_name, CopyPerson.s_dir)
+        from_coll.save_new_many([{'_id': name, 'name': name, 'age': age} for age, name in enumerate('abcde')])
+        to_coll = store.collection(dst_name, CopyPerson.s_dir)
+        to_coll.save_new({'_id': 'c', 'name': 'kept', 'age': 99})
+        try:
+            assert from_coll.copy_to(to_coll, batch_size=2)
+            assert to_coll.count() == 5
+            assert to_coll.load('c')['name'] == 'kept'
+            assert to_coll.load('e')['age'] == 4
+        finally:
+            store.delete_collection(src_name)
+            store.delete_collection(dst_name)
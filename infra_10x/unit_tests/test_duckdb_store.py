@@ -212,3 +212,39 @@ def test_extend_trait_dir_unions_and_promotes(store_kind, supports_add_column, m
         assert coll.load('w')['howl_pitch'] == 7
         assert coll.load('b')['den'] == 'cave'
     store.delete_collection(coll_name)
+
+
+def test_find_in_batches_survives_writes_while_iterating():
+    """``find`` yields across batch boundaries in order, and a save mid-scan does not cut it short."""
+    store = DuckDbStore()
+    name = f'batched_{uuid6.uuid7().hex}'
+    coll = store.collection(name, _Pad.s_dir)
+    coll.save_new_many([{'_id': f'{i}', 'pad': i} for i in range(5)])
+    seen = []
+    for doc in coll.find(_order={'pad': 1}, _batch_size=2):
+        seen.append(doc['pad'])
+        coll.save_new({'_id': f'x{doc["pad"]}', 'pad': 100})
+    assert seen == [0, 1, 2, 3, 4]
+    assert coll.count() == 10
+    store.delete_collection(name)
+
+
+def test_save_many_updates_in_one_statement(monkeypatch):
+    """Updates share one ``UPDATE ... FROM (VALUES ...)``; unchanged rows keep their revision, stale ones conflict."""
+    store = DuckDbStore()
+    name = f'save_many_{uuid6.uuid7().hex}'
+    coll = store.collection(name, _Pad.s_dir)
+    coll.save_new_many([{'_id': f'{i}', 'pad': i} for i in range(2)])
+    execute = store._execute
+    executed = []
+    monkeypatch.setattr(store, '_execute', lambda sql, params=(): executed.append(sql) or execute(sql, params))
+
+    docs = [{'_id': '0', '_rev': 1, 'pad': 10, 'n': 'x'}, {'_id': '1', '_rev': 1, 'pad': 1}, {'_id': '2', '_rev': 0, 'pad': 2}]
+    assert coll.save_many(docs) == [{'_rev': 2}, {'_rev': 1}, {'_rev': 1}]
+    assert sum(sql.startswith('UPDATE') for sql in executed) == 1
+    assert coll.load('0') == {'_id': '0', '_rev': 2, 'pad': 10, 'n': 'x'}
+
+    with pytest.raises(RuntimeError, match='Revision conflict'):
+        coll.save_many([{'_id': '1', '_rev': 1, 'pad': 11}, {'_id': '0', '_rev': 1, 'pad': 11}])
+    assert [coll.load(id_val)['pad'] for id_val in '01'] == [10, 1]
+    store.delete_collection(name)
@@ -8,6 +8,8 @@ import os
 import socket
 import ssl
 import struct
+import threading
+import types
 from contextlib import nullcontext
 from datetime import datetime  # used as runtime trait data_type
 
@@ -22,7 +24,7 @@ from core_10x.ts_store import TsStore
 from core_10x.ts_store_type import TS_STORE_TYPE
 from dev_10x.postgres_local import PASSWORD_AUTH_PASSWORD, PASSWORD_AUTH_PORT
 from infra_10x.ibis_store import _DATA, _ID, _REV
-from infra_10x.postgres_store import _PG_AUTH_OK, PostgresStore
+from infra_10x.postgres_store import _PG_AUTH_OK, PostgresStore, _LeasedConnection
 from infra_10x.unit_tests.conftest import TEST_TS_STORE
 
 
@@ -332,6 +334,64 @@ def test_parse_uri_sslmode_and_ibis_connect_kwargs(monkeypatch):
     assert PostgresStore.SSLMODE_TAG not in captured
 
 
+def test_parse_uri_pool_size():
+    assert PostgresStore.parse_uri('postgresql://h:5432/db?pool_size=8')[PostgresStore.POOL_SIZE_TAG] == 8
+    assert PostgresStore.POOL_SIZE_TAG not in PostgresStore.parse_uri('postgresql://h:5432/db?sslmode=require')
+    assert PostgresStore.translate_kwargs({})[PostgresStore.POOL_SIZE_TAG] == 0
+
+
+def test_pooled_transactions_are_per_thread(postgres_store):
+    """Each thread's transaction runs on its own leased connection and commits or rolls back alone."""
+    uri = test_databases.test_uri(TEST_TS_STORE.POSTGRESQL.name)
+    store = TsStore.instance_from_uri(f'{uri}?pool_size=4', _cache=False)
+    assert isinstance(store, PostgresStore) and store.pool_size == 4
+    coll = store.collection(f'pool_{uuid6.uuid7().hex}')
+    coll.save_new({_ID: 'seed', _REV: 0})
+    barrier = threading.Barrier(2)
+    errors = []
+
+    def worker(n: int):
+        try:
+            with store.transaction() as tx:
+                coll.save_new({_ID: f'w{n}', _REV: 0})
+                barrier.wait(timeout=10)  # -- both transactions are open at once
+                assert coll.id_exists(f'w{n}')
+                if n:
+                    tx.abort()
+        except Exception as e:  # noqa: BLE001 -- reported by the main thread
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    try:
+        assert not errors
+        assert store.current_transaction() is None
+        assert sorted(d[_ID] for d in coll.find()) == ['seed', 'w0']
+    finally:
+        store.delete_collection(coll.collection_name())
+
+
+def test_leased_connection_has_thread_affinity():
+    """A transaction's connection is usable only by the thread that began the transaction."""
+    con = _LeasedConnection(types.SimpleNamespace(closed=False))
+    assert con.closed is False
+    errors = []
+
+    def foreign():
+        try:
+            con.closed  # noqa: B018
+        except AssertionError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=foreign)
+    t.start()
+    t.join()
+    assert len(errors) == 1
+
+
 def test_startup_probe_ssl_wrap_failure_tries_vault(monkeypatch):
     """Post-TCP SSL negotiation failure → (True, True) so vault is tried."""
 
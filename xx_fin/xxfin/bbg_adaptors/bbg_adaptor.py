@@ -19,6 +19,10 @@ class BbgAdaptor(MktDataAdaptorSingleQuote, provider_name='BBG'):
         raw_value = cls.connector().quote(md_date, ticker)
         return cls.adjust_quote(raw_value)
 
+    @classmethod
+    def get_quotes(cls, md_date, tickers):
+        return {ticker: cls.adjust_quote(raw_value) for ticker, raw_value in cls.connector().quotes(md_date, tickers).items()}
+
 
 class BbgAdaptorIRFX(BbgAdaptor):
     SUFFIX = ' Curncy'
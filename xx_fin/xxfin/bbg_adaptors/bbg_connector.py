@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import TYPE_CHECKING
 
 from core_10x.traitable import T
 
 from xxfin.mkt_adaptor import MktDataConnector
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class DevBbgConnector(MktDataConnector):
     """In-memory ticker/date -> px_last lookup, for dev/test fixtures. No DB/network involved."""
@@ -15,6 +19,10 @@ class DevBbgConnector(MktDataConnector):
     def quote(self, md_date: date, ticker: str) -> float:
         return self.records.get((ticker, md_date), float('nan'))
 
+    def quotes(self, md_date: date, tickers: Sequence[str]) -> dict[str, float]:
+        records = self.records
+        return {ticker: records.get((ticker, md_date), float('nan')) for ticker in tickers}
+
 class LiveBbgConnector(MktDataConnector):
     """Real Bloomberg connector via xbbg (optional `bbg` extra). Import is lazy so this module
     stays importable without xbbg/blpapi installed."""
@@ -24,3 +32,11 @@ class LiveBbgConnector(MktDataConnector):
 
         df = blp.bdh(ticker, 'PX_LAST', start_date=md_date, end_date=md_date)
         return float(df.iloc[0, 0]) if not df.empty else float('nan')
+
+    def quotes(self, md_date: date, tickers: Sequence[str]) -> dict[str, float]:
+        """One bdh request for all tickers; its columns are (ticker, field) pairs, absent for tickers with no data."""
+        from xbbg import blp
+
+        tickers = list(dict.fromkeys(tickers))
+        df = blp.bdh(tickers, 'PX_LAST', start_date=md_date, end_date=md_date)
+        return {ticker: float(df[col].iloc[0]) if not df.empty and (col := (ticker, 'PX_LAST')) in df.columns else float('nan') for ticker in tickers}
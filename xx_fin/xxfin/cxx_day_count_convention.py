@@ -1,6 +1,8 @@
 from core_10x.named_constant import NamedConstant
 from cxxfin import BDayCountConvention
 
+from xxfin.py_day_count_convention import dc_fractions
+
 
 class DAY_COUNT_CONVENTION(NamedConstant, BDayCountConvention, symbols_from = BDayCountConvention):
     """
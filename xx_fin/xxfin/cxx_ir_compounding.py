@@ -2,6 +2,8 @@ from core_10x.named_constant import NamedConstant
 from cxxfin import BCompounding, BCompoundTransform
 from cxxfin import compounding_apply as _cxx_compounding_apply
 
+from xxfin.py_ir_compounding import compounding_apply_array
+
 
 class COMPOUNDING(NamedConstant, BCompounding, symbols_from=BCompounding):
     pass
@@ -1,11 +1,16 @@
+import os
 from collections.abc import Callable
 from datetime import date
+from pathlib import Path
 
+import numpy as np
 import QuantLib as ql
 from core_10x.global_cache import cache
 from core_10x.named_constant import NamedConstant
 from core_10x.trait_definition import T
-from xxcommon.xxcalendar import Calendar
+from xxcommon.xxcalendar import BizdayIndex, Calendar
+
+from xxfin.xxfin_env_vars import XXFinEnvVars
 
 
 # note: keys are bloomberg codes
@@ -43,18 +48,41 @@ class FinCalendar(Calendar):
 
     def non_working_days_get(self):
         try:
-            cal = self.ql_calendar
+            _ = self.ql_calendar    #-- combos and other non-QuantLib calendars are built by Calendar
         except Exception:
             return super().non_working_days_get()
 
-        def _gen():
-            d = ql.Date.from_date(self.start_date)
-            ed = ql.Date.from_date(self.end_date)
-            while d <= ed:
-                if not cal.isBusinessDay(d):
-                    yield d.to_date()
-                d += 1
+        return BizdayIndex.to_dates(self.ql_holiday_ordinals(self.ql_calendar_name, self.start_date, self.end_date))
+
+    @classmethod
+    @cache
+    def ql_holiday_ordinals(cls, ql_calendar_name: KNOWN_CALENDARS, start_date: date, end_date: date) -> np.ndarray:
+        """
+        Ordinals of QuantLib's non-working days from start_date through end_date, computed once per process.
+        With XXFIN_CALENDAR_CACHE_DIR set, they are also kept on disk per QuantLib version.
+        """
+        cache_dir = XXFinEnvVars.calendar_cache_dir
+        path = Path(cache_dir) / f'{ql_calendar_name.name}-{start_date:%Y%m%d}-{end_date:%Y%m%d}-ql{ql.__version__}.npy' if cache_dir else None
+        if path and path.exists():
+            return np.load(path)
+
+        cal = ql_calendar_name.value()
+        d = ql.Date.from_date(start_date)
+        ed = ql.Date.from_date(end_date)
+        ordinals = []
+        while d <= ed:
+            if not cal.isBusinessDay(d):
+                ordinals.append(d.to_date().toordinal())
+            d += 1
+        ordinals = np.array(ordinals, dtype = np.int64)
+
+        if path:
+            path.parent.mkdir(parents = True, exist_ok = True)
+            tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            with open(tmp, 'wb') as f:
+                np.save(f, ordinals)
+            os.replace(tmp, path)   #-- atomic: concurrent processes never see a partial file
 
-        return list(_gen())
+        return ordinals
 
 
@@ -47,13 +47,17 @@ class FXForwardCurveSimple(TenorBasedSyntheticCurve, mas_class = FxForwardCurveM
         fwd_data_definition = mao.quotable_stubs_by_class.get(FXForwardQuotable)
         forwards = {}
         quotables[FXForwardQuotable] = forwards
-        for stub in mao.create_quotable_stubs(FXForwardQuotable, fwd_data_definition, today):
+        dates = []
+        stubs = mao.create_quotable_stubs(FXForwardQuotable, fwd_data_definition, today)
+        for stub in stubs:
             tenor = stub['tenor']  ## stub does have tenor; trying to create FXForwardQuotable too early isn't good
             start_date = today if tenor.symbol() == '1B' else spot_date
             d = tenor.apply(start_date, cal, roll_rule)
             if d == spot_date:
                 raise AssertionError(f'{self.mkt_name} >>> {tenor.symbol()} <<< forward specification conflicts with spot rate')   ## TODO: may check before raising if the conflicting rate value is diff from the spot rate
-            quotable = FXForwardQuotable.existing_instance(**stub, **mkt_basis)
+            dates.append(d)
+
+        for d, quotable in zip(dates, FXForwardQuotable.existing_instances([{**stub, **mkt_basis} for stub in stubs]), strict = True):
             # tenor = quotable.tenor
             # start_date = today if tenor.symbol() == '1B' else spot_date
             # d = tenor.apply(start_date, cal, roll_rule)
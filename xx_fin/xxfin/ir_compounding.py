@@ -1,6 +1,6 @@
 from xxfin.xxfin_env_vars import XXFinEnvVars
 
 if XXFinEnvVars.use_cxxfin:
-    from xxfin.cxx_ir_compounding import COMPOUND_TRANSFORM, COMPOUNDING, compounding_apply
+    from xxfin.cxx_ir_compounding import COMPOUND_TRANSFORM, COMPOUNDING, compounding_apply, compounding_apply_array
 else:
-    from xxfin.py_ir_compounding import COMPOUND_TRANSFORM, COMPOUNDING, compounding_apply
+    from xxfin.py_ir_compounding import COMPOUND_TRANSFORM, COMPOUNDING, compounding_apply, compounding_apply_array
@@ -30,8 +30,8 @@ class ZeroRateCurve(TenorBasedSyntheticCurve, mas_class = IRZeroRateCurveMas):
         for quotable_class, data_definition in mao.quotable_stubs_by_class.items():
             quotable_by_date = {}
             result[quotable_class] = quotable_by_date
-            for stub in mao.create_quotable_stubs(quotable_class, data_definition, today):
-                quotable = quotable_class.existing_instance(**stub, **mkt_basis)
+            stubs = mao.create_quotable_stubs(quotable_class, data_definition, today)
+            for quotable in quotable_class.existing_instances([{**stub, **mkt_basis} for stub in stubs]):
                 tenor = quotable.tenor
                 start_date = today if tenor.symbol() == '1B' else spot_date
                 ed = tenor.apply(start_date, cal, roll_rule)
@@ -1,23 +1,53 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import date
 from typing import TYPE_CHECKING
 
+from core_10x.exec_control import BTP
 from core_10x.py_class import PyClass
 from core_10x.trait_filter import f
 from core_10x.traitable import Bundle, T
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from xxfin.mkt_quotable import SingleMktQuote
 
 
 class MktDataConnector(Bundle):
     provider_name: str = T(T.ID)
 
+    s_max_workers = 8   #-- threads used by the default quotes()
+
     def quote(self, md_date: date, ticker: str) -> float:
         raise NotImplementedError
 
+    def quotes(self, md_date: date, tickers: Sequence[str]) -> dict[str, float]:
+        """
+        Quotes of all tickers for md_date, by ticker. Connectors whose provider takes a list of tickers
+        override this to make one request; by default quote() runs for each distinct ticker on a thread pool
+        of at most s_max_workers threads.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if len(tickers) <= 1:
+            return {ticker: self.quote(md_date, ticker) for ticker in tickers}
+
+        btp = BTP.current()
+
+        def quote(ticker: str) -> float:
+            btp.begin_using()   #-- the pool threads read self in the caller's processor
+            try:
+                return self.quote(md_date, ticker)
+            finally:
+                btp.end_using()
+
+        with ThreadPoolExecutor(max_workers = min(self.s_max_workers, len(tickers))) as pool:
+            #-- map() yields the results in the order of tickers
+            return dict(zip(tickers, pool.map(quote, tickers), strict = True))
+
     @classmethod
     def connector(cls, provider_name: str) -> MktDataConnector:
         matches = cls.load_many(f(provider_name=provider_name))
@@ -45,6 +75,10 @@ class MktDataAdaptor:
     def fill(cls, quotable: SingleMktQuote) -> SingleMktQuote:
         raise NotImplementedError
 
+    @classmethod
+    def fill_many(cls, quotables: Iterable[SingleMktQuote]) -> list[SingleMktQuote]:
+        return [cls.fill(quotable) for quotable in quotables]
+
     @classmethod
     def connector(cls) -> MktDataConnector:
         assert cls.s_provider_name is not None, f'{cls}: provider_name must be specified'
@@ -70,9 +104,33 @@ class MktDataAdaptorSingleQuote(MktDataAdaptor):
     def get_quote(cls, md_date: date, ticker: str):
         raise NotImplementedError
 
+    @classmethod
+    def get_quotes(cls, md_date: date, tickers: Sequence[str]) -> dict[str, float]:
+        return {ticker: cls.get_quote(md_date, ticker) for ticker in tickers}
+
+    @classmethod
+    def fill_many(cls, quotables: Iterable[SingleMktQuote]) -> list[SingleMktQuote]:
+        """fill() for all quotables, with one get_quotes() request per md_date"""
+        quotables = list(quotables)
+        by_date = defaultdict(list)
+        for quotable in quotables:
+            by_date[quotable.md_date].append((quotable, cls.ticker(quotable)))
+
+        for md_date, batch in by_date.items():
+            quotes = cls.get_quotes(md_date, [ticker for _, ticker in batch])
+            for quotable, ticker in batch:
+                cls.fill_quote(quotable, quotes[ticker])
+
+        return quotables
+
     @classmethod
     def fill(cls, quotable: SingleMktQuote) -> SingleMktQuote:
         md_date = quotable.md_date
         ticker = cls.ticker(quotable)
-        quotable.quote = cls.get_quote(md_date, ticker)
+        return cls.fill_quote(quotable, cls.get_quote(md_date, ticker))
+
+    @classmethod
+    def fill_quote(cls, quotable: SingleMktQuote, quote: float) -> SingleMktQuote:
+        """Sets the fetched quote on quotable - shared by fill() and fill_many()"""
+        quotable.quote = quote
         return quotable
@@ -108,10 +108,11 @@ class QuotableOverride(Bundle,MktDataBasis):
         return calendar.prev_bizday(value), calendar.next_bizday(value)
 
     def quotes(self, quotable, adaptor):
-        return [
-            adaptor.fill(self.quotable_class(**self.id_values(quotable)|{self.s_id_override_attr: value})).quote
+        neighbours = adaptor.fill_many(
+            self.quotable_class(**self.id_values(quotable)|{self.s_id_override_attr: value})
             for value in self.id_override_attr_values(quotable) if value
-        ]
+        )
+        return [neighbour.quote for neighbour in neighbours]
 
     def set_quote(self, quotable: MktQuotable, adaptor: MktDataAdaptor):
         # missing or bad value for date - take an average of the previous date and new one
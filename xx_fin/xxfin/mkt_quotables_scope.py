@@ -34,8 +34,8 @@ class MktQuotablesScope(Bundle):
             data_per_mkt = cls.s_data_per_market
         assert data_per_mkt is not None, 'data_per_mkt must be provided'
 
-        for mkt_name, data_per_quotable_class in data_per_mkt.items():
-            scope = cls.existing_instance(mkt_name = mkt_name, _throw = False)
+        scopes = cls.existing_instances([dict(mkt_name = mkt_name) for mkt_name in data_per_mkt], _throw = False)
+        for (mkt_name, data_per_quotable_class), scope in zip(data_per_mkt.items(), scopes, strict = True):
             if not scope:
                 scope = cls(mkt_name = mkt_name)
                 stubs_by_class = {
@@ -1,6 +1,7 @@
 import calendar
 from datetime import date
 
+import numpy as np
 from core_10x.named_constant import NamedConstant
 
 
@@ -77,5 +78,83 @@ class DAY_COUNT_CONVENTION(NamedConstant):
     US30360 = us30360
     EB30360 = eb30360
 
+#---- array versions: d1 and d2 are datetime64[D] arrays (or anything np.asarray turns into one); the results are float64 arrays
+def _as_days(d) -> np.ndarray:
+    return np.asarray(d, dtype = 'datetime64[D]')
+
+def _ymd(d: np.ndarray) -> tuple:
+    y = d.astype('datetime64[Y]')
+    m = d.astype('datetime64[M]')
+    return (
+        y.astype(np.int64) + 1970,
+        (m - y.astype('datetime64[M]')).astype(np.int64) + 1,
+        (d - m.astype('datetime64[D]')).astype(np.int64) + 1,
+    )
+
+def _days_between(d1: np.ndarray, d2: np.ndarray) -> np.ndarray:
+    return (d2 - d1).astype(np.int64)
+
+def act360_array(d1, d2) -> np.ndarray:
+    return _days_between(_as_days(d1), _as_days(d2)) / 360.0
+
+def act365_array(d1, d2) -> np.ndarray:
+    return _days_between(_as_days(d1), _as_days(d2)) / 365.0
+
+def actact_array(d1, d2) -> np.ndarray:
+    d1, d2 = _as_days(d1), _as_days(d2)
+    y1 = d1.astype('datetime64[Y]')
+    y2 = d2.astype('datetime64[Y]')
+    next1 = (y1 + 1).astype('datetime64[D]')
+    next2 = (y2 + 1).astype('datetime64[D]')
+    from_year_num_days = _days_between(y1.astype('datetime64[D]'), next1)
+    to_year_num_days = _days_between(y2.astype('datetime64[D]'), next2)
+
+    frac1 = _days_between(d1, next1) / from_year_num_days
+    frac2 = _days_between(d2, next2) / to_year_num_days
+    split = (frac1 - frac2) + (y2 - y1).astype(np.int64)
+    return np.where(y1 == y2, _days_between(d1, d2) / from_year_num_days, split)
+
+def _30360_array(d1, d2, from_day, to_day) -> np.ndarray:
+    year1, month1, _ = d1
+    year2, month2, _ = d2
+    return (year2 - year1) + (month2 - month1) / 12 + (to_day - from_day) / 360
+
+def bb30360_array(d1, d2) -> np.ndarray:
+    d1, d2 = _ymd(_as_days(d1)), _ymd(_as_days(d2))
+    from_day = np.where(d1[2] == 31, 30, d1[2])
+    to_day = np.where((d2[2] == 31) & (from_day >= 30), 30, d2[2])
+    return _30360_array(d1, d2, from_day, to_day)
+
+def us30360_array(d1, d2) -> np.ndarray:
+    days1 = _as_days(d1)
+    d1, d2 = _ymd(days1), _ymd(_as_days(d2))
+    month_end = (days1 + 1).astype('datetime64[M]') != days1.astype('datetime64[M]')
+    from_day = np.where(month_end, 30, d1[2])
+    to_day = np.where((d2[2] == 31) & (from_day >= 30), 30, d2[2])
+    return _30360_array(d1, d2, from_day, to_day)
+
+def eb30360_array(d1, d2) -> np.ndarray:
+    d1, d2 = _ymd(_as_days(d1)), _ymd(_as_days(d2))
+    return _30360_array(d1, d2, np.minimum(d1[2], 30), np.minimum(d2[2], 30))
+
+DC_ARRAY_FUNCS = {
+    'ACT360':   act360_array,
+    'ACT365':   act365_array,
+    'ACTACT':   actact_array,
+    'BB30360':  bb30360_array,
+    'US30360':  us30360_array,
+    'EB30360':  eb30360_array,
+}
+
+def dc_fractions(d1, d2, convention) -> np.ndarray:
+    """convention(d1[i], d2[i]) for every i, as a float64 array."""
+    fn = DC_ARRAY_FUNCS.get(convention.name)
+    if fn:
+        return fn(d1, d2)
+
+    d1, d2 = _as_days(d1), _as_days(d2)
+    return np.array([convention(x, y) for x, y in zip(d1.tolist(), d2.tolist(), strict = True)], dtype = np.float64)
+
 def dc_fractions_for_dates( dates: list, convention: DAY_COUNT_CONVENTION ) -> list:
-    return [ convention( dates[i], dates[i+1]) for i in range(len(dates)-1) ]
\ No newline at end of file
+    dates = _as_days(dates)
+    return dc_fractions(dates[:-1], dates[1:], convention).tolist()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 from core_10x.named_constant import NamedConstant, NamedConstantTable
 
 
@@ -29,3 +30,29 @@ _TABLE = NamedConstantTable(COMPOUNDING, COMPOUND_TRANSFORM,
 
 def compounding_apply(comp: COMPOUNDING, transform: COMPOUND_TRANSFORM, t: float, v: float) -> float:
     return _TABLE[comp][transform](t, v)
+
+
+#---- array versions: t and v are float64 arrays (or scalars broadcastable against each other)
+def _a_to_r(f):
+    def _a_to_r_array(t, a):
+        t = np.asarray(t, dtype = np.float64)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            return np.where(t != 0., f(t, np.asarray(a, dtype = np.float64)), 0.)
+    return _a_to_r_array
+
+_ARRAY_TABLE = {
+    #               RATE_TO_ACCRUAL                             ACCRUAL_TO_RATE
+    'SIMPLE':      ( lambda t, r:  1. + r * t,                   _a_to_r(lambda t, a: (a - 1.) / t) ),
+    'ANNUAL':      ( lambda t, r: (1. + r      ) **  t,          _a_to_r(lambda t, a:  a ** (1. / t)       - 1.) ),
+    'SEMI_ANNUAL': ( lambda t, r: (1. + r /  2.) ** (t *  2.),   _a_to_r(lambda t, a: (a ** (1. / t /  2.) - 1.) * 2.) ),
+    'QUARTERLY':   ( lambda t, r: (1. + r /  4.) ** (t *  4.),   _a_to_r(lambda t, a: (a ** (1. / t /  4.) - 1.) * 4.) ),
+    'MONTHLY':     ( lambda t, r: (1. + r / 12.) ** (t * 12.),   _a_to_r(lambda t, a: (a ** (1. / t / 12.) - 1.) * 12.) ),
+    'WEEKLY':      ( lambda t, r: (1. + r / 52.) ** (t * 52.),   _a_to_r(lambda t, a: (a ** (1. / t / 52.) - 1.) * 52.) ),
+    'CONTINUOUS':  ( lambda t, r: np.exp(r * t),                 _a_to_r(lambda t, a: np.log(a) / t) ),
+}
+
+def compounding_apply_array(comp: COMPOUNDING, transform: COMPOUND_TRANSFORM, t, v) -> np.ndarray:
+    """compounding_apply() over whole arrays of t and v."""
+    fns = _ARRAY_TABLE[comp.name]
+    fn = fns[0] if transform.name == 'RATE_TO_ACCRUAL' else fns[1]
+    return np.asarray(fn(np.asarray(t, dtype = np.float64), np.asarray(v, dtype = np.float64)), dtype = np.float64)
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
 from core_10x.traitable import T
 from xxcommon.curve import DateCurve
 from xxcommon.rdate import BIZDAY_ROLL_RULE, PROPAGATE_DATES, TENOR_FREQUENCY, RDate
 
-from xxfin.day_count_convention import DAY_COUNT_CONVENTION
+from xxfin.day_count_convention import DAY_COUNT_CONVENTION, dc_fractions
 from xxfin.fin_calendar import FinCalendar
-from xxfin.ir_compounding import COMPOUND_TRANSFORM, COMPOUNDING, compounding_apply
+from xxfin.ir_compounding import COMPOUND_TRANSFORM, COMPOUNDING, compounding_apply, compounding_apply_array
 
 
 class RateCurve(DateCurve):
@@ -78,6 +79,38 @@ class RateCurve(DateCurve):
         t = dc_conv(today, d)
         return compounding_apply(compounding, COMPOUND_TRANSFORM.ACCRUAL_TO_RATE, t, a)
 
+    #---- array versions: dates may be lists of dates or datetime64[D] arrays; the results are float64 arrays
+    def _as_days(self, dates) -> np.ndarray:
+        return np.asarray(self.dates if dates is None else dates, dtype = 'datetime64[D]')
+
+    def accruals(self, dates: list[date] = None, today: date = None) -> np.ndarray:
+        """[self.accrual(d, today) for d in dates] with one curve evaluation for all of dates."""
+        today = np.datetime64(self._today(today), 'D')
+        ds = self._as_days(dates)
+        rs = np.asarray(self.values_at(ds.tolist()), dtype = np.float64)
+        t = dc_fractions(np.full(ds.shape, today), ds, self.dc_convention)
+        accs = compounding_apply_array(self.compounding, COMPOUND_TRANSFORM.RATE_TO_ACCRUAL, t, rs)
+        return np.where(ds == today, 1., accs)
+
+    def accruals_fwd(self, d1s, d2s, today: date = None) -> np.ndarray:
+        d1s, d2s = self._as_days(d1s), self._as_days(d2s)
+        lo = np.minimum(d1s, d2s)
+        hi = np.maximum(d1s, d2s)
+        accs = self.accruals(np.concatenate((lo, hi)), today)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            return np.where(lo == hi, 1., accs[lo.size:] / accs[:lo.size])
+
+    def fwd_rates(self, d1s, d2s, dc_conv: DAY_COUNT_CONVENTION = None, compounding: COMPOUNDING = None, today: date = None) -> np.ndarray:
+        """[self.rate_fwd(d1, d2, dc_conv, compounding, today) for d1, d2 in zip(d1s, d2s)] as a few array ops."""
+        dc_conv, compounding = self._conventions(dc_conv, compounding)
+        d1s, d2s = self._as_days(d1s), self._as_days(d2s)
+        a = self.accruals_fwd(d1s, d2s, today)
+        t = np.abs(dc_fractions(d1s, d2s, dc_conv))     ## accruals_fwd orders dates
+        return compounding_apply_array(compounding, COMPOUND_TRANSFORM.ACCRUAL_TO_RATE, t, a)
+
+    def discount_factors_array(self, dates: list[date] = None, today: date = None) -> np.ndarray:
+        return 1. / self.accruals(dates, today)
+
     def rate_from_accrual(self, d: date, a: float, dc_conv: DAY_COUNT_CONVENTION = None, compounding: COMPOUNDING = None, today: date = None) -> float:
         dc_conv, compounding = self._conventions(dc_conv, compounding)
         today = self._today(today)
@@ -1,8 +1,24 @@
+from contextlib import contextmanager
+
 from xxcommon.rdate import PROPAGATE_DATES, RDate
 
 from xxfin.root_solver import ir_add_curve_point, xtol
 
 
+@contextmanager
+def _incremental(zrc):
+    ## the root finder re-solves the last pillar only: patch it in place instead of rebuilding the interpolator on every step
+    if zrc.params.incremental:
+        yield
+        return
+
+    zrc.set_curve_params(incremental = True)
+    try:
+        yield
+    finally:
+        zrc.set_curve_params(incremental = False)
+
+
 def solve_cash_deposit(zrc, start_date, end_date, quote, mc, today):
     dc_convention = mc.dc_convention
     compounding   = mc.compounding
@@ -14,7 +30,8 @@ def solve_cash_deposit(zrc, start_date, end_date, quote, mc, today):
             zrc.update(zrc.beginning_of_time_as_date(), x)
         return zrc.rate_fwd(start_date, end_date, dc_convention, compounding) - quote
 
-    rc = ir_add_curve_point(f, bracket, xtol)
+    with _incremental(zrc):
+        rc = ir_add_curve_point(f, bracket, xtol)
     if not rc:
         raise ValueError(f'Failed to bootstrap cash deposit [{start_date} -> {end_date}]; {rc.error}')
 
@@ -43,6 +60,7 @@ def solve_swap(zrc, spot_date, swap_tenor, quote, mc, today):
             PROPAGATE_DATES.FORWARD, False, today
         ) - quote
 
-    rc = ir_add_curve_point(f, bracket, xtol)
+    with _incremental(zrc):
+        rc = ir_add_curve_point(f, bracket, xtol)
     if not rc:
         raise ValueError(f'Failed to bootstrap swap tenor={swap_tenor.symbol()}; {rc.error}')
@@ -0,0 +1,35 @@
+"""Local ``MktDataConnector`` for tests: quotes come from ``records``, no provider involved."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core_10x.traitable import T
+
+from xxfin.mkt_adaptor import MktDataConnector
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
+
+class StubMktDataConnector(MktDataConnector):
+    """``{(ticker, date): quote}`` lookup that logs every request in ``s_requests``.
+
+    ``bulk=False`` leaves :meth:`quotes` to the default thread-pooled fallback, as for a single-quote provider.
+    """
+
+    records: dict = T({})
+    bulk: bool = T(True)
+
+    s_requests: list = []  # -- ('quote' | 'quotes', md_date, ticker | tickers)
+
+    def quote(self, md_date: date, ticker: str) -> float:
+        self.s_requests.append(('quote', md_date, ticker))
+        return self.records.get((ticker, md_date), float('nan'))
+
+    def quotes(self, md_date: date, tickers: Sequence[str]) -> dict[str, float]:
+        if not self.bulk:
+            return super().quotes(md_date, tickers)
+        self.s_requests.append(('quotes', md_date, tuple(tickers)))
+        return {ticker: self.records.get((ticker, md_date), float('nan')) for ticker in tickers}
@@ -64,9 +64,9 @@ def bbg_connector_mode(request, monkeypatch):
         from xbbg import blp
 
         def _bdh(tickers, flds=None, start_date=None, end_date=None, **kwargs):
-            ticker = tickers if isinstance(tickers, str) else tickers[0]
-            value = MktDataConnector.connector('BBG_DEV').records.get((ticker, start_date), float('nan'))
-            return pd.DataFrame({'PX_LAST': [value]})
+            records = MktDataConnector.connector('BBG_DEV').records
+            tickers = [tickers] if isinstance(tickers, str) else tickers
+            return pd.DataFrame({(ticker, 'PX_LAST'): [records.get((ticker, start_date), float('nan'))] for ticker in tickers})
 
         monkeypatch.setattr(blp, 'bdh', _bdh)
         yield
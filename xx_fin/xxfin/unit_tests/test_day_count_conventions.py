@@ -139,3 +139,18 @@ def test_day_count(key, dates):
         pytest.skip(f'{key} not defined for {dcs["_name"]}')
     dc = getattr(DAY_COUNT_CONVENTION, _DC_KEYS[key])
     assert dcs[key] == dc(*dates), dcs['_name']
+
+
+@pytest.mark.parametrize('key', list(_DC_KEYS))
+def test_dc_fractions(key):
+    from xxfin.day_count_convention import dc_fractions, dc_fractions_for_dates
+
+    dc = getattr(DAY_COUNT_CONVENTION, _DC_KEYS[key])
+    d1s = [d1 for d1, d2 in cases]
+    d2s = [d2 for d1, d2 in cases]
+    expected = [dc(d1, d2) for d1, d2 in cases]
+    assert dc_fractions(d1s, d2s, dc).tolist() == pytest.approx(expected, abs=EPS)
+
+    dates = sorted({d for pair in cases for d in pair})
+    expected = [dc(dates[i], dates[i + 1]) for i in range(len(dates) - 1)]
+    assert dc_fractions_for_dates(dates, dc) == pytest.approx(expected, abs=EPS)
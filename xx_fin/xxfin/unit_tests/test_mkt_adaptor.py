@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+from xxfin.bbg_adaptors.bbg_adaptor import BbgAdaptorIR
+from xxfin.testlib.stub_connector import StubMktDataConnector
+
+D1 = date(2025, 10, 10)
+D2 = date(2025, 10, 13)
+RECORDS = {
+    ('USOSFR1 Curncy', D1): 4.0,
+    ('USOSFR2 Curncy', D1): 3.5,
+    ('BPSWS1 Curncy', D1): 4.25,
+    ('USOSFR1 Curncy', D2): 4.1,
+}
+
+
+@dataclass
+class FakeQuotable:
+    mkt_name: str
+    md_date: date
+    quote: float = None
+
+
+@pytest.fixture(params=[True, False], ids=['bulk', 'single_quote'])
+def stub_adaptor(request):
+    connector = StubMktDataConnector(_replace=True, provider_name='STUB', records=RECORDS, bulk=request.param)
+
+    class StubIRAdaptor(BbgAdaptorIR):
+        @classmethod
+        def ticker(cls, quotable):
+            return quotable.mkt_name
+
+        @classmethod
+        def connector(cls):
+            return connector
+
+    StubMktDataConnector.s_requests.clear()
+    yield StubIRAdaptor, request.param
+    StubMktDataConnector.s_requests.clear()
+
+
+def test_fill_many_one_request_per_date(stub_adaptor):
+    adaptor, bulk = stub_adaptor
+    quotables = [FakeQuotable(ticker, md_date) for ticker, md_date in (*RECORDS, ('USOSFR1 Curncy', D1))]
+
+    assert adaptor.fill_many(quotables) == quotables
+    assert [q.quote for q in quotables] == [0.04, 0.035, 0.0425, 0.041, 0.04]
+
+    requests = StubMktDataConnector.s_requests
+    if bulk:
+        assert requests == [
+            ('quotes', D1, ('USOSFR1 Curncy', 'USOSFR2 Curncy', 'BPSWS1 Curncy', 'USOSFR1 Curncy')),
+            ('quotes', D2, ('USOSFR1 Curncy',)),
+        ]
+    else:  # -- thread-pooled fallback: one quote() per distinct ticker and date, in any order
+        assert sorted(requests) == sorted(('quote', md_date, ticker) for ticker, md_date in RECORDS)
+
+
+def test_fill_many_missing_quote_is_nan(stub_adaptor):
+    adaptor, _ = stub_adaptor
+    (q,) = adaptor.fill_many([FakeQuotable('MISSING Curncy', D1)])
+    assert q.quote != q.quote
+
+
+def test_default_quotes_keep_ticker_order():
+    connector = StubMktDataConnector(_replace=True, provider_name='STUB', records=RECORDS, bulk=False)
+    tickers = ['BPSWS1 Curncy', 'USOSFR2 Curncy', 'BPSWS1 Curncy', 'USOSFR1 Curncy']
+    quotes = connector.quotes(D1, tickers)
+    assert list(quotes) == ['BPSWS1 Curncy', 'USOSFR2 Curncy', 'USOSFR1 Curncy']
+    assert list(quotes.values()) == [4.25, 3.5, 4.0]
+
+
+def test_fill_and_fill_many_share_fill_quote(stub_adaptor):
+    adaptor, _ = stub_adaptor
+
+    class RoundingAdaptor(adaptor):
+        @classmethod
+        def fill_quote(cls, quotable, quote):
+            return super().fill_quote(quotable, round(quote, 3))
+
+    single = RoundingAdaptor.fill(FakeQuotable('USOSFR2 Curncy', D1))
+    (batched,) = RoundingAdaptor.fill_many([FakeQuotable('USOSFR2 Curncy', D1)])
+    assert single.quote == batched.quote == 0.035
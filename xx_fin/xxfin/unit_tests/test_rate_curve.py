@@ -1,6 +1,7 @@
 from datetime import date
 from math import exp, log
 
+import numpy as np
 import pytest
 from xxcommon.rdate import BIZDAY_ROLL_RULE, RDate
 from xxfin.fin_calendar import FinCalendar
@@ -228,6 +229,33 @@ class TestRateCurve:
         assert self.rc.discount_factors(self.some_dates) == [self.rc.discount_factor(d) for d in self.some_dates]
         assert self.rc.discount_factors() == self.rc.discount_factors(self.rc.dates)
 
+    def test_array_versions(self):
+        save_dc  = self.rc.dc_convention
+        save_cmp = self.rc.compounding
+
+        bot = self.rc.beginning_of_time_as_date()
+        dates = [bot, *self.rc.dates, *self.some_dates]
+        d1s = [d1 for d1, _ in self.some_periods] + [self.some_dates[1], self.some_dates[2]]     #-- reversed and empty periods too
+        d2s = [d2 for _, d2 in self.some_periods] + [self.some_dates[0], self.some_dates[2]]
+        for dc, cmp, _, _ in self.dc_cmps_rTOa_aTOr:
+            self.rc.dc_convention = dc
+            self.rc.compounding   = cmp
+
+            accs = self.rc.accruals(dates)
+            assert isinstance(accs, np.ndarray)
+            assert accs.tolist() == pytest.approx([self.rc.accrual(d) for d in dates])
+            assert self.rc.discount_factors_array(dates).tolist() == pytest.approx(self.rc.discount_factors(dates))
+            assert self.rc.accruals_fwd(d1s, d2s).tolist() == pytest.approx([self.rc.accrual_fwd(d1, d2) for d1, d2 in zip(d1s, d2s, strict=True)])
+            for q_dc, q_cmp, _, _ in self.dc_cmps_rTOa_aTOr:
+                rates = self.rc.fwd_rates(d1s, d2s, q_dc, q_cmp, bot)
+                assert rates.tolist() == pytest.approx([self.rc.rate_fwd(d1, d2, q_dc, q_cmp, bot) for d1, d2 in zip(d1s, d2s, strict=True)])
+
+        assert self.rc.accruals([]).size == 0
+        assert self.rc.accruals().tolist() == pytest.approx(self.rc.accruals(self.rc.dates).tolist())
+
+        self.rc.dc_convention = save_dc
+        self.rc.compounding   = save_cmp
+
     def test_discount_factors_dates(self):
         assert self.rc.discount_factors_dates(self.some_dates) == [(d, self.rc.discount_factor(d)) for d in self.some_dates]
         assert self.rc.discount_factors_dates() == self.rc.discount_factors_dates(self.rc.dates)
@@ -9,6 +9,7 @@ class XXFinEnvVars(_EnvVars, env_name = 'XXFIN'):
     #cxx_day_count_convention: bool = False
     use_cxxfin: bool = False
     aadc_license: str = ''
+    calendar_cache_dir: str = ''   #-- if set, FinCalendar keeps QuantLib holidays here across processes
 
     @classmethod
     def verify_ccy_apply(cls, value):
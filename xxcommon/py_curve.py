@@ -5,6 +5,7 @@ import math
 from datetime import date, timedelta
 from typing import Any
 
+import numpy as np
 from core_10x.exec_control import UPWARD_DEPS_OFF
 from core_10x.named_constant import NamedConstant
 from core_10x.traitable import RC, RC_TRUE, RT, AnonymousTraitable, M, T, Traitable
@@ -35,9 +36,37 @@ class CurveParams(Traitable):
     copy: bool          = RT(False)
     fill_value: Any     = RT('extrapolate')     ## it's 'extrapolate' or a tuple (left_value, right_value) for extrapolation
     bounds_error: bool  = RT(False)
+    incremental: bool   = RT(False)     #-- LINEAR only: overwriting an existing point patches the interpolator instead of rebuilding it
 
     def interpolator_get(self):     return self.__class__.DEFAULT_INTERPOLATOR
 
+    def is_incremental(self) -> bool:
+        return self.incremental and self.ip_kind is IP_KIND.LINEAR and self.interpolator is interpolate.interp1d and not self.bounds_error
+
+class LinearInterpolator:
+    """
+    Piecewise linear interpolation (same results as interp1d of kind 'linear') computed straight off ``y``.
+    Nothing is precomputed from ``y``, so it may be modified in place between calls.
+    """
+    def __init__(self, x: ndarray, y: ndarray, fill_value = 'extrapolate'):
+        self.x = np.asarray(x, dtype = float64)
+        self.y = y
+        self.fill_value = fill_value
+
+    def __call__(self, t):
+        x, y, fill_value = self.x, self.y, self.fill_value
+        if isinstance(fill_value, tuple):
+            return np.interp(t, x, y, left = fill_value[0], right = fill_value[1])
+
+        if fill_value != 'extrapolate':
+            return np.interp(t, x, y, left = fill_value, right = fill_value)
+
+        v = np.interp(t, x, y)
+        if len(x) > 1:
+            v = np.where(t < x[0],  y[0] +  (t - x[0])  * (y[1] - y[0])   / (x[1] - x[0]),   v)
+            v = np.where(t > x[-1], y[-1] + (t - x[-1]) * (y[-1] - y[-2]) / (x[-1] - x[-2]), v)
+        return v
+
 class Curve(AnonymousTraitable):
     times: list         = T([], T.STICKY)       #-- only ints or floats are allowed
     values: list        = T([], T.STICKY)
@@ -48,12 +77,21 @@ class Curve(AnonymousTraitable):
     interpolator: Any       = RT()
     min_curve_size: int     = RT()
 
+    times_array: ndarray    = RT()      #-- cached NumPy views of times/values; dropped on every point change
+    values_array: ndarray   = RT()
+
     def params_get(self) -> CurveParams:
         return CurveParams()
 
     def min_curve_size_get(self) -> int:
         return self.params.ip_kind.label
 
+    def times_array_get(self) -> ndarray:
+        return np.asarray(self.times)
+
+    def values_array_get(self) -> ndarray:
+        return np.asarray(self.values)
+
     def start_time(self):
         times = self.times
         return times[0] if times else None
@@ -66,6 +104,16 @@ class Curve(AnonymousTraitable):
     def _to_number(cls, t):
         return t
 
+    @classmethod
+    def _to_numbers(cls, ts) -> ndarray:
+        return np.asarray(ts)
+
+    @staticmethod
+    def _index(times, t) -> int:
+        """Index of ``t`` in sorted ``times`` or -1."""
+        i = bisect.bisect_left(times, t)
+        return i if i < len(times) and times[i] == t else -1
+
     @classmethod
     def insert_time_value(cls, times, values, t, value):
         t = cls._to_number(t)
@@ -83,31 +131,54 @@ class Curve(AnonymousTraitable):
                 times.insert(i, t)
                 values.insert(i, value)
 
+    def _patch_value(self, times, values, t, value) -> bool:
+        """Overwrite the value of an existing point in the incremental mode, keeping the interpolator: see CurveParams.incremental."""
+        if not self.params.is_incremental():
+            return False
+
+        i = self._index(times, self._to_number(t))
+        if i < 0:
+            return False
+
+        values_array = self.values_array
+        if values_array.dtype != float64:
+            return False
+
+        if type(value) is float64:
+            value = float(value)
+        values[i] = value
+        values_array[i] = value
+        return True
+
     def update(self, t, value, reset=True):
         with UPWARD_DEPS_OFF():
             times = self.times
             values = self.values
+            if self._patch_value(times, values, t, value):
+                return
+
             self.insert_time_value(times, values, t, value)
 
             self.times = times
             self.values = values
-            if reset:
-                self.reset()
+            self._points_changed(reset)
 
     def update_many(self, times, values, reset=True):
+        """Same as calling :meth:`update` for each point (the last value for a repeated time wins), as one sorted merge."""
         assert len(times) == len(values), 'times and values size mismatch'
         with UPWARD_DEPS_OFF():
             c_times = self.times
             c_values = self.values
 
-        f = self.__class__.insert_time_value
-        for i, t in enumerate(times):
-            f(c_times, c_values, t, values[i])
+        times = self._to_numbers(times)
+        values = np.asarray(values)
+        all_times = np.concatenate((np.asarray(c_times) if c_times else times[:0], times))[::-1]     #-- keep int times ints
+        all_values = np.concatenate((np.asarray(c_values) if c_values else values[:0], values))[::-1]
+        m_times, idx = np.unique(all_times, return_index = True)   #-- first in reversed order == last update
 
-        self.times = c_times
-        self.values = c_values
-        if reset:
-            self.reset()
+        self.times = m_times.tolist()
+        self.values = all_values[idx].tolist()
+        self._points_changed(reset)
 
     class Builder:
         def __init__(self, curve):
@@ -131,20 +202,21 @@ class Curve(AnonymousTraitable):
     def remove(self, t, reset=True) -> bool:
         t = self._to_number(t)
         times = self.times
-        if t not in times:
+        i = self._index(times, t)
+        if i < 0:
             return False
 
         values = self.values
-        i = times.index(t)
         times.pop(i)
         values.pop(i)
-        if reset:
-            self.reset()
-
+        self._points_changed(reset)
         return True
 
     def set_curve_params(self, **param_values) -> RC:
-        rc = self.params.set_values(**param_values)
+        params = self.params
+        rc = params.set_values(**param_values)
+        if rc:
+            self.params = params
         self.reset()
         return rc
 
@@ -158,8 +230,14 @@ class Curve(AnonymousTraitable):
 
     def interpolator_get(self):
         params = self.params
+        if params.is_incremental():
+            return LinearInterpolator(self.times_array, self.values_array, fill_value = params.fill_value)
+
+        #-- interp1d takes the cached arrays as is when params.copy is off; custom interpolators get the lists
+        as_arrays = params.interpolator is interpolate.interp1d
         return params.interpolator(
-            self.times, self.values,
+            self.times_array if as_arrays else self.times,
+            self.values_array if as_arrays else self.values,
             kind            = params.ip_kind.value,
             assume_sorted   = params.assume_sorted,
             copy            = params.copy,
@@ -172,20 +250,55 @@ class Curve(AnonymousTraitable):
         times = self.times
 
         if self.params.ip_kind is IP_KIND.NO_INTERP:
-            return self.values[times.index(t)] if t in times else math.nan
+            i = self._index(times, t)
+            return self.values[i] if i >= 0 else math.nan
 
-        if len(times) < self.min_curve_size and t in times:
-            return self.values[times.index(t)]
+        if len(times) < self.min_curve_size and (i := self._index(times, t)) >= 0:
+            return self.values[i]
 
         bot = self.beginning_of_time
         v   = self.interpolator(t) if (bot is None) or (t >= bot) else math.nan
         return float(v) if isinstance(v, (floating, ndarray)) else v
 
     def values_at(self, dates) -> tuple:
-        return tuple(self.value(d) for d in dates)
+        """Same as ``tuple(self.value(d) for d in dates)``, but with one interpolator call for all of ``dates``."""
+        params = self.params
+        times = self.times
+        if params.ip_kind is IP_KIND.NO_INTERP:
+            ts = self._to_numbers(dates)
+            if not times:
+                return (math.nan, ) * ts.size
+
+            c_times = self.times_array
+            idx = np.searchsorted(c_times, ts).clip(max = len(times) - 1)
+            vs = np.where(c_times[idx] == ts, self.values_array.astype(float64, copy = False)[idx], math.nan)
+            return tuple(vs.tolist())
+
+        if params.interpolator is not interpolate.interp1d or len(times) < self.min_curve_size:
+            return tuple(self.value(d) for d in dates)     #-- custom interpolators may not take arrays
+
+        ts = self._to_numbers(dates)
+        if not ts.size:
+            return ()
+
+        vs = np.asarray(self.interpolator(ts), dtype = float64)
+        bot = self.beginning_of_time
+        if bot is not None:
+            vs = np.where(ts >= bot, vs, math.nan)
+
+        return tuple(vs.tolist())
+
+    def _points_changed(self, reset: bool):
+        if reset:
+            self.reset()
+        else:
+            self.invalidate_value('times_array')
+            self.invalidate_value('values_array')
 
     def reset(self):
         self.invalidate_value('interpolator')
+        self.invalidate_value('times_array')
+        self.invalidate_value('values_array')
 
     @classmethod
     def same_values(cls, v1, v2) -> bool:
@@ -210,6 +323,10 @@ class DateCurve(Curve):
 
         raise ValueError(f'Unexpected value {d}')
 
+    @classmethod
+    def _to_numbers(cls, ds) -> ndarray:
+        return np.asarray(ds, dtype = 'datetime64[D]').astype(np.int64)     #-- ints are taken as days since the epoch, same as _to_number
+
     @classmethod
     def _from_number(cls, x: int) -> date:
         return cls.s_epoch_date + timedelta(days=x)
@@ -219,9 +336,7 @@ class DateCurve(Curve):
         return [f(x) for x in self.times]
 
     def dates_set(self, trait, value) -> RC:
-        f = self._to_number     #-- TODO: possibly improve performance by using a different f (which doesn't check the type)
-        times = [f(d) for d in value]
-        return self.set_value('times', times)
+        return self.set_value('times', self._to_numbers(value).tolist())
 
     def beginning_of_time_set(self, trait, d) -> RC:
         t = self._to_number(d)
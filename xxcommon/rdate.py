@@ -6,11 +6,13 @@ import re
 from datetime import date
 from functools import partial
 
+import numpy as np
+from core_10x.global_cache import lru_cache
 from core_10x.named_constant import NamedConstant, NamedConstantTable
 from core_10x.nucleus import Nucleus
 from dateutil.relativedelta import relativedelta as delta
 
-from xxcommon.xxcalendar import Calendar
+from xxcommon.xxcalendar import Calendar, CalendarNameParser
 
 
 #=====
@@ -269,6 +271,14 @@ class RDate(Nucleus):
     def roll_to_bizday(cls, d: date, cal: Calendar, roll_rule: BIZDAY_ROLL_RULE) -> date:
         return roll_rule(d, cal)
 
+    @classmethod
+    def add_bizdays_array(cls, dates, biz_days, cal: Calendar, roll_rule: BIZDAY_ROLL_RULE):
+        return cal.roll_array(cal.advance_bizdays_array(dates, biz_days), roll_rule)
+
+    @classmethod
+    def roll_to_bizday_array(cls, dates, cal: Calendar, roll_rule: BIZDAY_ROLL_RULE):
+        return cal.roll_array(dates, roll_rule)
+
     class RELOP(NamedConstant):
         LT = date.__lt__
         GT = date.__gt__
@@ -289,53 +299,39 @@ class RDate(Nucleus):
         return [RDate(tenor.strip()) for tenor in tenors]
 
     def dates_schedule(self, start: date, end: date, calendar: Calendar, roll_rule: BIZDAY_ROLL_RULE, date_propagation: PROPAGATE_DATES, allow_stub = True) -> list:
-        rolled_start = roll_rule(start, calendar)
-        if rolled_start < start:
-            raise ValueError(f'rolled start date {rolled_start} is before non-working start date {start} according to calendar {calendar.name} and roll rule {roll_rule.name}')
-
-        rolled_end = roll_rule(end, calendar)
-        if rolled_end > end:
-            raise ValueError(f'rolled end date {rolled_end} is after non-working end date {end} according to calendar {calendar.name} and roll rule {roll_rule.name}')
-
-        if date_propagation == PROPAGATE_DATES.BACKWARD:
-            begin = rolled_end
-            finish = rolled_start
-            dir = -1
-            exceed = lambda x, y: x < y
-            ex_or_eq = lambda x, y: x <= y
-        else:
-            begin = rolled_start
-            finish = rolled_end
-            dir = 1
-            exceed = lambda x, y: x > y
-            ex_or_eq = lambda x, y: x >= y
-
-        step = self * dir
-
-        prev_rolled_date = begin
-        rolled_date = begin
-        non_rolled_date = begin
-
-        all_dates = []
-        while ex_or_eq(finish, rolled_date):
-            all_dates.append(rolled_date)
-            non_rolled_date = step.apply(non_rolled_date, calendar, BIZDAY_ROLL_RULE.NO_ROLL)
-            rolled_date = roll_rule(non_rolled_date, calendar)
-            if not exceed(rolled_date, prev_rolled_date):
-                raise ValueError(f'infinite loop: next date {rolled_date} vs previous date {prev_rolled_date} for date_propagation = {date_propagation.name}')
-            if exceed(rolled_date, finish):
-                break
-            prev_rolled_date = rolled_date
-
-        if not allow_stub:
-            if prev_rolled_date != finish:
-                raise ValueError(f'the date sequence has a stub period bound by {prev_rolled_date} and {finish}')
-        else:
-            if finish not in all_dates:
-                all_dates.append(finish)
+        return list(_schedule(self.__class__, self.freq, self.count, start, end, calendar, roll_rule, date_propagation, allow_stub))
+
+    def dates_schedules(self, starts, ends, calendar: Calendar, roll_rule: BIZDAY_ROLL_RULE, date_propagation: PROPAGATE_DATES, allow_stub = True) -> list:
+        """
+        dates_schedule() for each (start, end) pair, as datetime64[D] arrays.
+        starts and ends are sequences of dates or datetime64[D] arrays; repeated pairs share one array.
+        """
+        if isinstance(starts, np.ndarray):
+            starts = starts.astype('datetime64[D]').tolist()
+        if isinstance(ends, np.ndarray):
+            ends = ends.astype('datetime64[D]').tolist()
+        assert len(starts) == len(ends), f'starts and ends must have the same length: {len(starts)} vs {len(ends)}'
 
-        all_dates.sort()
-        return all_dates
+        cls = self.__class__
+        schedules = {}
+        res = []
+        for start, end in zip(starts, ends, strict = True):
+            schedule = schedules.get((start, end))
+            if schedule is None:
+                dates = _schedule(cls, self.freq, self.count, start, end, calendar, roll_rule, date_propagation, allow_stub)
+                schedule = schedules[(start, end)] = np.array(dates, dtype = 'datetime64[D]')
+            res.append(schedule)
+
+        return res
+
+    @classmethod
+    def set_schedule_cache_size(cls, maxsize: int = None):
+        """Max number of schedules dates_schedule() keeps (None: no limit, 0: no caching); clears the cache."""
+        _cached_dates_schedule.resize(maxsize)
+
+    @classmethod
+    def clear_schedule_cache(cls):
+        _cached_dates_schedule.clear()
 
     def period_dates(self, start: date, end: date, calendar: Calendar, roll_rule: BIZDAY_ROLL_RULE, date_propagation: PROPAGATE_DATES, allow_stub = True) -> tuple:
         all_dates = self.dates_schedule(start, end, calendar, roll_rule, date_propagation, allow_stub)
@@ -357,13 +353,7 @@ class RDate(Nucleus):
         if end_date < start_date:
             start_date, end_date = end_date, start_date
 
-        bizdays = []
-        d = RDate.roll_to_bizday(start_date, calendar, BIZDAY_ROLL_RULE.FOLLOWING)
-        while d <= end_date:
-            bizdays.append(d)
-            d = RDate.add_bizdays(d, 1, calendar, BIZDAY_ROLL_RULE.NO_ROLL)
-
-        return bizdays
+        return calendar.bizdays_between(start_date, end_date)
 
     @classmethod
     def apply_bound(cls, rdate: RDate = None, cal: Calendar = None, roll_rule: BIZDAY_ROLL_RULE = None):
@@ -394,3 +384,90 @@ class RDate(Nucleus):
             subset.append((ordered_rdates[i], None, -1))  ## (rd, _, _)
 
         return [rd for (rd, _, _) in subset]
+
+
+def _dates_schedule(rdate_class, freq: TENOR_FREQUENCY, count: int, start: date, end: date, calendar: Calendar, roll_rule: BIZDAY_ROLL_RULE, date_propagation: PROPAGATE_DATES, allow_stub: bool) -> tuple:
+    rolled_start = roll_rule(start, calendar)
+    if rolled_start < start:
+        raise ValueError(f'rolled start date {rolled_start} is before non-working start date {start} according to calendar {calendar.name} and roll rule {roll_rule.name}')
+
+    rolled_end = roll_rule(end, calendar)
+    if rolled_end > end:
+        raise ValueError(f'rolled end date {rolled_end} is after non-working end date {end} according to calendar {calendar.name} and roll rule {roll_rule.name}')
+
+    if date_propagation == PROPAGATE_DATES.BACKWARD:
+        begin = rolled_end
+        finish = rolled_start
+        dir = -1
+        exceed = lambda x, y: x < y
+        ex_or_eq = lambda x, y: x <= y
+    else:
+        begin = rolled_start
+        finish = rolled_end
+        dir = 1
+        exceed = lambda x, y: x > y
+        ex_or_eq = lambda x, y: x >= y
+
+    step = rdate_class(freq = freq, count = count * dir)
+
+    prev_rolled_date = begin
+    rolled_date = begin
+    non_rolled_date = begin
+
+    all_dates = []
+    while ex_or_eq(finish, rolled_date):
+        all_dates.append(rolled_date)
+        non_rolled_date = step.apply(non_rolled_date, calendar, BIZDAY_ROLL_RULE.NO_ROLL)
+        rolled_date = roll_rule(non_rolled_date, calendar)
+        if not exceed(rolled_date, prev_rolled_date):
+            raise ValueError(f'infinite loop: next date {rolled_date} vs previous date {prev_rolled_date} for date_propagation = {date_propagation.name}')
+        if exceed(rolled_date, finish):
+            break
+        prev_rolled_date = rolled_date
+
+    if not allow_stub:
+        if prev_rolled_date != finish:
+            raise ValueError(f'the date sequence has a stub period bound by {prev_rolled_date} and {finish}')
+    elif not all_dates or all_dates[-1] != finish:     #-- dates only move away from begin, so finish can only be the last one
+        all_dates.append(finish)
+
+    if dir < 0:
+        all_dates.reverse()
+    return tuple(all_dates)
+
+class _CalendarKey:
+    """A schedule's calendar, compared by key: a Calendar's name and holidays revision, any other calendar itself."""
+
+    __slots__ = ('calendar', 'key')
+
+    def __init__(self, calendar, key):
+        self.calendar = calendar
+        self.key = key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+def _schedule(rdate_class, freq: TENOR_FREQUENCY, count: int, start: date, end: date, calendar, roll_rule: BIZDAY_ROLL_RULE, date_propagation: PROPAGATE_DATES, allow_stub: bool) -> tuple:
+    if isinstance(calendar, Calendar):
+        #-- unsaved holidays may still change: only stored calendars and combinations of them are cached
+        stored = calendar.get_revision() or CalendarNameParser.combo_name(calendar.name)
+        revision = calendar.holidays_revision(calendar.name, calendar.adjusted_for) if stored else None
+        if revision is None:
+            return _dates_schedule(rdate_class, freq, count, start, end, calendar, roll_rule, date_propagation, allow_stub)
+        key = (calendar.__class__, calendar.name, calendar.adjusted_for, revision)
+    else:
+        key = calendar
+
+    calendar_key = _CalendarKey(calendar, key)
+    try:
+        return _cached_dates_schedule(rdate_class, freq, count, start, end, calendar_key, roll_rule, date_propagation, allow_stub)
+    finally:
+        calendar_key.calendar = None    #-- the cache keeps the key, not the calendar
+
+#-- schedules repeat a lot across a book (same tenor, frequency, calendar and conventions): keep the most recent ones
+@lru_cache(maxsize = 10_000)
+def _cached_dates_schedule(rdate_class, freq: TENOR_FREQUENCY, count: int, start: date, end: date, calendar_key: _CalendarKey, roll_rule: BIZDAY_ROLL_RULE, date_propagation: PROPAGATE_DATES, allow_stub: bool) -> tuple:
+    return _dates_schedule(rdate_class, freq, count, start, end, calendar_key.calendar, roll_rule, date_propagation, allow_stub)
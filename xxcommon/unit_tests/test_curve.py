@@ -5,6 +5,7 @@ import math
 from datetime import date
 
 import pytest
+from core_10x.exec_control import GRAPH_ON
 
 
 @pytest.fixture(params=[False, True], ids=['py_curve', 'bcurve'])
@@ -60,6 +61,20 @@ class TestCurve:
         assert c.times == [1, 3, 5]
         assert c.values == [10.0, 35.0, 50.0]
 
+    def test_update_many_merges_like_update(self, curve_mod):
+        Curve = curve_mod.Curve
+        c = Curve()
+        c.update_many([5, 1], [50.0, 10.0], reset=False)
+        c.update_many([3, 5, 0, 3], [30.0, 55.0, 0.0, 35.0], reset=True)
+
+        assert c.times == [0, 1, 3, 5]
+        assert all(type(t) is int for t in c.times)
+        assert c.values == [0.0, 10.0, 35.0, 55.0]
+        assert list(c.times_array) == c.times
+
+        c.update(2, 20.0, reset=False)
+        assert list(c.times_array) == [0, 1, 2, 3, 5]
+
     def test_value_linear_interpolation(self, curve_mod):
         Curve = curve_mod.Curve
         c = Curve()
@@ -123,6 +138,28 @@ class TestCurve:
         v = c.value(0.5)
         assert math.isnan(v)
 
+    def test_incremental_update_patches_interpolator(self, curve_mod):
+        Curve = curve_mod.Curve
+        with GRAPH_ON():  # -- the interpolator is only kept on the graph
+            c = Curve()
+            c.update_many([0, 1, 3], [0.0, 2.0, 3.0], reset=True)
+            c.set_curve_params(incremental=True)
+            assert c.params.is_incremental()
+
+            ip = c.interpolator
+            c.update(3, 6.0)
+            assert c.interpolator is ip
+            assert c.values == [0.0, 2.0, 6.0]
+            assert c.values_at([-1.0, 0.5, 2.0, 4.0]) == pytest.approx((-2.0, 1.0, 4.0, 8.0))
+
+            c.update(2, 5.0)  # -- new point: full rebuild
+            assert c.interpolator is not ip
+            assert c.value(2.5) == pytest.approx(5.5)
+
+            c.set_curve_params_to_flat_extrapolate()
+            assert c.params.incremental
+            assert c.values_at([-1.0, 4.0]) == pytest.approx((0.0, 6.0))
+
     def test_remove_and_perturb(self, curve_mod):
         Curve = curve_mod.Curve
         c = Curve()
@@ -136,6 +173,24 @@ class TestCurve:
         # Removing non-existing point
         assert c.remove(100) is False
 
+    def test_values_at_matches_value(self, curve_mod):
+        Curve, CurveParams, IP_KIND = curve_mod.Curve, curve_mod.CurveParams, curve_mod.IP_KIND
+        c = Curve()
+        c.update_many([0.0, 1.0, 3.0], [0.0, 2.0, 3.0], reset=True)
+        c.beginning_of_time = 0.5
+
+        ts = [-1.0, 0.5, 1.0, 2.0, 3.0, 4.0]
+        vs = c.values_at(ts)
+        assert all(type(v) is float for v in vs)
+        assert vs == pytest.approx(tuple(c.value(t) for t in ts), nan_ok=True)
+        assert math.isnan(vs[0])
+        assert c.values_at([]) == ()
+
+        _configure_no_interp(c, CurveParams(), IP_KIND, cxx=False)
+        vs = c.values_at([0.0, 0.5, 3.0, 5.0])
+        assert vs[0] == 0.0 and vs[2] == 3.0
+        assert math.isnan(vs[1]) and math.isnan(vs[3])
+
 
 class TestTwoFuncInterpolator:
     def test_requires_in_func_or_in_func_on_arrays(self):
@@ -234,6 +289,15 @@ class TestDateCurve:
         mid_date = d1 + (d2 - d1) / 2
         assert math.isnan(dc.value(mid_date))
 
+    def test_values_at(self, curve_mod, curve_backend):
+        DateCurve = curve_mod.DateCurve
+        d1 = date(2023, 1, 1)
+        d2 = date(2023, 1, 11)
+        dc = DateCurve(dates=[d1, d2], values=[0.0, 10.0])
+
+        dates = [d1, date(2023, 1, 6), d2, date(2023, 1, 21)]
+        assert dc.values_at(dates) == pytest.approx((0.0, 5.0, 10.0, 20.0))
+
     def test_epoch_number_helpers(self, curve_mod, curve_backend):
         if curve_backend:
             pytest.xfail('cxx DateCurve has no _to_number/_from_number helpers')
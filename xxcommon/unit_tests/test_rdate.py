@@ -2,14 +2,18 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
 import pytest
+from core_10x.global_cache import _clear_all_caches
 
 from xxcommon.rdate import (
     BIZDAY_ROLL_RULE,
     PROPAGATE_DATES,
     TENOR_FREQUENCY,
     RDate,
+    _cached_dates_schedule,
 )
+from xxcommon.xxcalendar import Calendar
 
 
 class TestRDate:
@@ -501,3 +505,69 @@ class TestRDate:
         assert all_dates == expected_all
         assert start_dates == expected_starts
         assert end_dates == expected_ends
+
+    def test_dates_schedules_cached(self):
+        """dates_schedule results are reused across calls; dates_schedules returns one datetime64 array per (start, end)."""
+        rd = RDate('3M')
+
+        class MockCalendar:
+            name = 'MOCK'
+            calls = 0
+
+            def is_bizday(self, d):
+                MockCalendar.calls += 1
+                return True
+
+            def next_bizday(self, d):
+                return d
+
+            def prev_bizday(self, d):
+                return d
+
+        cal = MockCalendar()
+        start, end = date(2023, 1, 31), date(2023, 10, 31)
+
+        dates = rd.dates_schedule(start, end, cal, BIZDAY_ROLL_RULE.FOLLOWING, PROPAGATE_DATES.FORWARD)
+        assert dates == [date(2023, 1, 31), date(2023, 4, 30), date(2023, 7, 30), date(2023, 10, 30), date(2023, 10, 31)]
+        calls = MockCalendar.calls
+        dates.clear()  # -- callers get their own list
+        assert rd.dates_schedule(start, end, cal, BIZDAY_ROLL_RULE.FOLLOWING, PROPAGATE_DATES.FORWARD)[0] == start
+        assert MockCalendar.calls == calls
+
+        starts = np.array([start, date(2023, 2, 15), start], dtype='datetime64[D]')
+        ends = [end, date(2023, 8, 15), end]
+        schedules = rd.dates_schedules(starts, ends, cal, BIZDAY_ROLL_RULE.FOLLOWING, PROPAGATE_DATES.BACKWARD)
+        assert len(schedules) == 3 and schedules[0] is schedules[2]
+        assert schedules[1].tolist() == [date(2023, 2, 15), date(2023, 5, 15), date(2023, 8, 15)]
+        assert schedules[0].tolist() == rd.dates_schedule(start, end, cal, BIZDAY_ROLL_RULE.FOLLOWING, PROPAGATE_DATES.BACKWARD)
+
+    def test_dates_schedule_follows_calendar_revision(self, ts_instance):
+        """A stored calendar's schedules are cached per holidays revision, so saving new holidays gives new schedules."""
+        rd = RDate('1M')
+        start, end = date(2023, 1, 3), date(2023, 3, 3)
+        with ts_instance:
+            cal = Calendar(_replace=True, name='SCHEDULE_CAL', non_working_days=[date(2023, 1, 1)])
+            assert cal.save()
+            assert rd.dates_schedule(start, end, cal, BIZDAY_ROLL_RULE.FOLLOWING, PROPAGATE_DATES.FORWARD) == [start, date(2023, 2, 3), end]
+
+            cal.add_non_working_days(date(2023, 2, 3))
+            assert cal.save()
+            assert rd.dates_schedule(start, end, cal, BIZDAY_ROLL_RULE.FOLLOWING, PROPAGATE_DATES.FORWARD) == [start, date(2023, 2, 4), end]
+
+    def test_set_schedule_cache_size(self):
+        """Resizing keeps the schedule cache cleared along with the other process caches."""
+        rd = RDate('3M')
+
+        class MockCalendar:
+            name = 'MOCK'
+
+        RDate.set_schedule_cache_size(1)
+        try:
+            rd.dates_schedule(date(2023, 1, 3), date(2023, 7, 3), MockCalendar(), BIZDAY_ROLL_RULE.NO_ROLL, PROPAGATE_DATES.FORWARD)
+            info = _cached_dates_schedule.cache_info()
+            assert (info.maxsize, info.currsize) == (1, 1)
+
+            _clear_all_caches()
+            assert _cached_dates_schedule.cache_info().currsize == 0
+        finally:
+            RDate.set_schedule_cache_size(10_000)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
 import pytest
 from core_10x.exec_control import CACHE_ONLY
 
-from xxcommon.xxcalendar import Calendar, CalendarAdjustment, CalendarNameParser
+from xxcommon.rdate import BIZDAY_ROLL_RULE
+from xxcommon.xxcalendar import BizdayIndex, Calendar, CalendarAdjustment, CalendarNameParser
 
 
 class TestCalendarNameParser:
@@ -355,6 +357,49 @@ class TestCalendar:
             result = cal.advance_bizdays(start_date, -3)
             assert result == date(2023, 1, 6)  # Friday
 
+    def test_bizday_index(self):
+        """advance_bizdays, num_bizdays and bizdays_between agree with stepping one day at a time."""
+        with CACHE_ONLY():
+            holidays = [date(2023, 1, 2), date(2023, 1, 7), date(2023, 1, 8), date(2023, 1, 14), date(2023, 1, 15), date(2023, 1, 16)]
+            cal = Calendar(name='TEST_CAL_INDEX', non_working_days=holidays, _replace=True)
+
+            start = date(2022, 12, 25)
+            for n in range(-12, 13):
+                d = start
+                for _ in range(abs(n)):
+                    d = cal.next_bizday(d) if n > 0 else cal.prev_bizday(d)
+                assert cal.advance_bizdays(start, n) == d, n
+
+            end = date(2023, 1, 25)
+            bizdays = [date.fromordinal(o) for o in range(start.toordinal(), end.toordinal() + 1) if cal.is_bizday(date.fromordinal(o))]
+            assert cal.bizdays_between(start, end) == bizdays
+            assert cal.num_bizdays(start, end) == len(bizdays) - 1  # -- end is a business day, not counted
+            assert cal.num_bizdays(end, start) == 1 - len(bizdays)
+            assert cal.bizdays_between(date(2023, 1, 14), date(2023, 1, 16)) == []
+
+    def test_array_variants(self):
+        """is_bizday_array, advance_bizdays_array and roll_array agree with their scalar counterparts."""
+        with CACHE_ONLY():
+            holidays = [
+                date(2023, 1, 2),
+                date(2023, 1, 7),
+                date(2023, 1, 8),
+                date(2023, 1, 28),
+                date(2023, 1, 29),
+                date(2023, 1, 30),
+                date(2023, 1, 31),
+            ]
+            cal = Calendar(name='TEST_CAL_ARRAY', non_working_days=holidays, _replace=True)
+
+            dates = [date.fromordinal(o) for o in range(date(2022, 12, 28).toordinal(), date(2023, 2, 3).toordinal())]
+            arr = np.array(dates, dtype='datetime64[D]')
+
+            assert cal.is_bizday_array(arr).tolist() == [cal.is_bizday(d) for d in dates]
+            for n in (-3, -1, 0, 1, 4):
+                assert cal.advance_bizdays_array(arr, n).tolist() == [cal.advance_bizdays(d, n) for d in dates]
+            for rule in BIZDAY_ROLL_RULE.s_dir.values():
+                assert cal.roll_array(arr, rule).tolist() == [rule(d, cal) for d in dates], rule.name
+
     def test_and(self):
         """Test AND class method."""
         # This would require actual calendar instances
@@ -424,6 +469,41 @@ class TestCalendar:
             assert isinstance(intersection_cal, Calendar)
             assert set(intersection_cal.non_working_days) == us_holidays & uk_holidays
 
+    def test_composite_holidays_cached(self, ts_instance):
+        """Composite calendars reuse materialized holidays until a constituent is saved with a new revision."""
+        with ts_instance:
+            cal_a = Calendar(_replace=True, name='CACHE_A', non_working_days=[date(2025, 1, 1), date(2025, 1, 2)])
+            cal_b = Calendar(_replace=True, name='CACHE_B', non_working_days=[date(2025, 1, 2), date(2025, 1, 3)])
+            assert cal_a.save() and cal_b.save()
+
+            name = CalendarNameParser.operation_repr(Calendar, CalendarNameParser.OR_CHAR, cal_a, cal_b)
+            ordinals = Calendar.holiday_ordinals(name)
+            assert Calendar.holiday_ordinals(name) is ordinals
+            assert BizdayIndex.to_dates(ordinals) == [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
+
+            cal_b.add_non_working_days(date(2025, 1, 6))
+            assert cal_b.save()
+            assert BizdayIndex.to_dates(Calendar.holiday_ordinals(name))[-1] == date(2025, 1, 6)
+
+    def test_holidays_revision_kept_until_saved(self, ts_instance, monkeypatch):
+        """holiday_ordinals() looks the stored calendars up once per revision, not on every call."""
+        with ts_instance:
+            cal = Calendar(_replace=True, name='REVISION_A', non_working_days=[date(2025, 1, 1)])
+            assert cal.save()
+            assert Calendar.holidays_revision('REVISION_A') == (cal.get_revision(), None)
+            ordinals = Calendar.holiday_ordinals('REVISION_A')
+
+            existing_instance = Calendar.existing_instance
+            lookups = []
+            monkeypatch.setattr(Calendar, 'existing_instance', staticmethod(lambda **kwargs: lookups.append(kwargs) or existing_instance(**kwargs)))
+            assert Calendar.holiday_ordinals('REVISION_A') is ordinals
+            assert not lookups
+
+            cal.add_non_working_days(date(2025, 1, 2))
+            assert cal.save()
+            assert Calendar.holidays_revision('REVISION_A') == (cal.get_revision(), None)
+            assert BizdayIndex.to_dates(Calendar.holiday_ordinals('REVISION_A')) == [date(2025, 1, 1), date(2025, 1, 2)]
+
     def test_intersection_alias(self):
         """Test that intersection is an alias for AND."""
         assert Calendar.intersection == Calendar.AND
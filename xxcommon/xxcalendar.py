@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 from collections import deque
 from datetime import date, timedelta
+from typing import Any
 
-from core_10x.global_cache import cache
+import numpy as np
+from core_10x.global_cache import cache, lru_cache
 from core_10x.traitable import RT, NamedTraitable, T, Traitable
 
 
@@ -23,8 +26,13 @@ class CalendarNameParser:
     OP_CHAR     = '\n'
 
     s_ops = {
-        OR_CHAR:    set.update,
-        AND_CHAR:   set.intersection_update
+        OR_CHAR:    lambda sets: set().union(*sets),
+        AND_CHAR:   lambda sets: set.intersection(*sets),
+    }
+
+    s_array_ops = {
+        OR_CHAR:    lambda arrays: functools.reduce(np.union1d, arrays),
+        AND_CHAR:   lambda arrays: functools.reduce(np.intersect1d, arrays),
     }
     # fmt: on
 
@@ -52,21 +60,22 @@ class CalendarNameParser:
 
         return f'{cls.MORE_CHAR.join(sorted(cal_names))}{cls.MORE_CHAR}{op_char}{len(cal_names)}{cls.OP_CHAR}'
 
-    def __init__(self):
-        self.stack = deque()
-        self.non_working_days = set()
-
     @classmethod
-    def parse(cls, calendar_cls, name: str) -> set:
-        parser = cls()
-        non_working_days = parser.non_working_days
-        stack = parser.stack
+    def names(cls, name: str) -> list:
+        """Names of the stored calendars the calendar expression ``name`` refers to."""
+        if cls.OP_CHAR not in name:
+            return [name]
 
+        return [cname for operation_repr in name.split(cls.OP_CHAR) if operation_repr for cname in operation_repr.split(cls.MORE_CHAR)[:-1] if cname]
+
+    @classmethod
+    def evaluate(cls, calendar_cls, name: str, leaf, ops: dict):
+        """Evaluate the calendar expression ``name``: leaf(cal) is a stored calendar's operand, ops[op_char](operands) combines them."""
         operation_repr_list = name.split(cls.OP_CHAR)
         if len(operation_repr_list) == 1:  # -- regular (stored) calendar
-            cal = calendar_cls.existing_instance(name=name)
-            return cal._non_working_days
+            return leaf(calendar_cls.existing_instance(name=name))
 
+        stack = deque()
         for operation_repr in operation_repr_list:
             if not operation_repr:
                 continue
@@ -77,29 +86,87 @@ class CalendarNameParser:
                     if cname:
                         cal = calendar_cls.existing_instance(name=cname)
                         assert cal, f"Unknown calendar '{cname}"
-                        stack.append(cal._non_working_days)
+                        stack.append(leaf(cal))
 
             op_with_num_args = name_list_op_num_args[-1]
             op_char = op_with_num_args[0]
-            op = cls.s_ops.get(op_char)
+            op = ops.get(op_char)
             assert op, f'Unknown op char {op_char}'
             try:
                 num_args = int(op_with_num_args[1:])
             except Exception as e:
                 raise RuntimeError(f'Invalid num_args = {op_with_num_args[1:]}') from e
 
-            for _ in range(num_args):
-                _non_working_days = stack.pop()
-                assert isinstance(_non_working_days, set)
+            stack.append(op([stack.pop() for _ in range(num_args)]))  # -- push the operand of an intermediate calendar
+
+        return stack.pop()
+
+    @classmethod
+    def parse(cls, calendar_cls, name: str) -> set:
+        return cls.evaluate(calendar_cls, name, lambda cal: cal._non_working_days, cls.s_ops)
+
+    @classmethod
+    def parse_ordinals(cls, calendar_cls, name: str) -> np.ndarray:
+        """Same as parse(), as a sorted array of ordinals."""
+        return cls.evaluate(calendar_cls, name, lambda cal: np.unique(BizdayIndex.to_ordinals(cal.non_working_days)), cls.s_array_ops)
+
+
+class BizdayIndex:
+    """
+    Cumulative business day count over the span of a calendar's non-working days (outside of it every day is a business day).
+    rank(o) is the number of business days before ordinal o, counted from the start of the span (negative before it);
+    the business day of rank r is bizday(r).
+    """
 
-                if not non_working_days:
-                    non_working_days.update(_non_working_days)
-                else:
-                    op(non_working_days, _non_working_days)
+    s_epoch_ordinal = date(1970, 1, 1).toordinal()
+
+    def __init__(self, non_working_days):
+        ordinals = np.fromiter((d.toordinal() for d in non_working_days), dtype = np.int32)
+        self.lo  = int(ordinals.min()) if ordinals.size else 0
+        self.end = int(ordinals.max()) + 1 if ordinals.size else 0     #-- first ordinal after the span
+
+        is_bizday = np.ones(self.end - self.lo, dtype = bool)
+        is_bizday[ordinals - self.lo] = False
+        self.cum = np.concatenate(([0], np.cumsum(is_bizday))).astype(np.int32)   #-- cum[k]: business days in [lo, lo + k)
+        self.bizdays = (self.lo + np.flatnonzero(is_bizday)).astype(np.int32)      #-- ordinals of the business days in the span
+        self.num_bizdays = len(self.bizdays)
+
+    def rank(self, o: int) -> int:
+        if o <= self.lo:
+            return o - self.lo
+        if o < self.end:
+            return int(self.cum[o - self.lo])
+        return self.num_bizdays + o - self.end
+
+    def bizday(self, r: int) -> int:
+        if r < 0:
+            return self.lo + r
+        if r < self.num_bizdays:
+            return int(self.bizdays[r])
+        return self.end + r - self.num_bizdays
+
+    def advance(self, o: int, n: int) -> int:
+        return self.bizday(self.rank(o + 1) + n - 1 if n > 0 else self.rank(o) + n)
+
+    def ranks(self, o: np.ndarray) -> np.ndarray:
+        lo, end = self.lo, self.end
+        inside = self.cum[np.clip(o - lo, 0, len(self.cum) - 1)]
+        return np.where(o <= lo, o - lo, np.where(o < end, inside, self.num_bizdays + o - end))
+
+    def bizdays_of(self, r: np.ndarray) -> np.ndarray:
+        nb = self.num_bizdays
+        after = self.end + r - nb
+        if nb:
+            after = np.where(r < nb, self.bizdays[np.clip(r, 0, nb - 1)], after)
+        return np.where(r < 0, self.lo + r, after)
 
-            stack.append(non_working_days)  # -- push set of non_working_days of an intermediate calendar
+    @classmethod
+    def to_dates(cls, ordinals: np.ndarray) -> list:
+        return (ordinals - cls.s_epoch_ordinal).astype('datetime64[D]').tolist()
 
-        return non_working_days
+    @classmethod
+    def to_ordinals(cls, dates) -> np.ndarray:
+        return np.asarray(dates, dtype = 'datetime64[D]').astype(np.int64) + cls.s_epoch_ordinal
 
 
 class CalendarAdjustment(Traitable):
@@ -107,6 +174,10 @@ class CalendarAdjustment(Traitable):
     add_days: list      = T()
     remove_days: list   = T()
 
+    def set_revision(self, revision):
+        super().set_revision(revision)
+        _holidays_revision.clear()  # -- saved or deleted: see Calendar.holidays_revision()
+
 
 #-- TODO: _default_cache = True!
 #class Calendar(Traitable):
@@ -117,6 +188,7 @@ class Calendar(NamedTraitable):
     non_working_days: list  = T()                       // 'Non-Working Days'
 
     _non_working_days: set  = RT()
+    _bizday_index: Any      = RT()
 
     @staticmethod
     @cache
@@ -149,19 +221,55 @@ class Calendar(NamedTraitable):
         return cls(name=calendars[0])
 
     def non_working_days_get(self) -> list:
-        non_working_days = CalendarNameParser.parse(self.__class__, self.name)
-        adjusted_for = self.adjusted_for
-        if adjusted_for:
-            ca = CalendarAdjustment.existing_instance_by_id(_id_value=adjusted_for, _throw=False)
-            if ca:
-                self.add_days(non_working_days, *ca.add_days)
-                self.remove_days(non_working_days, *ca.remove_days)
+        return BizdayIndex.to_dates(self.__class__.holiday_ordinals(self.name, self.adjusted_for))
+
+    def set_revision(self, revision):
+        super().set_revision(revision)
+        _holidays_revision.clear()  # -- saved or deleted: see holidays_revision()
+
+    @classmethod
+    def holidays_revision(cls, name: str, adjusted_for: str = '') -> tuple | None:
+        """
+        Revisions of the stored calendars the calendar expression ``name`` refers to and of the adjustment ``adjusted_for``, if any;
+        None while any of them is unsaved. Kept for the process until a Calendar or CalendarAdjustment is saved or deleted.
+        """
+        return _holidays_revision(cls, name, adjusted_for)
+
+    @classmethod
+    def holiday_ordinals(cls, name: str, adjusted_for: str = '') -> np.ndarray:
+        """
+        Sorted ordinals of the non-working days of the calendar expression ``name`` adjusted for ``adjusted_for``, if any.
+        Cached for the process per holidays_revision() (unsaved calendars and adjustments are never cached).
+        """
+        revision = _holidays_revision(cls, name, adjusted_for)
+        if revision is not None:
+            return _cached_holiday_ordinals(cls, name, adjusted_for, revision)
+
+        ca = CalendarAdjustment.existing_instance_by_id(_id_value=adjusted_for, _throw=False) if adjusted_for else None
+        return cls._holiday_ordinals(name, ca)
 
-        return sorted(non_working_days) if non_working_days else []
+    @classmethod
+    def _holiday_ordinals(cls, name: str, ca: CalendarAdjustment = None) -> np.ndarray:
+        ordinals = CalendarNameParser.parse_ordinals(cls, name)
+        if ca:
+            if not all(type(hd) is date for hd in ca.add_days):
+                raise TypeError('Every day to add must be a date')
+            if not all(type(hd) is date for hd in ca.remove_days):
+                raise TypeError('Every day to remove must be a date')
+            ordinals = np.setdiff1d(np.union1d(ordinals, BizdayIndex.to_ordinals(ca.add_days)), BizdayIndex.to_ordinals(ca.remove_days))
+
+        return ordinals
+
+    @classmethod
+    def clear_holidays_cache(cls):
+        _cached_holiday_ordinals.clear()
 
     def _non_working_days_get(self) -> set:
         return set(self.non_working_days)
 
+    def _bizday_index_get(self) -> BizdayIndex:
+        return BizdayIndex(self._non_working_days)
+
     @classmethod
     def add_days(cls, days: set, *days_to_add) -> bool:
         if not days_to_add:
@@ -221,11 +329,76 @@ class Calendar(NamedTraitable):
         if not biz_days:
             return d
 
-        if biz_days > 0:
-            for _ in range(biz_days):
-                d = self.next_bizday(d)
-        else:
-            for _ in range(-biz_days):
-                d = self.prev_bizday(d)
+        return date.fromordinal(self._bizday_index.advance(d.toordinal(), biz_days))
 
-        return d
+    #-- array variants: dates are NumPy datetime64[D] arrays
+    def _ordinals(self, dates) -> np.ndarray:
+        return np.asarray(dates, dtype = 'datetime64[D]').astype(np.int64) + BizdayIndex.s_epoch_ordinal
+
+    @staticmethod
+    def _datetime64(ordinals: np.ndarray) -> np.ndarray:
+        return (ordinals - BizdayIndex.s_epoch_ordinal).astype('datetime64[D]')
+
+    def is_bizday_array(self, dates) -> np.ndarray:
+        index = self._bizday_index
+        o = self._ordinals(dates)
+        return index.ranks(o + 1) - index.ranks(o) == 1
+
+    def advance_bizdays_array(self, dates, biz_days) -> np.ndarray:
+        """``biz_days`` may be a number or an array of the same shape as ``dates``."""
+        index = self._bizday_index
+        o = self._ordinals(dates)
+        n = np.asarray(biz_days)
+        r = np.where(n > 0, index.ranks(o + 1) + n - 1, index.ranks(o) + n)
+        return self._datetime64(np.where(n == 0, o, index.bizdays_of(r)))
+
+    def roll_array(self, dates, roll_rule) -> np.ndarray:
+        """Same as ``roll_rule(d, self)`` for each of ``dates``; ``roll_rule`` is a BIZDAY_ROLL_RULE."""
+        index = self._bizday_index
+        o = self._ordinals(dates)
+        rule = roll_rule.name
+        if rule == 'NO_ROLL':
+            return self._datetime64(o)
+
+        following = index.bizdays_of(index.ranks(o))        #-- first business day on or after
+        preceding = index.bizdays_of(index.ranks(o + 1) - 1)  #-- last business day on or before
+        if rule == 'FOLLOWING':
+            return self._datetime64(following)
+        if rule == 'PRECEDING':
+            return self._datetime64(preceding)
+
+        month = self._datetime64(o).astype('datetime64[M]')
+        if rule == 'MOD_FOLLOWING':
+            return self._datetime64(np.where(self._datetime64(following).astype('datetime64[M]') == month, following, preceding))
+        if rule == 'MOD_PRECEDING':
+            return self._datetime64(np.where(self._datetime64(preceding).astype('datetime64[M]') == month, preceding, following))
+
+        return np.array([roll_rule(d, self) for d in self._datetime64(o).tolist()], dtype = 'datetime64[D]')
+
+    def num_bizdays(self, start: date, end: date) -> int:
+        """Number of business days d such that start <= d < end (negative if end < start)."""
+        index = self._bizday_index
+        return index.rank(end.toordinal()) - index.rank(start.toordinal())
+
+    def bizdays_between(self, start: date, end: date) -> list:
+        """Business days d such that start <= d <= end."""
+        index = self._bizday_index
+        ranks = np.arange(index.rank(start.toordinal()), index.rank(end.toordinal() + 1))
+        return index.to_dates(index.bizdays_of(ranks))
+
+
+@cache
+def _holidays_revision(calendar_cls, name: str, adjusted_for: str) -> tuple | None:
+    revisions = tuple(cal.get_revision() if (cal := calendar_cls.existing_instance(name=cname, _throw=False)) else 0 for cname in CalendarNameParser.names(name))
+    ca = CalendarAdjustment.existing_instance_by_id(_id_value=adjusted_for, _throw=False) if adjusted_for else None
+    ca_revision = ca.get_revision() if ca else None
+    return (*revisions, ca_revision) if all(revisions) and ca_revision != 0 else None
+
+
+#-- the holidays of the calendars in use, for their current revisions
+@lru_cache(maxsize = 256)
+def _cached_holiday_ordinals(calendar_cls, name: str, adjusted_for: str, revision: tuple) -> np.ndarray:
+    ca = CalendarAdjustment.existing_instance_by_id(_id_value=adjusted_for, _throw=False) if adjusted_for else None
+    ordinals = calendar_cls._holiday_ordinals(name, ca)
+    ordinals.flags.writeable = False  # -- shared by every calendar with this key
+    return ordinals